@@ -438,6 +438,14 @@ class BaseCallbackHandler(
     run_inline: bool = False
     """Whether to run the callback inline."""
 
+    run_in_background: bool = False
+    """Whether async callbacks invoked from sync code may be delivered in the
+    background, without blocking the caller.
+
+    Events are still delivered to the handler in the order they were emitted.
+    Errors raised by background deliveries are logged, never raised.
+    """
+
     @property
     def ignore_llm(self) -> bool:
         """Whether to ignore LLM callbacks."""
@@ -885,6 +893,11 @@ class AsyncCallbackHandler(BaseCallbackHandler):
 class BaseCallbackManager(CallbackManagerMixin):
     """Base callback manager for LangChain."""
 
+    # Set on the managers of a run tree whose root found no handlers or tracers,
+    # to the context it resolved them from, so that configuring its child runs
+    # can skip resolving them again while that context is unchanged.
+    _without_handlers: tuple[Any, ...] | None = None
+
     def __init__(
         self,
         handlers: list[BaseCallbackHandler],
@@ -919,7 +932,7 @@ class BaseCallbackManager(CallbackManagerMixin):
 
     def copy(self) -> Self:
         """Return a copy of the callback manager."""
-        return self.__class__(
+        manager = self.__class__(
             handlers=self.handlers.copy(),
             inheritable_handlers=self.inheritable_handlers.copy(),
             parent_run_id=self.parent_run_id,
@@ -928,6 +941,8 @@ class BaseCallbackManager(CallbackManagerMixin):
             metadata=self.metadata.copy(),
             inheritable_metadata=self.inheritable_metadata.copy(),
         )
+        manager._without_handlers = self._without_handlers  # noqa: SLF001
+        return manager
 
     def merge(self, other: BaseCallbackManager) -> Self:
         """Merge the callback manager with another callback manager.
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import concurrent.futures
 import functools
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
-from contextvars import copy_context
+from contextvars import Context, copy_context
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 from uuid import UUID
 
@@ -272,7 +275,7 @@ def handle_event(
         **kwargs: The keyword arguments to pass to the event handler
 
     """
-    coros: list[Coroutine[Any, Any, Any]] = []
+    coros: list[tuple[BaseCallbackHandler, Coroutine[Any, Any, Any]]] = []
 
     try:
         message_strings: list[str] | None = None
@@ -283,7 +286,7 @@ def handle_event(
                 ):
                     event = getattr(handler, event_name)(*args, **kwargs)
                     if asyncio.iscoroutine(event):
-                        coros.append(event)
+                        coros.append((handler, event))
             except NotImplementedError as e:
                 if event_name == "on_chat_model_start":
                     if message_strings is None:
@@ -318,23 +321,41 @@ def handle_event(
         if coros:
             try:
                 # Raises RuntimeError if there is no current event loop.
-                asyncio.get_running_loop()
-                loop_running = True
+                running_loop: asyncio.AbstractEventLoop | None = (
+                    asyncio.get_running_loop()
+                )
             except RuntimeError:
-                loop_running = False
-
-            if loop_running:
-                # If we try to submit this coroutine to the running loop
-                # we end up in a deadlock, as we'd have gotten here from a
-                # running coroutine, which we cannot interrupt to run this one.
-                # The solution is to run the synchronous function on the globally shared
-                # thread pool executor to avoid blocking the main event loop.
+                running_loop = None
+
+            callback_loop = _callback_loop()
+            if running_loop is not None and callback_loop.owns(running_loop):
+                # We got here from a coroutine already running on the callback
+                # loop, so waiting on that loop would deadlock. Fall back to
+                # running the coroutines on a fresh loop in a worker thread.
                 _executor().submit(
-                    cast("Callable", copy_context().run), _run_coros, coros
+                    cast("Callable", copy_context().run),
+                    _run_coros,
+                    [coro for _, coro in coros],
                 ).result()
             else:
-                # If there's no running loop, we can run the coroutines directly.
-                _run_coros(coros)
+                # Whether or not a loop is running in this thread, we schedule
+                # the coroutines on the long-lived callback loop instead of
+                # creating a new event loop for every event. We cannot submit
+                # them to a running loop in this thread, as we'd have gotten
+                # here from a running coroutine, which we cannot interrupt.
+                context = copy_context()
+                futures = [
+                    callback_loop.submit(
+                        handler,
+                        coro,
+                        context,
+                        wait=not handler.run_in_background,
+                    )
+                    for handler, coro in coros
+                ]
+                concurrent.futures.wait(
+                    [future for future in futures if future is not None]
+                )
 
 
 def _run_coros(coros: list[Coroutine[Any, Any, Any]]) -> None:
@@ -461,6 +482,9 @@ async def ahandle_event(
 class BaseRunManager(RunManagerMixin):
     """Base class for run manager (a bound callback manager)."""
 
+    # See `BaseCallbackManager._without_handlers`.
+    _without_handlers: tuple[Any, ...] | None = None
+
     def __init__(
         self,
         *,
@@ -586,6 +610,7 @@ class ParentRunManager(RunManager):
         manager.add_metadata(self.inheritable_metadata)
         if tag is not None:
             manager.add_tags([tag], inherit=False)
+        manager._without_handlers = self._without_handlers  # noqa: SLF001
         return manager
 
 
@@ -670,6 +695,7 @@ class AsyncParentRunManager(AsyncRunManager):
         manager.add_metadata(self.inheritable_metadata)
         if tag is not None:
             manager.add_tags([tag], inherit=False)
+        manager._without_handlers = self._without_handlers  # noqa: SLF001
         return manager
 
 
@@ -1434,20 +1460,21 @@ class CallbackManager(BaseCallbackManager):
         """
         if run_id is None:
             run_id = uuid7()
-        handle_event(
-            self.handlers,
-            "on_chain_start",
-            "ignore_chain",
-            serialized,
-            inputs,
-            run_id=run_id,
-            parent_run_id=self.parent_run_id,
-            tags=self.tags,
-            metadata=self.metadata,
-            **kwargs,
-        )
+        if self.handlers:
+            handle_event(
+                self.handlers,
+                "on_chain_start",
+                "ignore_chain",
+                serialized,
+                inputs,
+                run_id=run_id,
+                parent_run_id=self.parent_run_id,
+                tags=self.tags,
+                metadata=self.metadata,
+                **kwargs,
+            )
 
-        return CallbackManagerForChainRun(
+        run_manager = CallbackManagerForChainRun(
             run_id=run_id,
             handlers=self.handlers,
             inheritable_handlers=self.inheritable_handlers,
@@ -1457,6 +1484,8 @@ class CallbackManager(BaseCallbackManager):
             metadata=self.metadata,
             inheritable_metadata=self.inheritable_metadata,
         )
+        run_manager._without_handlers = self._without_handlers  # noqa: SLF001
+        return run_manager
 
     @override
     def on_tool_start(
@@ -1964,20 +1993,21 @@ class AsyncCallbackManager(BaseCallbackManager):
         if run_id is None:
             run_id = uuid7()
 
-        await ahandle_event(
-            self.handlers,
-            "on_chain_start",
-            "ignore_chain",
-            serialized,
-            inputs,
-            run_id=run_id,
-            parent_run_id=self.parent_run_id,
-            tags=self.tags,
-            metadata=self.metadata,
-            **kwargs,
-        )
+        if self.handlers:
+            await ahandle_event(
+                self.handlers,
+                "on_chain_start",
+                "ignore_chain",
+                serialized,
+                inputs,
+                run_id=run_id,
+                parent_run_id=self.parent_run_id,
+                tags=self.tags,
+                metadata=self.metadata,
+                **kwargs,
+            )
 
-        return AsyncCallbackManagerForChainRun(
+        run_manager = AsyncCallbackManagerForChainRun(
             run_id=run_id,
             handlers=self.handlers,
             inheritable_handlers=self.inheritable_handlers,
@@ -1987,6 +2017,8 @@ class AsyncCallbackManager(BaseCallbackManager):
             metadata=self.metadata,
             inheritable_metadata=self.inheritable_metadata,
         )
+        run_manager._without_handlers = self._without_handlers  # noqa: SLF001
+        return run_manager
 
     @override
     async def on_tool_start(
@@ -2328,6 +2360,34 @@ def _configure(
     Returns:
         The configured callback manager.
     """
+    if (
+        isinstance(inheritable_callbacks, BaseCallbackManager)
+        and inheritable_callbacks._without_handlers is not None  # noqa: SLF001
+        and not inheritable_callbacks.handlers
+        and not local_callbacks
+        and not verbose
+        and inheritable_callbacks._without_handlers == _configure_context()  # noqa: SLF001
+    ):
+        # The root of this run tree found no handlers or tracers to enable, and
+        # no tracing context or configure hook was entered since, so only the
+        # tags and metadata need to be inherited.
+        callback_manager = callback_manager_cls(
+            handlers=[],
+            parent_run_id=inheritable_callbacks.parent_run_id,
+            tags=inheritable_callbacks.tags.copy(),
+            inheritable_tags=inheritable_callbacks.inheritable_tags.copy(),
+            metadata=inheritable_callbacks.metadata.copy(),
+            inheritable_metadata=inheritable_callbacks.inheritable_metadata.copy(),
+        )
+        if inheritable_tags or local_tags:
+            callback_manager.add_tags(inheritable_tags or [])
+            callback_manager.add_tags(local_tags or [], inherit=False)
+        if inheritable_metadata or local_metadata:
+            callback_manager.add_metadata(inheritable_metadata or {})
+            callback_manager.add_metadata(local_metadata or {}, inherit=False)
+        callback_manager._without_handlers = inheritable_callbacks._without_handlers  # noqa: SLF001
+        return callback_manager
+
     tracing_context = get_tracing_context()
     tracing_metadata = tracing_context["metadata"]
     tracing_tags = tracing_context["tags"]
@@ -2472,9 +2532,20 @@ def _configure(
                 for handler in callback_manager.handlers
             ):
                 callback_manager.add_handler(var_handler, inheritable)
+    if not callback_manager.handlers and not callback_manager.inheritable_handlers:
+        callback_manager._without_handlers = _configure_context()  # noqa: SLF001
     return callback_manager
 
 
+def _configure_context() -> tuple[Any, ...]:
+    """Get the context that `_configure` resolves handlers from, besides env vars."""
+    return (
+        _get_debug(),
+        get_tracing_context(),
+        *(var.get() for var, _, _, _ in _configure_hooks),
+    )
+
+
 async def adispatch_custom_event(
     name: str, data: Any, *, config: RunnableConfig | None = None
 ) -> None:
@@ -2682,3 +2753,170 @@ def _executor() -> ThreadPoolExecutor:
     cutie = ThreadPoolExecutor(max_workers=10)
     atexit.register(cutie.shutdown, wait=True)
     return cutie
+
+
+_CANCEL_TIMEOUT = 1.0
+"""Seconds to wait for cancelled callbacks when the callback loop shuts down."""
+
+
+class _CallbackLoop:
+    """A long-lived event loop, running in a daemon thread, for async callbacks.
+
+    Async handlers invoked from sync code are scheduled on this loop rather than
+    on a new event loop per event. Events for the same handler are delivered in
+    the order they were emitted, and the number of events delivered in the
+    background (see `BaseCallbackHandler.run_in_background`) that may be pending
+    at once is bounded; once the bound is reached, emitting blocks until some
+    of them have been delivered.
+
+    The loop is shared by all threads of the process. Handlers of different
+    threads still run concurrently while they await, but a handler that blocks
+    the loop, e.g. with `time.sleep` or CPU-bound work, delays the async
+    callbacks of every thread until it returns.
+    """
+
+    def __init__(self, max_pending: int = 1000) -> None:
+        """Start the loop thread.
+
+        Args:
+            max_pending: Maximum number of background deliveries that may be
+                pending at once.
+        """
+        self._loop = asyncio.new_event_loop()
+        # Last delivery scheduled per handler; only touched from the loop thread.
+        self._tails: dict[int, asyncio.Future[None]] = {}
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._thread = threading.Thread(
+            target=self._run, name="langchain-callbacks", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def owns(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Whether `loop` is the callback loop."""
+        return loop is self._loop
+
+    def submit(
+        self,
+        handler: BaseCallbackHandler,
+        coro: Coroutine[Any, Any, Any],
+        context: Context,
+        *,
+        wait: bool = True,
+    ) -> concurrent.futures.Future[None] | None:
+        """Schedule a callback coroutine on the loop.
+
+        Args:
+            handler: The handler the coroutine belongs to.
+            coro: The coroutine to run.
+            context: The context to run the coroutine in.
+            wait: Whether the caller will wait for the delivery. If `False`,
+                the delivery counts towards the bound on pending deliveries.
+
+        Returns:
+            A future resolved once the coroutine has finished, or `None` if
+            `wait` is `False`.
+        """
+        future: concurrent.futures.Future[None] | None = None
+        if wait:
+            future = concurrent.futures.Future()
+        else:
+            self._pending.acquire()
+        self._loop.call_soon_threadsafe(
+            self._schedule, id(handler), coro, context, future
+        )
+        return future
+
+    def _schedule(
+        self,
+        key: int,
+        coro: Coroutine[Any, Any, Any],
+        context: Context,
+        future: concurrent.futures.Future[None] | None,
+    ) -> None:
+        # Creating the task inside `context` makes it run with a copy of the
+        # caller's context variables.
+        task = context.run(
+            self._loop.create_task, self._deliver(self._tails.get(key), coro)
+        )
+        self._tails[key] = task
+        task.add_done_callback(functools.partial(self._done, key, future))
+
+    @staticmethod
+    async def _deliver(
+        previous: asyncio.Future[None] | None, coro: Coroutine[Any, Any, Any]
+    ) -> None:
+        if previous is not None:
+            # Wait for the previous event for the same handler to be delivered.
+            await asyncio.wait([previous])
+        try:
+            await coro
+        except Exception as e:
+            logger.warning("Error in callback coroutine: %s", repr(e))
+
+    def _done(
+        self,
+        key: int,
+        future: concurrent.futures.Future[None] | None,
+        task: asyncio.Future[None],
+    ) -> None:
+        if self._tails.get(key) is task:
+            del self._tails[key]
+        if future is None:
+            self._pending.release()
+        else:
+            future.set_result(None)
+
+    async def _drain(self, timeout: float | None) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        current = asyncio.current_task()
+        while pending := asyncio.all_tasks() - {current}:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                logger.warning(
+                    "Cancelling %d async callbacks still pending at shutdown.",
+                    len(pending),
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.wait(pending, timeout=_CANCEL_TIMEOUT)
+                return
+            await asyncio.wait(pending, timeout=remaining)
+
+    def shutdown(self, timeout: float | None = 5.0) -> None:
+        """Wait for pending deliveries and tasks, then stop the loop thread.
+
+        Args:
+            timeout: Seconds to wait for pending deliveries and tasks before they
+                are cancelled. If `None`, wait for all of them to finish.
+        """
+        if self._thread.is_alive():
+            drained = asyncio.run_coroutine_threadsafe(self._drain(timeout), self._loop)
+            # Also bounded if a handler blocks the loop, so it can't hang exit.
+            limit = None if timeout is None else timeout + 2 * _CANCEL_TIMEOUT
+            try:
+                drained.result(limit)
+            except concurrent.futures.TimeoutError:
+                logger.warning("Async callbacks did not finish at shutdown.")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(None if timeout is None else _CANCEL_TIMEOUT)
+        if not self._thread.is_alive():
+            self._loop.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _callback_loop() -> _CallbackLoop:
+    # Lazily started on the first async callback invoked from sync code and
+    # shared for the lifetime of the process.
+    callback_loop = _CallbackLoop()
+    atexit.register(callback_loop.shutdown)
+    return callback_loop
+
+
+if hasattr(os, "register_at_fork"):
+    # The loop thread does not survive a fork, so a child process starts its own.
+    os.register_at_fork(after_in_child=_callback_loop.cache_clear)
@@ -10,7 +10,12 @@ from typing import TYPE_CHECKING
 from langchain_core._import_utils import import_attr
 
 if TYPE_CHECKING:
-    from langchain_core.indexing.api import IndexingResult, aindex, index
+    from langchain_core.indexing.api import (
+        IndexingResult,
+        IndexingStageStats,
+        aindex,
+        index,
+    )
     from langchain_core.indexing.base import (
         DeleteResponse,
         DocumentIndex,
@@ -24,6 +29,7 @@ __all__ = (
     "DocumentIndex",
     "InMemoryRecordManager",
     "IndexingResult",
+    "IndexingStageStats",
     "RecordManager",
     "UpsertResponse",
     "aindex",
@@ -34,6 +40,7 @@ _dynamic_imports = {
     "aindex": "api",
     "index": "api",
     "IndexingResult": "api",
+    "IndexingStageStats": "api",
     "DeleteResponse": "base",
     "DocumentIndex": "base",
     "InMemoryRecordManager": "base",
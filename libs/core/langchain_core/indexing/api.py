@@ -2,24 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import time
 import uuid
 import warnings
+from collections import Counter, deque
 from itertools import islice
 from typing import (
     TYPE_CHECKING,
     Any,
     Literal,
-    TypedDict,
+    NamedTuple,
     TypeVar,
     cast,
 )
 
+from typing_extensions import NotRequired, TypedDict
+
 from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 from langchain_core.exceptions import LangChainException
 from langchain_core.indexing.base import DocumentIndex, RecordManager
+from langchain_core.runnables.config import ContextThreadPoolExecutor
 from langchain_core.vectorstores import VectorStore
 
 if TYPE_CHECKING:
@@ -31,6 +37,7 @@ if TYPE_CHECKING:
         Iterator,
         Sequence,
     )
+    from concurrent.futures import Future
 
 # Magic UUID to use as a namespace for hashing.
 # Used to try and generate a unique UUID for each document
@@ -274,6 +281,311 @@ class IndexingResult(TypedDict):
     """Number of deleted documents."""
     num_skipped: int
     """Number of skipped documents because they were already up to date."""
+    stages: NotRequired[dict[str, IndexingStageStats]]
+    """Work done by each stage, keyed by stage name.
+
+    Only reported when indexing with `max_concurrency`. The stages are `'hash'`,
+    `'exists'`, `'write'`, `'update'` and `'cleanup'`.
+    """
+
+
+class IndexingStageStats(TypedDict):
+    """Work done by one stage of a pipelined indexing run."""
+
+    num_docs: int
+    """Number of documents that went through the stage."""
+    seconds: float
+    """Time spent in the stage, summed over all batches.
+
+    Batches overlap, so the sum over stages can exceed the wall-clock time of
+    the run. `num_docs / seconds` is the throughput of the stage.
+    """
+
+
+class _HashedBatch(NamedTuple):
+    """A batch of documents after the hashing stage."""
+
+    docs: list[Document]
+    ids: list[str]
+    source_ids: Sequence[str | None]
+    in_flight: set[str]
+    """Ids also present in earlier batches that have not been recorded yet."""
+
+
+class _WrittenBatch(NamedTuple):
+    """A batch of documents after the exists and write stages."""
+
+    batch: _HashedBatch
+    num_written: int
+    num_updated: int
+    num_skipped: int
+    exists_seconds: float
+    write_seconds: float
+
+
+class _IndexingPipeline:
+    """Shared state of a pipelined `index` or `aindex` run.
+
+    Hashing, recording and cleanup run in order on the calling thread (or task),
+    while the existence checks and vector store writes of up to
+    `max_concurrency` batches run concurrently. Ids of batches that have been
+    hashed but not yet recorded are tracked, so that:
+
+    * a later batch treats documents of an earlier, in-flight batch as existing,
+      exactly as it would after the earlier batch was recorded;
+    * incremental cleanup never deletes documents that an in-flight batch has
+      already found to exist and will refresh. Groups whose cleanup stopped on
+      a page of such documents are cleaned up again once the pipeline drains.
+    """
+
+    def __init__(
+        self,
+        record_manager: RecordManager,
+        destination: VectorStore | DocumentIndex,
+        *,
+        batch_size: int,
+        cleanup: Literal["incremental", "full", "scoped_full"] | None,
+        source_id_assigner: Callable[[Document], str | None],
+        cleanup_batch_size: int,
+        force_update: bool,
+        key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
+        | Callable[[Document], str],
+        upsert_kwargs: dict[str, Any] | None,
+        index_start_dt: float,
+    ) -> None:
+        self.record_manager = record_manager
+        self.destination = destination
+        self.batch_size = batch_size
+        self.cleanup = cleanup
+        self.source_id_assigner = source_id_assigner
+        self.cleanup_batch_size = cleanup_batch_size
+        self.force_update = force_update
+        self.key_encoder = key_encoder
+        self.upsert_kwargs = upsert_kwargs or {}
+        self.index_start_dt = index_start_dt
+        self.scoped_full_cleanup_source_ids: set[str] = set()
+        self.num_added = 0
+        self.num_updated = 0
+        self.num_skipped = 0
+        self.num_deleted = 0
+        self.stages: dict[str, IndexingStageStats] = {
+            stage: {"num_docs": 0, "seconds": 0.0}
+            for stage in ("hash", "exists", "write", "update", "cleanup")
+        }
+        self._pending: Counter[str] = Counter()
+        self._deferred_group_ids: set[str] = set()
+
+    def _track(self, stage: str, num_docs: int, seconds: float) -> None:
+        self.stages[stage]["num_docs"] += num_docs
+        self.stages[stage]["seconds"] += seconds
+
+    def hash_batch(self, doc_batch: list[Document]) -> _HashedBatch:
+        """Hash and deduplicate a batch, and assign its source ids."""
+        start = time.perf_counter()
+        hashed_docs = list(
+            _deduplicate_in_order(
+                [
+                    _get_document_with_hash(doc, key_encoder=self.key_encoder)
+                    for doc in doc_batch
+                ]
+            )
+        )
+        self.num_skipped += len(doc_batch) - len(hashed_docs)
+
+        source_ids = [self.source_id_assigner(doc) for doc in hashed_docs]
+        if self.cleanup in {"incremental", "scoped_full"}:
+            for source_id, hashed_doc in zip(source_ids, hashed_docs, strict=False):
+                if source_id is None:
+                    msg = (
+                        f"Source IDs are required when cleanup mode is "
+                        f"incremental or scoped_full. "
+                        f"Document that starts with "
+                        f"content: {hashed_doc.page_content[:100]} "
+                        f"was not assigned as source id."
+                    )
+                    raise ValueError(msg)
+                if self.cleanup == "scoped_full":
+                    self.scoped_full_cleanup_source_ids.add(source_id)
+
+        ids = [cast("str", doc.id) for doc in hashed_docs]
+        in_flight = {id_ for id_ in ids if self._pending[id_]}
+        self._pending.update(ids)
+        self._track("hash", len(doc_batch), time.perf_counter() - start)
+        return _HashedBatch(hashed_docs, ids, source_ids, in_flight)
+
+    def _split(
+        self, batch: _HashedBatch, exists_batch: list[bool]
+    ) -> tuple[list[Document], set[str], int]:
+        """Select the documents to write, as in the sequential implementation."""
+        docs_to_index = []
+        seen_docs: set[str] = set()
+        num_skipped = 0
+        for hashed_doc, hashed_id, doc_exists in zip(
+            batch.docs, batch.ids, exists_batch, strict=False
+        ):
+            if doc_exists or hashed_id in batch.in_flight:
+                if not self.force_update:
+                    num_skipped += 1
+                    continue
+                seen_docs.add(hashed_id)
+            docs_to_index.append(hashed_doc)
+        return docs_to_index, seen_docs, num_skipped
+
+    def write_batch(self, batch: _HashedBatch) -> _WrittenBatch:
+        """Check which documents exist and write the others to the destination."""
+        start = time.perf_counter()
+        exists_batch = self.record_manager.exists(batch.ids)
+        checked = time.perf_counter()
+        docs_to_index, seen_docs, num_skipped = self._split(batch, exists_batch)
+        if docs_to_index:
+            if isinstance(self.destination, VectorStore):
+                self.destination.add_documents(
+                    docs_to_index,
+                    ids=[cast("str", doc.id) for doc in docs_to_index],
+                    batch_size=self.batch_size,
+                    **self.upsert_kwargs,
+                )
+            else:
+                self.destination.upsert(docs_to_index, **self.upsert_kwargs)
+        return _WrittenBatch(
+            batch,
+            len(docs_to_index),
+            len(seen_docs),
+            num_skipped,
+            checked - start,
+            time.perf_counter() - checked,
+        )
+
+    async def awrite_batch(self, batch: _HashedBatch) -> _WrittenBatch:
+        """Check which documents exist and write the others to the destination."""
+        start = time.perf_counter()
+        exists_batch = await self.record_manager.aexists(batch.ids)
+        checked = time.perf_counter()
+        docs_to_index, seen_docs, num_skipped = self._split(batch, exists_batch)
+        if docs_to_index:
+            if isinstance(self.destination, VectorStore):
+                await self.destination.aadd_documents(
+                    docs_to_index,
+                    ids=[cast("str", doc.id) for doc in docs_to_index],
+                    batch_size=self.batch_size,
+                    **self.upsert_kwargs,
+                )
+            else:
+                await self.destination.aupsert(docs_to_index, **self.upsert_kwargs)
+        return _WrittenBatch(
+            batch,
+            len(docs_to_index),
+            len(seen_docs),
+            num_skipped,
+            checked - start,
+            time.perf_counter() - checked,
+        )
+
+    def _count(self, written: _WrittenBatch) -> None:
+        num_docs = len(written.batch.ids)
+        self.num_added += written.num_written - written.num_updated
+        self.num_updated += written.num_updated
+        self.num_skipped += written.num_skipped
+        self._track("exists", num_docs, written.exists_seconds)
+        self._track("write", written.num_written, written.write_seconds)
+
+    def _release(self, batch: _HashedBatch) -> None:
+        self._pending.subtract(batch.ids)
+        for id_ in batch.ids:
+            if not self._pending[id_]:
+                del self._pending[id_]
+
+    def _filter_deletable(self, uids: list[str]) -> list[str]:
+        # Documents of in-flight batches are refreshed once those are recorded.
+        return [uid for uid in uids if not self._pending[uid]]
+
+    def record_batch(self, written: _WrittenBatch) -> None:
+        """Refresh the records of a batch, then run incremental cleanup."""
+        self._count(written)
+        batch = written.batch
+        start = time.perf_counter()
+        self.record_manager.update(
+            batch.ids, group_ids=batch.source_ids, time_at_least=self.index_start_dt
+        )
+        self._release(batch)
+        self._track("update", len(batch.ids), time.perf_counter() - start)
+        if self.cleanup == "incremental":
+            self.delete_stale(cast("Sequence[str]", batch.source_ids))
+
+    async def arecord_batch(self, written: _WrittenBatch) -> None:
+        """Refresh the records of a batch, then run incremental cleanup."""
+        self._count(written)
+        batch = written.batch
+        start = time.perf_counter()
+        await self.record_manager.aupdate(
+            batch.ids, group_ids=batch.source_ids, time_at_least=self.index_start_dt
+        )
+        self._release(batch)
+        self._track("update", len(batch.ids), time.perf_counter() - start)
+        if self.cleanup == "incremental":
+            await self.adelete_stale(cast("Sequence[str]", batch.source_ids))
+
+    def _defer(self, group_ids: Sequence[str] | None) -> None:
+        if group_ids is not None:
+            self._deferred_group_ids.update(group_ids)
+
+    def delete_stale(self, group_ids: Sequence[str] | None) -> None:
+        """Delete documents of `group_ids` not refreshed during this run."""
+        start = time.perf_counter()
+        num_deleted = 0
+        while uids := self.record_manager.list_keys(
+            group_ids=group_ids,
+            before=self.index_start_dt,
+            limit=self.cleanup_batch_size,
+        ):
+            if not (uids_to_delete := self._filter_deletable(uids)):
+                # `list_keys` can't page past in-flight documents: retry later.
+                self._defer(group_ids)
+                break
+            _delete(self.destination, uids_to_delete)
+            self.record_manager.delete_keys(uids_to_delete)
+            num_deleted += len(uids_to_delete)
+        self.num_deleted += num_deleted
+        self._track("cleanup", num_deleted, time.perf_counter() - start)
+
+    async def adelete_stale(self, group_ids: Sequence[str] | None) -> None:
+        """Delete documents of `group_ids` not refreshed during this run."""
+        start = time.perf_counter()
+        num_deleted = 0
+        while uids := await self.record_manager.alist_keys(
+            group_ids=group_ids,
+            before=self.index_start_dt,
+            limit=self.cleanup_batch_size,
+        ):
+            if not (uids_to_delete := self._filter_deletable(uids)):
+                # `list_keys` can't page past in-flight documents: retry later.
+                self._defer(group_ids)
+                break
+            await _adelete(self.destination, uids_to_delete)
+            await self.record_manager.adelete_keys(uids_to_delete)
+            num_deleted += len(uids_to_delete)
+        self.num_deleted += num_deleted
+        self._track("cleanup", num_deleted, time.perf_counter() - start)
+
+    def full_cleanup_group_ids(self) -> tuple[bool, Sequence[str] | None]:
+        """Whether to run a final cleanup, and for which group ids."""
+        if self.cleanup == "full":
+            return True, None
+        if self.cleanup == "scoped_full" and self.scoped_full_cleanup_source_ids:
+            return True, list(self.scoped_full_cleanup_source_ids)
+        if self.cleanup == "incremental" and self._deferred_group_ids:
+            return True, sorted(self._deferred_group_ids)
+        return False, None
+
+    def result(self) -> IndexingResult:
+        """Build the result of the run."""
+        return {
+            "num_added": self.num_added,
+            "num_updated": self.num_updated,
+            "num_skipped": self.num_skipped,
+            "num_deleted": self.num_deleted,
+            "stages": self.stages,
+        }
 
 
 def index(
@@ -289,6 +601,7 @@ def index(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> IndexingResult:
     """Index data from the loader into the vector store.
 
@@ -371,6 +684,16 @@ def index(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: If set, index in pipelined mode: hashing, existence
+            checks, vector store writes and record updates of different batches
+            overlap, with at most `max_concurrency` batches checked and written
+            concurrently. The end state of the index is the same as when
+            indexing batch by batch, and the result additionally reports the
+            work done by each stage under `'stages'`.
+            The ids of documents in batches that are in flight are kept in
+            memory.
+
+            !!! version-added "Added in `langchain-core` 1.2.1"
 
     Returns:
         Indexing result which contains information about how many documents
@@ -404,6 +727,10 @@ def index(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None and max_concurrency < 1:
+        msg = f"max_concurrency should be a positive integer. Got {max_concurrency}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -444,6 +771,38 @@ def index(
 
     # Mark when the update started.
     index_start_dt = record_manager.get_time()
+
+    if max_concurrency is not None:
+        pipeline = _IndexingPipeline(
+            record_manager,
+            destination,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_assigner=source_id_assigner,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            key_encoder=key_encoder,
+            upsert_kwargs=upsert_kwargs,
+            index_start_dt=index_start_dt,
+        )
+        in_flight: deque[Future[_WrittenBatch]] = deque()
+        with ContextThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            for doc_batch in _batch(batch_size, doc_iterator):
+                in_flight.append(
+                    executor.submit(
+                        pipeline.write_batch, pipeline.hash_batch(doc_batch)
+                    )
+                )
+                # Keep one batch queued so that the workers never wait on hashing.
+                if len(in_flight) > max_concurrency:
+                    pipeline.record_batch(in_flight.popleft().result())
+            while in_flight:
+                pipeline.record_batch(in_flight.popleft().result())
+        run_cleanup, group_ids = pipeline.full_cleanup_group_ids()
+        if run_cleanup:
+            pipeline.delete_stale(group_ids)
+        return pipeline.result()
+
     num_added = 0
     num_skipped = 0
     num_updated = 0
@@ -628,6 +987,7 @@ async def aindex(
     key_encoder: Literal["sha1", "sha256", "sha512", "blake2b"]
     | Callable[[Document], str] = "sha1",
     upsert_kwargs: dict[str, Any] | None = None,
+    max_concurrency: int | None = None,
 ) -> IndexingResult:
     """Async index data from the loader into the vector store.
 
@@ -710,6 +1070,16 @@ async def aindex(
             For example, you can use this to specify a custom vector_field:
             upsert_kwargs={"vector_field": "embedding"}
             !!! version-added "Added in `langchain-core` 0.3.10"
+        max_concurrency: If set, index in pipelined mode: hashing, existence
+            checks, vector store writes and record updates of different batches
+            overlap, with at most `max_concurrency` batches checked and written
+            concurrently. The end state of the index is the same as when
+            indexing batch by batch, and the result additionally reports the
+            work done by each stage under `'stages'`.
+            The ids of documents in batches that are in flight are kept in
+            memory.
+
+            !!! version-added "Added in `langchain-core` 1.2.1"
 
     Returns:
         Indexing result which contains information about how many documents
@@ -743,6 +1113,10 @@ async def aindex(
         )
         raise ValueError(msg)
 
+    if max_concurrency is not None and max_concurrency < 1:
+        msg = f"max_concurrency should be a positive integer. Got {max_concurrency}."
+        raise ValueError(msg)
+
     destination = vector_store  # Renaming internally for clarity
 
     # If it's a vectorstore, let's check if it has the required methods.
@@ -794,6 +1168,45 @@ async def aindex(
 
     # Mark when the update started.
     index_start_dt = await record_manager.aget_time()
+
+    if max_concurrency is not None:
+        pipeline = _IndexingPipeline(
+            record_manager,
+            destination,
+            batch_size=batch_size,
+            cleanup=cleanup,
+            source_id_assigner=source_id_assigner,
+            cleanup_batch_size=cleanup_batch_size,
+            force_update=force_update,
+            key_encoder=key_encoder,
+            upsert_kwargs=upsert_kwargs,
+            index_start_dt=index_start_dt,
+        )
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def awrite_batch(batch: _HashedBatch) -> _WrittenBatch:
+            async with semaphore:
+                return await pipeline.awrite_batch(batch)
+
+        tasks: deque[asyncio.Task[_WrittenBatch]] = deque()
+        try:
+            async for doc_batch in _abatch(batch_size, async_doc_iterator):
+                tasks.append(
+                    asyncio.create_task(awrite_batch(pipeline.hash_batch(doc_batch)))
+                )
+                # Keep one batch queued so that the writers never wait on hashing.
+                if len(tasks) > max_concurrency:
+                    await pipeline.arecord_batch(await tasks.popleft())
+            while tasks:
+                await pipeline.arecord_batch(await tasks.popleft())
+        finally:
+            for task in tasks:
+                task.cancel()
+        run_cleanup, group_ids = pipeline.full_cleanup_group_ids()
+        if run_cleanup:
+            await pipeline.adelete_stale(group_ids)
+        return pipeline.result()
+
     num_added = 0
     num_skipped = 0
     num_updated = 0
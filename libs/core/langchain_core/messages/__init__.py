@@ -10,6 +10,7 @@ if TYPE_CHECKING:
         AIMessage,
         AIMessageChunk,
         InputTokenDetails,
+        MessageChunkAccumulator,
         OutputTokenDetails,
         UsageMetadata,
     )
@@ -92,6 +93,7 @@ __all__ = (
     "ImageContentBlock",
     "InputTokenDetails",
     "InvalidToolCall",
+    "MessageChunkAccumulator",
     "MessageLikeRepresentation",
     "NonStandardAnnotation",
     "NonStandardContentBlock",
@@ -162,6 +164,7 @@ _dynamic_imports = {
     "SystemMessageChunk": "system",
     "ImageContentBlock": "content",
     "InputTokenDetails": "ai",
+    "MessageChunkAccumulator": "ai",
     "InvalidToolCall": "tool",
     "TextContentBlock": "content",
     "ToolCall": "tool",
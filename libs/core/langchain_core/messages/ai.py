@@ -26,7 +26,16 @@ from langchain_core.messages.tool import (
 from langchain_core.messages.tool import invalid_tool_call as create_invalid_tool_call
 from langchain_core.messages.tool import tool_call as create_tool_call
 from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
-from langchain_core.utils._merge import merge_dicts, merge_lists
+from langchain_core.utils._merge import (
+    _export,
+    _merge_dict_into,
+    _merge_list_into,
+    _MergeList,
+    _own,
+    _TextBuffer,
+    merge_dicts,
+    merge_lists,
+)
 from langchain_core.utils.json import parse_partial_json
 from langchain_core.utils.usage import _dict_int_op
 from langchain_core.utils.utils import LC_AUTO_PREFIX, LC_ID_PREFIX
@@ -619,6 +628,13 @@ def add_ai_message_chunks(
         The resulting `AIMessageChunk`.
 
     """
+    if len(others) > 1:
+        accumulator = MessageChunkAccumulator()
+        accumulator.add(left)
+        for other in others:
+            accumulator.add(other)
+        return cast("AIMessageChunk", accumulator.message)
+
     content = merge_content(left.content, *(o.content for o in others))
     additional_kwargs = merge_dicts(
         left.additional_kwargs, *(o.additional_kwargs for o in others)
@@ -690,6 +706,148 @@ def add_ai_message_chunks(
     )
 
 
+class MessageChunkAccumulator:
+    """Accumulate a stream of message chunks into a single message chunk.
+
+    Adding `AIMessageChunk` objects with `+` one at a time copies and re-merges
+    everything seen so far on every chunk, so long streams take quadratic time. The
+    accumulator instead appends the content, tool call argument fragments and
+    metadata of each chunk to buffers, and only builds the merged message when
+    `message` is read.
+
+    The result is the same as adding the chunks together with `+` in order. Chunks
+    other than `AIMessageChunk` are added with `+`.
+
+    Example:
+        ```python
+        from langchain_core.messages import AIMessageChunk, MessageChunkAccumulator
+
+        accumulator = MessageChunkAccumulator()
+        for chunk in [
+            AIMessageChunk(content="Hello"),
+            AIMessageChunk(content=" World"),
+        ]:
+            accumulator.add(chunk)
+
+        accumulator.message  # AIMessageChunk(content="Hello World")
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create an empty accumulator."""
+        self._message: BaseMessageChunk | None = None
+        # Set while AIMessageChunks are being buffered; None otherwise.
+        self._cls: type[AIMessageChunk] | None = None
+
+    def add(self, chunk: BaseMessageChunk) -> None:
+        """Add the next chunk of the stream.
+
+        Args:
+            chunk: The chunk to add.
+
+        Raises:
+            TypeError: If the chunk cannot be merged with the chunks before it.
+        """
+        if self._cls is not None and isinstance(chunk, AIMessageChunk):
+            self._merge(chunk)
+            self._message = None
+            return
+        if self._cls is None and self._message is None:
+            merged = chunk
+        else:
+            merged = cast("BaseMessageChunk", self.message) + chunk
+        if isinstance(merged, AIMessageChunk):
+            self._start(merged)
+        else:
+            self._cls = None
+        self._message = merged
+
+    @property
+    def message(self) -> BaseMessageChunk | None:
+        """The chunks added so far merged into one, or `None` if there are none."""
+        if self._message is None and self._cls is not None:
+            if self._tool_call_chunks:
+                tool_call_chunks = [
+                    create_tool_call_chunk(
+                        name=rtc.get("name"),
+                        args=rtc.get("args"),
+                        index=rtc.get("index"),
+                        id=rtc.get("id"),
+                    )
+                    for rtc in _export(self._tool_call_chunks)
+                ]
+            else:
+                tool_call_chunks = []
+            self._message = self._cls(
+                content=_export(self._content),
+                additional_kwargs=_export(self._additional_kwargs),
+                tool_call_chunks=tool_call_chunks,
+                response_metadata=_export(self._response_metadata),
+                usage_metadata=self._usage_metadata if self._has_usage else None,
+                id=self._provider_id or self._run_id or self._any_id,
+                chunk_position=self._chunk_position,
+            )
+        return self._message
+
+    def _start(self, chunk: AIMessageChunk) -> None:
+        self._cls = chunk.__class__
+        content = "" if chunk.content is None else chunk.content
+        self._content: _TextBuffer | _MergeList = (
+            _TextBuffer(content) if isinstance(content, str) else _MergeList(content)
+        )
+        self._additional_kwargs: dict[str, Any] = _own(chunk.additional_kwargs)
+        self._response_metadata: dict[str, Any] = _own(chunk.response_metadata)
+        self._tool_call_chunks = _MergeList(chunk.tool_call_chunks)
+        self._usage_metadata = chunk.usage_metadata
+        self._has_usage = bool(chunk.usage_metadata)
+        self._provider_id: str | None = None
+        self._run_id: str | None = None
+        self._any_id: str | None = None
+        self._add_id(chunk.id)
+        self._chunk_position = chunk.chunk_position
+
+    def _merge(self, chunk: AIMessageChunk) -> None:
+        self._merge_content(chunk.content)
+        _merge_dict_into(self._additional_kwargs, chunk.additional_kwargs)
+        _merge_dict_into(self._response_metadata, chunk.response_metadata)
+        _merge_list_into(self._tool_call_chunks, chunk.tool_call_chunks)
+        self._usage_metadata = add_usage(self._usage_metadata, chunk.usage_metadata)
+        self._has_usage = self._has_usage or chunk.usage_metadata is not None
+        self._add_id(chunk.id)
+        if chunk.chunk_position == "last":
+            self._chunk_position = "last"
+
+    def _merge_content(self, content: str | list[str | dict]) -> None:
+        # Mirrors `merge_content`.
+        merged = self._content
+        if isinstance(merged, _TextBuffer):
+            if isinstance(content, str):
+                merged.parts.append(content)
+            else:
+                self._content = _MergeList([merged.value, *content])
+        elif isinstance(content, list):
+            _merge_list_into(merged, content)
+        elif merged and isinstance(last := merged[-1], (str, _TextBuffer)):
+            if isinstance(last, str):
+                last = merged[-1] = _TextBuffer(last)
+            last.parts.append(content)
+        elif content == "":
+            pass
+        elif merged:
+            merged.add(content)
+
+    def _add_id(self, id_: str | None) -> None:
+        # Mirrors the id preference of `add_ai_message_chunks`: the first
+        # provider-assigned id, then the first lc_run-* id, then any id.
+        if not id_:
+            return
+        if id_.startswith(LC_ID_PREFIX):
+            self._run_id = self._run_id or id_
+        elif not id_.startswith(LC_AUTO_PREFIX):
+            self._provider_id = self._provider_id or id_
+        self._any_id = self._any_id or id_
+
+
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
     """Recursively add two UsageMetadata objects.
 
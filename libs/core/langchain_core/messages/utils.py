@@ -10,10 +10,13 @@ Some examples of what you can do with these functions include:
 from __future__ import annotations
 
 import base64
+import hashlib
 import inspect
+import itertools
 import json
 import logging
 import math
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Sequence
 from functools import partial, wraps
 from typing import (
@@ -762,6 +765,9 @@ def trim_messages(
             `BaseLanguageModel.get_num_tokens_from_messages()` will be used.
             Set to `len` to count the number of **messages** in the chat history.
 
+            Functions of a single `BaseMessage` and `MessageTokenCounter` count
+            each message only once.
+
             !!! note
 
                 Use `count_tokens_approximately` to get fast, approximate token
@@ -992,8 +998,12 @@ def trim_messages(
         raise ValueError(msg)
 
     messages = convert_to_messages(messages)
+    count_each: Callable[[Sequence[BaseMessage]], list[int]] | None = None
     if hasattr(token_counter, "get_num_tokens_from_messages"):
         list_token_counter = token_counter.get_num_tokens_from_messages
+    elif isinstance(token_counter, MessageTokenCounter):
+        list_token_counter = token_counter
+        count_each = token_counter.count_each
     elif callable(token_counter):
         if (
             next(iter(inspect.signature(token_counter).parameters.values())).annotation
@@ -1003,6 +1013,9 @@ def trim_messages(
             def list_token_counter(messages: Sequence[BaseMessage]) -> int:
                 return sum(token_counter(msg) for msg in messages)  # type: ignore[arg-type, misc]
 
+            def count_each(messages: Sequence[BaseMessage]) -> list[int]:
+                return [token_counter(msg) for msg in messages]  # type: ignore[arg-type]
+
         else:
             list_token_counter = token_counter
     else:
@@ -1028,6 +1041,7 @@ def trim_messages(
             text_splitter=text_splitter_fn,
             partial_strategy="first" if allow_partial else None,
             end_on=end_on,
+            count_each=count_each,
         )
     if strategy == "last":
         return _last_max_tokens(
@@ -1039,6 +1053,7 @@ def trim_messages(
             start_on=start_on,
             end_on=end_on,
             text_splitter=text_splitter_fn,
+            count_each=count_each,
         )
     msg = f"Unrecognized {strategy=}. Supported strategies are 'last' and 'first'."
     raise ValueError(msg)
@@ -1430,13 +1445,23 @@ def _first_max_tokens(
     text_splitter: Callable[[str], list[str]],
     partial_strategy: Literal["first", "last"] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    count_each: Callable[[Sequence[BaseMessage]], list[int]] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if not messages:
         return messages
 
+    # With a counter that counts messages one by one, count each message once and
+    # answer prefix queries from running totals.
+    prefix_sums = (
+        list(itertools.accumulate(count_each(messages), initial=0))
+        if count_each
+        else None
+    )
+
     # Check if all messages already fit within token limit
-    if token_counter(messages) <= max_tokens:
+    total = prefix_sums[-1] if prefix_sums is not None else token_counter(messages)
+    if total <= max_tokens:
         # When all messages fit, only apply end_on filtering if needed
         if end_on:
             for _ in range(len(messages)):
@@ -1453,7 +1478,11 @@ def _first_max_tokens(
         if left >= right:
             break
         mid = (left + right + 1) // 2
-        if token_counter(messages[:mid]) <= max_tokens:
+        if (
+            prefix_sums[mid]
+            if prefix_sums is not None
+            else token_counter(messages[:mid])
+        ) <= max_tokens:
             left = mid
             idx = mid
         else:
@@ -1473,7 +1502,11 @@ def _first_max_tokens(
                 excluded.content = list(reversed(excluded.content))
             for _ in range(1, num_block):
                 excluded.content = excluded.content[:-1]
-                if token_counter([*messages[:idx], excluded]) <= max_tokens:
+                if (
+                    prefix_sums[idx] + token_counter([excluded])
+                    if prefix_sums is not None
+                    else token_counter([*messages[:idx], excluded])
+                ) <= max_tokens:
                     messages = [*messages[:idx], excluded]
                     idx += 1
                     included_partial = True
@@ -1503,7 +1536,11 @@ def _first_max_tokens(
                     excluded = excluded.model_copy(deep=True)
 
                 split_texts = text_splitter(text)
-                base_message_count = token_counter(messages[:idx])
+                base_message_count = (
+                    prefix_sums[idx]
+                    if prefix_sums is not None
+                    else token_counter(messages[:idx])
+                )
                 if partial_strategy == "last":
                     split_texts = list(reversed(split_texts))
 
@@ -1548,6 +1585,7 @@ def _last_max_tokens(
     include_system: bool = False,
     start_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    count_each: Callable[[Sequence[BaseMessage]], list[int]] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if len(messages) == 0:
@@ -1583,6 +1621,7 @@ def _last_max_tokens(
         text_splitter=text_splitter,
         partial_strategy="last" if allow_partial else None,
         end_on=start_on,
+        count_each=count_each,
     )
 
     # Re-reverse the messages and add back the system message if needed
@@ -1770,3 +1809,116 @@ def count_tokens_approximately(
 
     # round up once more time in case extra_tokens_per_message is a float
     return math.ceil(token_count)
+
+
+class MessageTokenCounter:
+    """Count tokens message by message, remembering the count of each message.
+
+    Passing a `MessageTokenCounter` as the `token_counter` of `trim_messages` counts
+    each message once and finds the cut-off point from running totals, instead of
+    counting whole prefixes of the history again at every step of the search.
+
+    Counts are remembered by message id and content, so keeping one counter across
+    calls avoids counting a growing chat history over and over.
+
+    The token count of a list of messages is the sum of the counts of its messages.
+
+    Example:
+        ```python
+        from langchain_core.messages.utils import MessageTokenCounter, trim_messages
+
+        token_counter = MessageTokenCounter(
+            count_messages=lambda messages: [
+                len(ids) for ids in tokenizer([m.text for m in messages])["input_ids"]
+            ]
+        )
+
+        trim_messages(messages, max_tokens=4096, token_counter=token_counter)
+        ```
+
+    !!! version-added "Added in `langchain-core` 1.2.1"
+    """
+
+    def __init__(
+        self,
+        count_message: Callable[[BaseMessage], int] | None = None,
+        *,
+        count_messages: Callable[[list[BaseMessage]], Sequence[int]] | None = None,
+        maxsize: int | None = 4096,
+    ) -> None:
+        """Create a token counter.
+
+        Args:
+            count_message: Function that counts the tokens in one message.
+            count_messages: Function that counts the tokens in each of a list of
+                messages in one call, e.g. by running a tokenizer on a batch. Used
+                instead of `count_message` if both are given.
+            maxsize: Max number of message counts to remember. If `None`, there is
+                no limit.
+
+        Raises:
+            ValueError: If neither `count_message` nor `count_messages` is given.
+        """
+        if count_message is None and count_messages is None:
+            msg = "Either 'count_message' or 'count_messages' must be provided."
+            raise ValueError(msg)
+        self.count_message = count_message
+        self.count_messages = count_messages
+        self.maxsize = maxsize
+        self._counts: OrderedDict[tuple[str | None, bytes], int] = OrderedDict()
+
+    def __call__(self, messages: Sequence[BaseMessage]) -> int:
+        """Count the tokens in a list of messages.
+
+        Args:
+            messages: The messages to count.
+
+        Returns:
+            The sum of the token counts of the messages.
+        """
+        return sum(self.count_each(messages))
+
+    def count_each(self, messages: Sequence[BaseMessage]) -> list[int]:
+        """Count the tokens in each message of a list.
+
+        Messages that were counted before are not counted again. All other messages
+        are counted with a single call to `count_messages` if it was given.
+
+        Args:
+            messages: The messages to count.
+
+        Returns:
+            The token count of each message.
+        """
+        keys = [_message_count_key(message) for message in messages]
+        counts: list[int | None] = []
+        missing: dict[tuple[str | None, bytes], BaseMessage] = {}
+        for key, message in zip(keys, messages, strict=True):
+            count = self._counts.get(key)
+            if count is None:
+                missing.setdefault(key, message)
+            else:
+                self._counts.move_to_end(key)
+            counts.append(count)
+        if missing:
+            if self.count_messages is not None:
+                new_counts = list(self.count_messages(list(missing.values())))
+            else:
+                count_message = cast("Callable[[BaseMessage], int]", self.count_message)
+                new_counts = [count_message(message) for message in missing.values()]
+            found = dict(zip(missing, new_counts, strict=True))
+            counts = [
+                found[key] if count is None else count
+                for key, count in zip(keys, counts, strict=True)
+            ]
+            self._counts.update(found)
+            if self.maxsize is not None:
+                while len(self._counts) > self.maxsize:
+                    self._counts.popitem(last=False)
+        return cast("list[int]", counts)
+
+
+def _message_count_key(message: BaseMessage) -> tuple[str | None, bytes]:
+    # The repr covers the content, name, tool calls and every other field a token
+    # counter may look at.
+    return message.id, hashlib.blake2b(repr(message).encode(), digest_size=16).digest()
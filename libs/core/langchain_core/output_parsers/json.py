@@ -13,10 +13,15 @@ from pydantic.v1 import BaseModel
 from typing_extensions import override
 
 from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import BaseMessage
 from langchain_core.output_parsers.format_instructions import JSON_FORMAT_INSTRUCTIONS
-from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
+from langchain_core.output_parsers.transform import (
+    BaseCumulativeTransformOutputParser,
+    _StreamParser,
+)
 from langchain_core.outputs import Generation
 from langchain_core.utils.json import (
+    PartialJsonParser,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -27,6 +32,125 @@ PydanticBaseModel = BaseModel | pydantic.BaseModel
 
 TBaseModel = TypeVar("TBaseModel", bound=PydanticBaseModel)
 
+_JSON_STRIP_CHARS = " \n\r\t`"
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
+
+class _MarkdownJsonParser(PartialJsonParser):
+    # `parse_json_markdown` strips these from the end of the text, so from the
+    # end of a string that is not finished yet.
+    _partial_strip_chars = _JSON_STRIP_CHARS
+
+
+class _JsonStreamParser(_StreamParser):
+    """Incrementally parses streamed text the way `parse_json_markdown` does."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Text seen before the start of the JSON value.
+        self._head = ""
+        self._searched = 0
+        self._parser: _MarkdownJsonParser | None = None
+
+    def _parse(self, chunk: str | BaseMessage) -> Any:
+        if isinstance(chunk, BaseMessage):
+            if not isinstance(chunk.content, str):
+                return NotImplemented
+            text = chunk.content
+        else:
+            text = chunk
+        if self._parser is None:
+            self._head += text
+            start = self._find_start()
+            if start is None:
+                return None
+            if start < 0:
+                return NotImplemented
+            self._parser = _MarkdownJsonParser()
+            text = self._head[start:]
+            self._head = ""
+        elif self._parser.done:
+            # Text after the JSON value, such as a closing fence, is ignored.
+            return self._parser.value
+        try:
+            self._parser.feed(text)
+        except JSONDecodeError:
+            if not self._parser.done:
+                return NotImplemented
+        return self._parser.value
+
+    def _find_start(self) -> int | None:
+        """Find where the JSON value starts in the text seen so far.
+
+        Returns `None` if more text is needed and `-1` if the text is not
+        understood.
+        """
+        text = self._head
+        body = text.lstrip(_JSON_STRIP_CHARS)
+        if body and body[0] in _JSON_START_CHARS:
+            return len(text) - len(body)
+        fence = text.find("```", max(self._searched - 2, 0))
+        if fence < 0:
+            self._searched = len(text)
+            return None
+        rest = text[fence + 3 :]
+        if rest.startswith("json"):
+            rest = rest[4:]
+        elif "json".startswith(rest):
+            return None
+        body = rest.lstrip(_JSON_STRIP_CHARS)
+        if not body:
+            return None
+        return len(text) - len(body) if body[0] in _JSON_START_CHARS else -1
+
+
+def _join_path(path: str, key: Any) -> str:
+    return path + "/" + str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _make_patch(path: str, prev: Any, next_: Any, ops: list[dict[str, Any]]) -> None:
+    for op in jsonpatch.make_patch(prev, next_).patch:
+        op["path"] = path + op["path"]
+        if "from" in op:
+            op["from"] = path + op["from"]
+        ops.append(op)
+
+
+def _diff_values(path: str, prev: Any, next_: Any, ops: list[dict[str, Any]]) -> None:
+    """Append the JSON patch from `prev` to `next_` to `ops`.
+
+    Partial outputs share the values that were complete, so only the values that
+    changed are compared. Objects and arrays that did not just grow are diffed
+    with `jsonpatch`.
+    """
+    if prev is next_:
+        return
+    if isinstance(prev, dict) and isinstance(next_, dict):
+        if any(key not in next_ for key in prev):
+            _make_patch(path, prev, next_, ops)
+            return
+        ops.extend(
+            {"op": "add", "path": _join_path(path, key), "value": value}
+            for key, value in next_.items()
+            if key not in prev
+        )
+        for key, value in prev.items():
+            if value is not next_[key]:
+                _diff_values(_join_path(path, key), value, next_[key], ops)
+    elif isinstance(prev, list) and isinstance(next_, list):
+        size = len(prev)
+        if len(next_) < size or any(prev[i] is not next_[i] for i in range(size - 1)):
+            _make_patch(path, prev, next_, ops)
+            return
+        if size:
+            _diff_values(_join_path(path, size - 1), prev[-1], next_[size - 1], ops)
+        ops.extend(
+            {"op": "add", "path": _join_path(path, i), "value": next_[i]}
+            for i in range(size, len(next_))
+        )
+    elif type(prev) is not type(next_) or prev != next_:
+        ops.append({"op": "replace", "path": path, "value": next_})
+
 
 class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
     """Parse the output of an LLM call to a JSON object.
@@ -39,6 +163,10 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
 
     In streaming, if `diff` is set to `True`, yields JSONPatch operations describing the
     difference between the previous and the current object.
+
+    Streamed text is parsed incrementally, so each chunk is only parsed once. The
+    partial objects yielded while streaming share the values that were already
+    complete, so treat them as read-only and copy one before modifying it.
     """
 
     pydantic_object: Annotated[type[TBaseModel] | None, SkipValidation()] = None  # type: ignore[valid-type]
@@ -47,8 +175,19 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
 
     @override
     def _diff(self, prev: Any | None, next: Any) -> Any:
+        if isinstance(prev, (dict, list)) and isinstance(next, (dict, list)):
+            ops: list[dict[str, Any]] = []
+            _diff_values("", prev, next, ops)
+            return ops
         return jsonpatch.make_patch(prev, next).patch
 
+    @override
+    def _stream_parser(self) -> _StreamParser | None:
+        # Subclasses that customize parsing re-parse the accumulated output.
+        if type(self).parse_result is not JsonOutputParser.parse_result:
+            return None
+        return _JsonStreamParser()
+
     @staticmethod
     def _get_schema(pydantic_object: type[TBaseModel]) -> dict[str, Any]:
         if issubclass(pydantic_object, pydantic.BaseModel):
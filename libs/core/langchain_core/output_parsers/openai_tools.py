@@ -7,14 +7,24 @@ from json import JSONDecodeError
 from typing import Annotated, Any
 
 from pydantic import SkipValidation, ValidationError
+from typing_extensions import override
 
 from langchain_core.exceptions import OutputParserException
-from langchain_core.messages import AIMessage, InvalidToolCall
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessage,
+    InvalidToolCall,
+    ToolCall,
+)
 from langchain_core.messages.tool import invalid_tool_call
 from langchain_core.messages.tool import tool_call as create_tool_call
-from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
+from langchain_core.output_parsers.transform import (
+    BaseCumulativeTransformOutputParser,
+    _StreamParser,
+)
 from langchain_core.outputs import ChatGeneration, Generation
-from langchain_core.utils.json import parse_partial_json
+from langchain_core.utils.json import PartialJsonParser, parse_partial_json
 from langchain_core.utils.pydantic import (
     TypeBaseModel,
     is_pydantic_v1_subclass,
@@ -137,8 +147,168 @@ def parse_tool_calls(
     return final_tools
 
 
+class _StreamedToolCall:
+    """A tool call merged from streamed chunks, with incrementally parsed args."""
+
+    def __init__(self, *, strict: bool) -> None:
+        self.name: str | None = None
+        self.id: str | None = None
+        self.has_function = False
+        self._args: list[str] = []
+        self._parser: PartialJsonParser | None = PartialJsonParser(strict=strict)
+        self._strict = strict
+
+    def update(self, name: str | None, id_: str | None, args: str | None) -> None:
+        # Merge the same way as `merge_dicts` does for message chunks.
+        if name is not None:
+            self.name = name if self.name is None else self.name + name
+        if id_ is not None and id_ != self.id:
+            self.id = id_ if self.id is None else self.id + id_
+        if args:
+            self._args.append(args)
+            if self._parser is not None:
+                try:
+                    self._parser.feed(args)
+                except JSONDecodeError:
+                    self._parser = None
+
+    @property
+    def has_args(self) -> bool:
+        return bool(self._args)
+
+    def args(self) -> Any:
+        """Return the args parsed so far, like `parse_partial_json` would."""
+        if self._parser is not None:
+            args = self._parser.value
+            if args is not None:
+                return args
+        # Invalid JSON, or too little of it to tell.
+        return parse_partial_json("".join(self._args), strict=self._strict)
+
+
+class _StreamedToolCalls:
+    """Tool calls merged by index, the way `merge_lists` merges message chunks."""
+
+    def __init__(self, *, strict: bool = False) -> None:
+        self.calls: list[_StreamedToolCall] = []
+        self._by_index: dict[Any, _StreamedToolCall] = {}
+        self._strict = strict
+        self._merge = False
+
+    def get(self, index: Any) -> _StreamedToolCall:
+        call = None
+        if isinstance(index, int) or (
+            isinstance(index, str) and index.startswith("lc_")
+        ):
+            call = self._by_index.get(index) if self._merge else None
+            if call is None:
+                call = _StreamedToolCall(strict=self._strict)
+                self._by_index.setdefault(index, call)
+                self.calls.append(call)
+            return call
+        call = _StreamedToolCall(strict=self._strict)
+        self.calls.append(call)
+        return call
+
+    def end_chunk(self) -> None:
+        # The tool calls of the first chunk are not merged with each other.
+        self._merge = True
+
+
+class _ToolCallStreamParser(_StreamParser):
+    """Incrementally parses the tool calls of streamed `AIMessageChunk`s.
+
+    Only the new argument fragments of each chunk are parsed, instead of merging
+    the message chunks and re-parsing all arguments.
+    """
+
+    def __init__(self, output_parser: "JsonOutputToolsParser") -> None:
+        super().__init__()
+        self._output_parser = output_parser
+        self._tool_call_chunks = _StreamedToolCalls()
+        # Tool calls in the `additional_kwargs` of older messages.
+        self._raw_tool_calls = _StreamedToolCalls(strict=output_parser.strict)
+        self._has_raw_tool_calls = False
+
+    def _parse(self, chunk: str | BaseMessage) -> Any:
+        if not isinstance(chunk, AIMessageChunk):
+            return NotImplemented
+        if chunk.tool_call_chunks:
+            for tool_call_chunk in chunk.tool_call_chunks:
+                self._tool_call_chunks.get(tool_call_chunk.get("index")).update(
+                    tool_call_chunk.get("name"),
+                    tool_call_chunk.get("id"),
+                    tool_call_chunk.get("args"),
+                )
+            self._tool_call_chunks.end_chunk()
+        if raw_tool_calls := chunk.additional_kwargs.get("tool_calls"):
+            if not isinstance(raw_tool_calls, list):
+                return NotImplemented
+            self._has_raw_tool_calls = True
+            for raw_tool_call in raw_tool_calls:
+                call = self._raw_tool_calls.get(raw_tool_call.get("index"))
+                function = raw_tool_call.get("function")
+                call.has_function = call.has_function or function is not None
+                call.update(
+                    (function or {}).get("name"),
+                    raw_tool_call.get("id"),
+                    (function or {}).get("arguments"),
+                )
+            self._raw_tool_calls.end_chunk()
+
+        # The accumulated message would have these `tool_calls`, and only fall
+        # back to its `additional_kwargs` if there are none.
+        tool_calls = self._tool_calls()
+        additional_kwargs: dict[str, Any] = {}
+        if not tool_calls and self._has_raw_tool_calls:
+            tool_calls = self._parsed_raw_tool_calls()
+            if not tool_calls:
+                additional_kwargs["tool_calls"] = []
+        # The tool calls are already parsed, so skip validating them again.
+        message = AIMessage.model_construct(
+            content="", tool_calls=tool_calls, additional_kwargs=additional_kwargs
+        )
+        return self._output_parser.parse_result(
+            [ChatGeneration(message=message)], partial=True
+        )
+
+    def _tool_calls(self) -> list[ToolCall]:
+        # Same as `AIMessageChunk.init_tool_calls`.
+        tool_calls = []
+        for call in self._tool_call_chunks.calls:
+            try:
+                args = call.args() if call.has_args else {}
+            except Exception:  # noqa: S112
+                continue
+            if isinstance(args, dict):
+                tool_calls.append(
+                    create_tool_call(name=call.name or "", args=args, id=call.id)
+                )
+        return tool_calls
+
+    def _parsed_raw_tool_calls(self) -> list[ToolCall]:
+        # Same as `parse_tool_calls(..., partial=True)`.
+        tool_calls = []
+        for call in self._raw_tool_calls.calls:
+            if not call.has_function:
+                continue
+            try:
+                args = call.args()
+            except JSONDecodeError:
+                continue
+            tool_calls.append(
+                create_tool_call(name=call.name or "", args=args or {}, id=call.id)
+            )
+        return tool_calls
+
+
 class JsonOutputToolsParser(BaseCumulativeTransformOutputParser[Any]):
-    """Parse tools from OpenAI response."""
+    """Parse tools from OpenAI response.
+
+    The partial tool calls yielded while streaming share the argument values that
+    were already complete, so treat them as read-only and copy one before modifying
+    it.
+    """
 
     strict: bool = False
     """Whether to allow non-JSON-compliant strings.
@@ -216,6 +386,17 @@ class JsonOutputToolsParser(BaseCumulativeTransformOutputParser[Any]):
         """
         raise NotImplementedError
 
+    @override
+    def _stream_parser(self) -> _StreamParser | None:
+        # Subclasses that customize parsing re-parse the accumulated output.
+        if type(self).parse_result not in {
+            JsonOutputToolsParser.parse_result,
+            JsonOutputKeyToolsParser.parse_result,
+            PydanticToolsParser.parse_result,
+        }:
+            return None
+        return _ToolCallStreamParser(self)
+
 
 class JsonOutputKeyToolsParser(JsonOutputToolsParser):
     """Parse tools from OpenAI response."""
@@ -96,6 +96,41 @@ class BaseTransformOutputParser(BaseOutputParser[T]):
             yield chunk
 
 
+def _to_generation_chunk(
+    chunk: str | BaseMessage,
+) -> GenerationChunk | ChatGenerationChunk:
+    if isinstance(chunk, BaseMessageChunk):
+        return ChatGenerationChunk(message=chunk)
+    if isinstance(chunk, BaseMessage):
+        return ChatGenerationChunk(message=BaseMessageChunk(**chunk.model_dump()))
+    return GenerationChunk(text=chunk)
+
+
+class _StreamParser:
+    """Incrementally parses the stream of a cumulative output parser.
+
+    `feed` returns the partial output for all chunks seen so far, or
+    `NotImplemented` if the chunk cannot be parsed incrementally. The parser then
+    falls back to accumulating the chunks and re-parsing them with `parse_result`.
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[str | BaseMessage] = []
+
+    def feed(self, chunk: str | BaseMessage) -> Any:
+        self.chunks.append(chunk)
+        return self._parse(chunk)
+
+    def _parse(self, chunk: str | BaseMessage) -> Any:
+        raise NotImplementedError
+
+    def accumulate(self) -> GenerationChunk | ChatGenerationChunk:
+        acc_gen = _to_generation_chunk(self.chunks[0])
+        for chunk in self.chunks[1:]:
+            acc_gen += _to_generation_chunk(chunk)  # type: ignore[operator]
+        return acc_gen
+
+
 class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     """Base class for an output parser that can handle streaming input."""
 
@@ -122,24 +157,27 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
         """
         raise NotImplementedError
 
+    def _stream_parser(self) -> _StreamParser | None:
+        """Return a parser that parses the stream incrementally, if supported."""
+        return None
+
     @override
     def _transform(self, input: Iterator[str | BaseMessage]) -> Iterator[Any]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        stream = self._stream_parser()
         for chunk in input:
-            chunk_gen: GenerationChunk | ChatGenerationChunk
-            if isinstance(chunk, BaseMessageChunk):
-                chunk_gen = ChatGenerationChunk(message=chunk)
-            elif isinstance(chunk, BaseMessage):
-                chunk_gen = ChatGenerationChunk(
-                    message=BaseMessageChunk(**chunk.model_dump())
-                )
+            if stream is not None:
+                parsed = stream.feed(chunk)
+                if parsed is NotImplemented:
+                    acc_gen = stream.accumulate()
+                    stream = None
+                    parsed = self.parse_result([acc_gen], partial=True)
             else:
-                chunk_gen = GenerationChunk(text=chunk)
+                chunk_gen = _to_generation_chunk(chunk)
+                acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+                parsed = self.parse_result([acc_gen], partial=True)
 
-            acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
-
-            parsed = self.parse_result([acc_gen], partial=True)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield self._diff(prev_parsed, parsed)
@@ -153,20 +191,20 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     ) -> AsyncIterator[T]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        stream = self._stream_parser()
         async for chunk in input:
-            chunk_gen: GenerationChunk | ChatGenerationChunk
-            if isinstance(chunk, BaseMessageChunk):
-                chunk_gen = ChatGenerationChunk(message=chunk)
-            elif isinstance(chunk, BaseMessage):
-                chunk_gen = ChatGenerationChunk(
-                    message=BaseMessageChunk(**chunk.model_dump())
-                )
+            if stream is not None:
+                # Only the new chunk is parsed, so there is no need for an executor.
+                parsed = stream.feed(chunk)
+                if parsed is NotImplemented:
+                    acc_gen = stream.accumulate()
+                    stream = None
+                    parsed = await self.aparse_result([acc_gen], partial=True)
             else:
-                chunk_gen = GenerationChunk(text=chunk)
-
-            acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+                chunk_gen = _to_generation_chunk(chunk)
+                acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
+                parsed = await self.aparse_result([acc_gen], partial=True)
 
-            parsed = await self.aparse_result([acc_gen], partial=True)
             if parsed is not None and parsed != prev_parsed:
                 if self.diff:
                     yield await run_in_executor(None, self._diff, prev_parsed, parsed)
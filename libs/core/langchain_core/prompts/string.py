@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import warnings
 from abc import ABC
 from string import Formatter
@@ -19,6 +20,7 @@ if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
 
 try:
+    import jinja2
     from jinja2 import meta
     from jinja2.sandbox import SandboxedEnvironment
 
@@ -28,6 +30,19 @@ except ImportError:
 
 PromptTemplateFormat = Literal["f-string", "mustache", "jinja2"]
 
+# The number of distinct templates whose parsed or compiled form is kept.
+_TEMPLATE_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=1)
+def _get_jinja2_environment() -> SandboxedEnvironment:
+    return SandboxedEnvironment()
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _compile_jinja2(template: str) -> jinja2.Template:
+    return _get_jinja2_environment().from_string(template)
+
 
 def jinja2_formatter(template: str, /, **kwargs: Any) -> str:
     """Format a template using jinja2.
@@ -64,7 +79,7 @@ def jinja2_formatter(template: str, /, **kwargs: Any) -> str:
     # Use a restricted sandbox that blocks ALL attribute/method access
     # Only simple variable lookups like {{variable}} are allowed
     # Attribute access like {{variable.attr}} or {{variable.method()}} is blocked
-    return SandboxedEnvironment().from_string(template).render(**kwargs)
+    return _compile_jinja2(template).render(**kwargs)
 
 
 def validate_jinja2(template: str, input_variables: list[str]) -> None:
@@ -99,11 +114,33 @@ def _get_jinja2_variables_from_template(template: str) -> set[str]:
             "Please install it with `pip install jinja2`."
         )
         raise ImportError(msg)
-    env = SandboxedEnvironment()
-    ast = env.parse(template)
+    ast = _get_jinja2_environment().parse(template)
     return meta.find_undeclared_variables(ast)
 
 
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _is_simple_f_string(template: str) -> bool:
+    """Whether `str.format_map` formats the template like `formatter.format`.
+
+    That is the case when all the fields are plain names without nested fields in
+    their format spec.
+    """
+    try:
+        return all(
+            field_name.isidentifier() and "{" not in (format_spec or "")
+            for _, field_name, format_spec, _ in Formatter().parse(template)
+            if field_name is not None
+        )
+    except ValueError:
+        return False
+
+
+def _f_string_formatter(template: str, /, **kwargs: Any) -> str:
+    if _is_simple_f_string(template):
+        return template.format_map(kwargs)
+    return formatter.format(template, **kwargs)
+
+
 def mustache_formatter(template: str, /, **kwargs: Any) -> str:
     """Format a template using mustache.
 
@@ -200,7 +237,7 @@ def _create_model_recursive(name: str, defs: Defs) -> type:
 
 
 DEFAULT_FORMATTER_MAPPING: dict[str, Callable] = {
-    "f-string": formatter.format,
+    "f-string": _f_string_formatter,
     "mustache": mustache_formatter,
     "jinja2": jinja2_formatter,
 }
@@ -256,6 +293,11 @@ def get_template_variables(template: str, template_format: str) -> list[str]:
     Raises:
         ValueError: If the template format is not supported.
     """
+    return list(_get_template_variables(template, template_format))
+
+
+@functools.lru_cache(maxsize=_TEMPLATE_CACHE_SIZE)
+def _get_template_variables(template: str, template_format: str) -> tuple[str, ...]:
     if template_format == "jinja2":
         # Get the variables for the template
         input_variables = _get_jinja2_variables_from_template(template)
@@ -293,7 +335,7 @@ def get_template_variables(template: str, template_format: str) -> list[str]:
                 )
                 raise ValueError(msg)
 
-    return sorted(input_variables)
+    return tuple(sorted(input_variables))
 
 
 class StringPromptTemplate(BasePromptTemplate, ABC):
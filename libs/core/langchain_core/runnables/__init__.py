@@ -35,14 +35,18 @@ if TYPE_CHECKING:
     )
     from langchain_core.runnables.branch import RunnableBranch
     from langchain_core.runnables.config import (
+        ExecutorPool,
         RunnableConfig,
         ensure_config,
         get_config_list,
+        get_executor_pool,
         patch_config,
         run_in_executor,
+        set_default_executor_pool,
     )
     from langchain_core.runnables.fallbacks import RunnableWithFallbacks
     from langchain_core.runnables.history import RunnableWithMessageHistory
+    from langchain_core.runnables.micro_batch import RunnableMicroBatcher
     from langchain_core.runnables.passthrough import (
         RunnableAssign,
         RunnablePassthrough,
@@ -65,6 +69,7 @@ __all__ = (
     "ConfigurableFieldMultiOption",
     "ConfigurableFieldSingleOption",
     "ConfigurableFieldSpec",
+    "ExecutorPool",
     "RouterInput",
     "RouterRunnable",
     "Runnable",
@@ -75,6 +80,7 @@ __all__ = (
     "RunnableGenerator",
     "RunnableLambda",
     "RunnableMap",
+    "RunnableMicroBatcher",
     "RunnableParallel",
     "RunnablePassthrough",
     "RunnablePick",
@@ -87,8 +93,10 @@ __all__ = (
     "chain",
     "ensure_config",
     "get_config_list",
+    "get_executor_pool",
     "patch_config",
     "run_in_executor",
+    "set_default_executor_pool",
 )
 
 _dynamic_imports = {
@@ -102,13 +110,17 @@ _dynamic_imports = {
     "RunnableSequence": "base",
     "RunnableSerializable": "base",
     "RunnableBranch": "branch",
+    "ExecutorPool": "config",
     "RunnableConfig": "config",
     "ensure_config": "config",
     "get_config_list": "config",
+    "get_executor_pool": "config",
     "patch_config": "config",
     "run_in_executor": "config",
+    "set_default_executor_pool": "config",
     "RunnableWithFallbacks": "fallbacks",
     "RunnableWithMessageHistory": "history",
+    "RunnableMicroBatcher": "micro_batch",
     "RunnableAssign": "passthrough",
     "RunnablePassthrough": "passthrough",
     "RunnablePick": "passthrough",
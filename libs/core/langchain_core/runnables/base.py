@@ -8,6 +8,7 @@ import contextlib
 import functools
 import inspect
 import threading
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import (
     AsyncGenerator,
@@ -68,6 +69,7 @@ from langchain_core.runnables.utils import (
     ConfigurableFieldSpec,
     Input,
     Output,
+    _ChunkAccumulator,
     accepts_config,
     accepts_run_manager,
     coro_with_context,
@@ -1181,6 +1183,8 @@ class Runnable(ABC, Generic[Input, Output]):
         exclude_names: Sequence[str] | None = None,
         exclude_types: Sequence[str] | None = None,
         exclude_tags: Sequence[str] | None = None,
+        structural_sharing: bool = False,
+        omit_paths: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[RunLogPatch]: ...
 
@@ -1198,6 +1202,8 @@ class Runnable(ABC, Generic[Input, Output]):
         exclude_names: Sequence[str] | None = None,
         exclude_types: Sequence[str] | None = None,
         exclude_tags: Sequence[str] | None = None,
+        structural_sharing: bool = False,
+        omit_paths: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[RunLog]: ...
 
@@ -1214,6 +1220,8 @@ class Runnable(ABC, Generic[Input, Output]):
         exclude_names: Sequence[str] | None = None,
         exclude_types: Sequence[str] | None = None,
         exclude_tags: Sequence[str] | None = None,
+        structural_sharing: bool = False,
+        omit_paths: Sequence[str] | None = None,
         **kwargs: Any,
     ) -> AsyncIterator[RunLogPatch] | AsyncIterator[RunLog]:
         """Stream all output from a `Runnable`, as reported to the callback system.
@@ -1237,6 +1245,12 @@ class Runnable(ABC, Generic[Input, Output]):
             exclude_names: Exclude logs with these names.
             exclude_types: Exclude logs with these types.
             exclude_tags: Exclude logs with these tags.
+            structural_sharing: Whether to log streamed chunks without copying them,
+                and, when `diff` is `False`, to yield states that share their
+                unchanged parts with the previous state instead of deep copies.
+                States and chunks must then not be modified.
+            omit_paths: JSON pointers of values to leave out of the log, such as
+                `'/logs/*/inputs'`. `*` matches any single key or index.
             **kwargs: Additional keyword arguments to pass to the `Runnable`.
 
         Yields:
@@ -1251,6 +1265,7 @@ class Runnable(ABC, Generic[Input, Output]):
             exclude_names=exclude_names,
             exclude_types=exclude_types,
             exclude_tags=exclude_tags,
+            omit_paths=omit_paths,
             _schema_format="original",
         )
 
@@ -1264,6 +1279,7 @@ class Runnable(ABC, Generic[Input, Output]):
             diff=diff,
             stream=stream,
             with_streamed_output_list=with_streamed_output_list,
+            structural_sharing=structural_sharing,
             **kwargs,
         ):
             yield item
@@ -1536,7 +1552,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
+        final = _ChunkAccumulator()
         got_first_val = False
 
         for ichunk in input:
@@ -1548,16 +1564,16 @@ class Runnable(ABC, Generic[Input, Output]):
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
             if not got_first_val:
-                final = ichunk
+                final.reset(ichunk)
                 got_first_val = True
             else:
                 try:
-                    final = final + ichunk  # type: ignore[operator]
+                    final.add(ichunk)
                 except TypeError:
-                    final = ichunk
+                    final.reset(ichunk)
 
         if got_first_val:
-            yield from self.stream(final, config, **kwargs)
+            yield from self.stream(final.value, config, **kwargs)
 
     async def atransform(
         self,
@@ -1581,7 +1597,7 @@ class Runnable(ABC, Generic[Input, Output]):
             The output of the `Runnable`.
 
         """
-        final: Input
+        final = _ChunkAccumulator()
         got_first_val = False
 
         async for ichunk in input:
@@ -1593,16 +1609,16 @@ class Runnable(ABC, Generic[Input, Output]):
             # only operate on the last chunk,
             # and we'll iterate until we get to the last chunk.
             if not got_first_val:
-                final = ichunk
+                final.reset(ichunk)
                 got_first_val = True
             else:
                 try:
-                    final = final + ichunk  # type: ignore[operator]
+                    final.add(ichunk)
                 except TypeError:
-                    final = ichunk
+                    final.reset(ichunk)
 
         if got_first_val:
-            async for output in self.astream(final, config, **kwargs):
+            async for output in self.astream(final.value, config, **kwargs):
                 yield output
 
     def bind(self, **kwargs: Any) -> Runnable[Input, Output]:
@@ -2280,9 +2296,10 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = tee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = next(input_for_tracing, None)
+        final_input = _ChunkAccumulator()
+        final_input.reset(next(input_for_tracing, None))
         final_input_supported = True
-        final_output: Output | None = None
+        final_output = _ChunkAccumulator()
         final_output_supported = True
 
         config = ensure_config(config)
@@ -2320,35 +2337,29 @@ class Runnable(ABC, Generic[Input, Output]):
                         chunk: Output = context.run(next, iterator)
                         yield chunk
                         if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk  # type: ignore[operator]
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
+                            try:
+                                final_output.add(chunk)
+                            except TypeError:
+                                final_output.reset(chunk)
+                                final_output_supported = False
                         else:
-                            final_output = chunk
+                            final_output.reset(chunk)
                 except (StopIteration, GeneratorExit):
                     pass
                 for ichunk in input_for_tracing:
                     if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
+                        try:
+                            final_input.add(ichunk)
+                        except TypeError:
+                            final_input.reset(ichunk)
+                            final_input_supported = False
                     else:
-                        final_input = ichunk
+                        final_input.reset(ichunk)
         except BaseException as e:
-            run_manager.on_chain_error(e, inputs=final_input)
+            run_manager.on_chain_error(e, inputs=final_input.value)
             raise
         else:
-            run_manager.on_chain_end(final_output, inputs=final_input)
+            run_manager.on_chain_end(final_output.value, inputs=final_input.value)
 
     async def _atransform_stream_with_config(
         self,
@@ -2377,9 +2388,10 @@ class Runnable(ABC, Generic[Input, Output]):
         # tee the input so we can iterate over it twice
         input_for_tracing, input_for_transform = atee(inputs, 2)
         # Start the input iterator to ensure the input Runnable starts before this one
-        final_input: Input | None = await anext(input_for_tracing, None)
+        final_input = _ChunkAccumulator()
+        final_input.reset(await anext(input_for_tracing, None))
         final_input_supported = True
-        final_output: Output | None = None
+        final_output = _ChunkAccumulator()
         final_output_supported = True
 
         config = ensure_config(config)
@@ -2420,35 +2432,29 @@ class Runnable(ABC, Generic[Input, Output]):
                         chunk = await coro_with_context(anext(iterator), context)
                         yield chunk
                         if final_output_supported:
-                            if final_output is None:
-                                final_output = chunk
-                            else:
-                                try:
-                                    final_output = final_output + chunk
-                                except TypeError:
-                                    final_output = chunk
-                                    final_output_supported = False
+                            try:
+                                final_output.add(chunk)
+                            except TypeError:
+                                final_output.reset(chunk)
+                                final_output_supported = False
                         else:
-                            final_output = chunk
+                            final_output.reset(chunk)
                 except StopAsyncIteration:
                     pass
                 async for ichunk in input_for_tracing:
                     if final_input_supported:
-                        if final_input is None:
-                            final_input = ichunk
-                        else:
-                            try:
-                                final_input = final_input + ichunk  # type: ignore[operator]
-                            except TypeError:
-                                final_input = ichunk
-                                final_input_supported = False
+                        try:
+                            final_input.add(ichunk)
+                        except TypeError:
+                            final_input.reset(ichunk)
+                            final_input_supported = False
                     else:
-                        final_input = ichunk
+                        final_input.reset(ichunk)
         except BaseException as e:
-            await run_manager.on_chain_error(e, inputs=final_input)
+            await run_manager.on_chain_error(e, inputs=final_input.value)
             raise
         else:
-            await run_manager.on_chain_end(final_output, inputs=final_input)
+            await run_manager.on_chain_end(final_output.value, inputs=final_input.value)
         finally:
             if iterator_ is not None and hasattr(iterator_, "aclose"):
                 await iterator_.aclose()
@@ -3448,6 +3454,45 @@ class RunnableSequence(RunnableSerializable[Input, Output]):
                 return cast("list[Output]", inputs)
             raise first_exception
 
+    def pipelined(
+        self, step_max_concurrency: Sequence[int | None] | None = None
+    ) -> Runnable[Input, Output]:
+        """Get a view of this sequence that pipelines batches through its steps.
+
+        `batch` and `abatch` run each step on all inputs before the next step starts,
+        so a single slow input delays every other input. The batch methods of the
+        returned `Runnable` move each input to the next step as soon as it is done
+        with the previous one instead, while `max_concurrency` still limits the
+        number of inputs in progress. Steps are invoked for each input, so steps
+        that batch more efficiently than their `invoke`, such as some LLMs, no
+        longer get a batch. Streaming methods are delegated to this sequence.
+
+        Example:
+            ```python
+            chain = retriever | prompt | model
+            # Run at most 4 model calls at a time, with results in input order.
+            chain.pipelined([None, None, 4]).batch(questions)
+            # Or get each result as soon as it is ready.
+            for i, answer in chain.pipelined().batch_as_completed(questions):
+                ...
+            ```
+
+        Args:
+            step_max_concurrency: The maximum number of inputs to run each step on
+                at the same time, in the order of the steps. `None`, or a missing
+                entry, means no limit for that step.
+
+        Returns:
+            A `Runnable` with the same inputs, outputs and runs as this sequence.
+
+        Raises:
+            ValueError: If there are more limits than steps, or a limit is not a
+                positive integer.
+
+        !!! version-added "Added in `langchain-core` 1.2.1"
+        """
+        return _PipelinedSequence(self, step_max_concurrency)
+
     def _transform(
         self,
         inputs: Iterator[Input],
@@ -3548,6 +3593,194 @@ class RunnableSequence(RunnableSerializable[Input, Output]):
             yield chunk
 
 
+class _PipelinedSequence(Runnable[Input, Output]):
+    """Runs each input through the steps of a sequence without waiting for others."""
+
+    def __init__(
+        self,
+        sequence: RunnableSequence[Input, Output],
+        step_max_concurrency: Sequence[int | None] | None,
+    ) -> None:
+        limits = list(step_max_concurrency or ())
+        if len(limits) > len(sequence.steps):
+            msg = (
+                f"Got {len(limits)} concurrency limits for a sequence of "
+                f"{len(sequence.steps)} steps."
+            )
+            raise ValueError(msg)
+        for limit in limits:
+            if limit is not None and (not isinstance(limit, int) or limit < 1):
+                msg = f"Concurrency limits should be positive integers. Got {limit}."
+                raise ValueError(msg)
+        self.sequence = sequence
+        self.name = sequence.get_name()
+        self.step_max_concurrency = limits + [None] * (
+            len(sequence.steps) - len(limits)
+        )
+        self._semaphores = [
+            threading.Semaphore(limit)
+            if limit is not None
+            else contextlib.nullcontext()
+            for limit in self.step_max_concurrency
+        ]
+        # asyncio semaphores are bound to the event loop they are first used in.
+        self._async_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            list[asyncio.Semaphore | contextlib.AbstractAsyncContextManager[None]],
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    @override
+    def InputType(self) -> type[Input]:
+        return self.sequence.InputType
+
+    @property
+    @override
+    def OutputType(self) -> type[Output]:
+        return self.sequence.OutputType
+
+    @override
+    def get_input_schema(self, config: RunnableConfig | None = None) -> type[BaseModel]:
+        return self.sequence.get_input_schema(config)
+
+    @override
+    def get_output_schema(
+        self, config: RunnableConfig | None = None
+    ) -> type[BaseModel]:
+        return self.sequence.get_output_schema(config)
+
+    @override
+    def invoke(
+        self, input: Input, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> Output:
+        # setup callbacks and context
+        config = ensure_config(config)
+        callback_manager = get_callback_manager_for_config(config)
+        # start the root run
+        run_manager = callback_manager.on_chain_start(
+            None,
+            input,
+            name=config.get("run_name") or self.get_name(),
+            run_id=config.pop("run_id", None),
+        )
+        input_ = input
+
+        # invoke all steps in sequence, waiting for a free slot of each step
+        try:
+            for i, (step, semaphore) in enumerate(
+                zip(self.sequence.steps, self._semaphores, strict=True)
+            ):
+                # mark each step as a child run
+                config = patch_config(
+                    config, callbacks=run_manager.get_child(f"seq:step:{i + 1}")
+                )
+                with semaphore, set_config_context(config) as context:
+                    if i == 0:
+                        input_ = context.run(step.invoke, input_, config, **kwargs)
+                    else:
+                        input_ = context.run(step.invoke, input_, config)
+        # finish the root run
+        except BaseException as e:
+            run_manager.on_chain_error(e)
+            raise
+        else:
+            run_manager.on_chain_end(input_)
+            return cast("Output", input_)
+
+    @override
+    async def ainvoke(
+        self,
+        input: Input,
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> Output:
+        loop = asyncio.get_running_loop()
+        if (semaphores := self._async_semaphores.get(loop)) is None:
+            semaphores = self._async_semaphores[loop] = [
+                asyncio.Semaphore(limit)
+                if limit is not None
+                else contextlib.nullcontext()
+                for limit in self.step_max_concurrency
+            ]
+        # setup callbacks and context
+        config = ensure_config(config)
+        callback_manager = get_async_callback_manager_for_config(config)
+        # start the root run
+        run_manager = await callback_manager.on_chain_start(
+            None,
+            input,
+            name=config.get("run_name") or self.get_name(),
+            run_id=config.pop("run_id", None),
+        )
+        input_ = input
+
+        # invoke all steps in sequence, waiting for a free slot of each step
+        try:
+            for i, (step, semaphore) in enumerate(
+                zip(self.sequence.steps, semaphores, strict=True)
+            ):
+                # mark each step as a child run
+                config = patch_config(
+                    config, callbacks=run_manager.get_child(f"seq:step:{i + 1}")
+                )
+                async with semaphore:
+                    with set_config_context(config) as context:
+                        if i == 0:
+                            part = functools.partial(
+                                step.ainvoke, input_, config, **kwargs
+                            )
+                        else:
+                            part = functools.partial(step.ainvoke, input_, config)
+                        input_ = await coro_with_context(
+                            part(), context, create_task=True
+                        )
+        # finish the root run
+        except BaseException as e:
+            await run_manager.on_chain_error(e)
+            raise
+        else:
+            await run_manager.on_chain_end(input_)
+            return cast("Output", input_)
+
+    @override
+    def stream(
+        self,
+        input: Input,
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> Iterator[Output]:
+        yield from self.sequence.stream(input, config, **kwargs)
+
+    @override
+    def transform(
+        self,
+        input: Iterator[Input],
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> Iterator[Output]:
+        yield from self.sequence.transform(input, config, **kwargs)
+
+    @override
+    async def astream(
+        self,
+        input: Input,
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> AsyncIterator[Output]:
+        async for chunk in self.sequence.astream(input, config, **kwargs):
+            yield chunk
+
+    @override
+    async def atransform(
+        self,
+        input: AsyncIterator[Input],
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> AsyncIterator[Output]:
+        async for chunk in self.sequence.atransform(input, config, **kwargs):
+            yield chunk
+
+
 class RunnableParallel(RunnableSerializable[Input, dict[str, Any]]):
     """Runnable that runs a mapping of `Runnable`s in parallel.
 
@@ -4909,7 +5142,7 @@ class RunnableLambda(Runnable[Input, Output]):
         config: RunnableConfig,
         **kwargs: Any,
     ) -> Iterator[Output]:
-        final: Input
+        input_chunks = _ChunkAccumulator()
         got_first_val = False
         for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
@@ -4917,13 +5150,14 @@ class RunnableLambda(Runnable[Input, Output]):
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
             if not got_first_val:
-                final = ichunk
+                input_chunks.reset(ichunk)
                 got_first_val = True
             else:
                 try:
-                    final = final + ichunk  # type: ignore[operator]
+                    input_chunks.add(ichunk)
                 except TypeError:
-                    final = ichunk
+                    input_chunks.reset(ichunk)
+        final: Input = input_chunks.value
 
         if inspect.isgeneratorfunction(self.func):
             output: Output | None = None
@@ -5001,7 +5235,7 @@ class RunnableLambda(Runnable[Input, Output]):
         config: RunnableConfig,
         **kwargs: Any,
     ) -> AsyncIterator[Output]:
-        final: Input
+        input_chunks = _ChunkAccumulator()
         got_first_val = False
         async for ichunk in chunks:
             # By definitions, RunnableLambdas consume all input before emitting output.
@@ -5009,13 +5243,14 @@ class RunnableLambda(Runnable[Input, Output]):
             # only operate on the last chunk.
             # So we'll iterate until we get to the last chunk!
             if not got_first_val:
-                final = ichunk
+                input_chunks.reset(ichunk)
                 got_first_val = True
             else:
                 try:
-                    final = final + ichunk  # type: ignore[operator]
+                    input_chunks.add(ichunk)
                 except TypeError:
-                    final = ichunk
+                    input_chunks.reset(ichunk)
+        final: Input = input_chunks.value
 
         if hasattr(self, "afunc"):
             afunc = self.afunc
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import threading
 import uuid
 import warnings
+from collections import deque
 from collections.abc import Awaitable, Callable, Generator, Iterable, Iterator, Sequence
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from contextlib import contextmanager
@@ -102,6 +105,13 @@ class RunnableConfig(TypedDict, total=False):
     If not provided, a new UUID will be generated.
     """
 
+    executor_pool: ExecutorPool | None
+    """Shared thread pool to run parallel calls in.
+
+    If not provided, the pool set with `set_default_executor_pool` is used, or a new
+    thread pool is created for each batch or parallel call if none was set.
+    """
+
 
 CONFIG_KEYS = [
     "tags",
@@ -112,6 +122,7 @@ CONFIG_KEYS = [
     "recursion_limit",
     "configurable",
     "run_id",
+    "executor_pool",
 ]
 
 COPIABLE_KEYS = [
@@ -557,6 +568,261 @@ class ContextThreadPoolExecutor(ThreadPoolExecutor):
         )
 
 
+class ExecutorPoolStats(TypedDict):
+    """Metrics of an `ExecutorPool`."""
+
+    max_workers: int
+    """The number of worker threads of the pool."""
+
+    active: int
+    """The number of tasks running in a worker thread."""
+
+    queued: int
+    """The number of tasks waiting for a worker thread."""
+
+    rejected: int
+    """The number of tasks that ran in the calling thread because the pool was full."""
+
+
+# The pool whose worker is running the current task, if any.
+_var_executor_pool_worker: ContextVar[ExecutorPool | None] = ContextVar(
+    "executor_pool_worker", default=None
+)
+
+
+class ExecutorPool:
+    """Long-lived thread pool shared by `Runnable` batch and parallel calls.
+
+    By default, every `batch`, `batch_as_completed` and `RunnableParallel` call
+    starts and joins its own thread pool. Passing an `ExecutorPool` as the
+    `executor_pool` of a `RunnableConfig`, or setting one as the default with
+    `set_default_executor_pool`, runs these calls in a bounded number of threads
+    that are reused instead.
+
+    The `max_concurrency` of each call is enforced per call, not by the size of
+    the pool. A call made from a task that is already running in the pool never
+    waits for a free worker: when all workers are busy, its tasks run in the
+    calling thread instead, so nested calls can't deadlock the pool.
+
+    Example:
+        ```python
+        from langchain_core.runnables import ExecutorPool, RunnableLambda
+
+        pool = ExecutorPool(max_workers=16)
+        runnable = RunnableLambda(lambda x: x + 1)
+        runnable.batch([1, 2, 3], {"executor_pool": pool, "max_concurrency": 2})
+        pool.stats()
+        ```
+
+    !!! version-added "Added in `langchain-core` 1.2.1"
+    """
+
+    def __init__(
+        self, max_workers: int | None = None, *, thread_name_prefix: str = ""
+    ) -> None:
+        """Create a pool.
+
+        Args:
+            max_workers: The number of worker threads. Defaults to the
+                `ThreadPoolExecutor` default.
+            thread_name_prefix: The prefix of the names of the worker threads.
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self.max_workers: int = self._executor._max_workers  # noqa: SLF001
+        self._lock = threading.Lock()
+        # Tasks submitted to the executor that haven't finished yet.
+        self._outstanding = 0
+        self._active = 0
+        self._rejected = 0
+
+    def stats(self) -> ExecutorPoolStats:
+        """Get the current metrics of the pool.
+
+        Returns:
+            The number of workers, and of running, queued and rejected tasks.
+        """
+        with self._lock:
+            return ExecutorPoolStats(
+                max_workers=self.max_workers,
+                active=self._active,
+                queued=self._outstanding - self._active,
+                rejected=self._rejected,
+            )
+
+    def executor(self, max_concurrency: int | None = None) -> Executor:
+        """Get an executor that runs its tasks in this pool.
+
+        Shutting the executor down waits for its own tasks only, and leaves the
+        pool running.
+
+        Args:
+            max_concurrency: The maximum number of tasks of the executor to run at
+                the same time.
+
+        Returns:
+            The executor.
+        """
+        return _PooledExecutor(self, max_concurrency)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop the worker threads of the pool.
+
+        Args:
+            wait: Whether to wait for the running and queued tasks to finish.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _try_submit(self, task: Callable[[], None], *, nested: bool) -> bool:
+        """Submit a task, unless it is nested and would have to wait for a worker."""
+        with self._lock:
+            if nested and self._outstanding >= self.max_workers:
+                self._rejected += 1
+                return False
+            self._outstanding += 1
+        try:
+            self._executor.submit(self._run, task)
+        except BaseException:
+            with self._lock:
+                self._outstanding -= 1
+            raise
+        return True
+
+    def _run(self, task: Callable[[], None]) -> None:
+        with self._lock:
+            self._active += 1
+        try:
+            task()
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._outstanding -= 1
+
+
+class _PooledExecutor(Executor):
+    """Executor that runs at most `max_concurrency` tasks at a time in a pool."""
+
+    def __init__(self, pool: ExecutorPool, max_concurrency: int | None) -> None:
+        self._pool = pool
+        self._max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._running = 0
+        self._pending: deque[tuple[Future[Any], Callable[[], Any], bool]] = deque()
+        self._futures: set[Future[Any]] = set()
+        self._shutdown = False
+
+    def submit(  # type: ignore[override]
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        future: Future[T] = Future()
+        call = partial(
+            copy_context().run, self._call_in_pool, partial(func, *args, **kwargs)
+        )
+        nested = _var_executor_pool_worker.get() is self._pool
+        with self._lock:
+            if self._shutdown:
+                msg = "cannot schedule new futures after shutdown"
+                raise RuntimeError(msg)
+            self._futures.add(future)
+            if (
+                self._max_concurrency is not None
+                and self._running >= self._max_concurrency
+            ):
+                self._pending.append((future, call, nested))
+                return future
+            self._running += 1
+        future.add_done_callback(self._futures.discard)
+        self._start(future, call, nested=nested)
+        return future
+
+    def _call_in_pool(self, func: Callable[[], T]) -> T:
+        _var_executor_pool_worker.set(self._pool)
+        return func()
+
+    def _start(
+        self, future: Future[Any], call: Callable[[], Any], *, nested: bool
+    ) -> None:
+        if not self._pool._try_submit(  # noqa: SLF001
+            partial(self._run, future, call), nested=nested
+        ):
+            # The pool is full, so run the task in the calling thread.
+            self._run(future, call)
+
+    def _run(self, future: Future[Any], call: Callable[[], Any]) -> None:
+        while True:
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = call()
+                except BaseException as exc:
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+            with self._lock:
+                if not self._pending:
+                    self._running -= 1
+                    return
+                future, call, nested = self._pending.popleft()
+            future.add_done_callback(self._futures.discard)
+            if self._pool._try_submit(  # noqa: SLF001
+                partial(self._run, future, call), nested=nested
+            ):
+                return
+            # The pool is full, so keep running tasks in this thread.
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for future, _, _ in self._pending:
+                    future.cancel()
+            futures = list(self._futures)
+        if wait:
+            concurrent.futures.wait(futures)
+
+
+_executor_pools: dict[str, ExecutorPool] = {}
+_executor_pools_lock = threading.Lock()
+_default_executor_pool: ExecutorPool | None = None
+
+
+def get_executor_pool(
+    name: str = "default", max_workers: int | None = None
+) -> ExecutorPool:
+    """Get a process-wide executor pool by name, creating it if needed.
+
+    Args:
+        name: The name of the pool.
+        max_workers: The number of worker threads, if the pool is created.
+
+    Returns:
+        The executor pool.
+
+    !!! version-added "Added in `langchain-core` 1.2.1"
+    """
+    with _executor_pools_lock:
+        if name not in _executor_pools:
+            _executor_pools[name] = ExecutorPool(
+                max_workers, thread_name_prefix=f"langchain-{name}"
+            )
+        return _executor_pools[name]
+
+
+def set_default_executor_pool(pool: ExecutorPool | None) -> None:
+    """Set the executor pool used by calls whose config doesn't set one.
+
+    Args:
+        pool: The executor pool, or `None` to create a thread pool for each call.
+
+    !!! version-added "Added in `langchain-core` 1.2.1"
+    """
+    global _default_executor_pool  # noqa: PLW0603
+    _default_executor_pool = pool
+
+
 @contextmanager
 def get_executor_for_config(
     config: RunnableConfig | None,
@@ -570,6 +836,11 @@ def get_executor_for_config(
         The executor.
     """
     config = config or {}
+    pool = config.get("executor_pool") or _default_executor_pool
+    if pool is not None:
+        with pool.executor(config.get("max_concurrency")) as executor:
+            yield executor
+        return
     with ContextThreadPoolExecutor(
         max_workers=config.get("max_concurrency")
     ) as executor:
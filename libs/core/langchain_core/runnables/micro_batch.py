@@ -0,0 +1,285 @@
+"""Runnable that coalesces concurrent calls into batches."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from contextvars import copy_context
+from typing import Any, cast
+
+from pydantic import PrivateAttr
+from typing_extensions import TypedDict, override
+
+from langchain_core.runnables.base import RunnableBindingBase
+from langchain_core.runnables.config import RunnableConfig, var_child_runnable_config
+from langchain_core.runnables.utils import Input, Output
+
+
+class MicroBatcherStats(TypedDict):
+    """Metrics of a `RunnableMicroBatcher`."""
+
+    batch_size_limit: int
+    """The current maximum number of calls per batch."""
+
+    batch_sizes: dict[int, int]
+    """Histogram of the sizes of the batches run so far."""
+
+    queue_depths: dict[int, int]
+    """Histogram of the number of calls waiting, including the new one, when a call
+    was queued."""
+
+    mean_latency: float | None
+    """Exponential moving average of the batch latency, in seconds."""
+
+
+class _PendingCall:
+    __slots__ = ("config", "done", "input", "output")
+
+    def __init__(self, input_: Any, config: RunnableConfig) -> None:
+        self.input = input_
+        self.config = config
+        self.output: Any = None
+        self.done = False
+
+
+class _AsyncQueue:
+    def __init__(self) -> None:
+        self.pending: deque[tuple[Any, RunnableConfig, asyncio.Future[Any]]] = deque()
+        self.timer: asyncio.TimerHandle | None = None
+        self.tasks: set[asyncio.Task[None]] = set()
+
+
+class RunnableMicroBatcher(RunnableBindingBase[Input, Output]):  # type: ignore[no-redef]
+    """Coalesce concurrent `invoke` and `ainvoke` calls into batches.
+
+    Many `Runnable` objects, such as embedding models and local pipelines, process a
+    batch much faster than the same inputs one at a time, but servers usually call
+    `invoke` once per request. `RunnableMicroBatcher` queues concurrent calls and
+    runs them with a single `batch` or `abatch` call of the wrapped `Runnable`, once
+    `max_batch_size` calls are waiting or the first of them has waited `max_wait`
+    seconds.
+
+    Each call keeps its own config, so its callbacks and runs are the same as with
+    `invoke`, and an exception raised for one input is raised by its call only.
+    Calls with extra keyword arguments are not batched.
+
+    When `target_latency` is set, the batch size is adapted to the observed latency:
+    it is halved after a batch that took longer than the target, and grows by one
+    after a full batch that didn't.
+
+    Example:
+        ```python
+        from langchain_core.runnables import RunnableMicroBatcher
+
+        batched = RunnableMicroBatcher(bound=classifier, max_batch_size=16)
+
+
+        @app.post("/classify")
+        async def classify(text: str) -> str:
+            return await batched.ainvoke(text)
+        ```
+
+    !!! version-added "Added in `langchain-core` 1.2.1"
+    """
+
+    max_batch_size: int = 32
+    """The maximum number of calls to run in one batch."""
+
+    max_wait: float = 0.005
+    """How long, in seconds, the first queued call waits for others to join it."""
+
+    target_latency: float | None = None
+    """The batch latency, in seconds, to adapt the batch size to.
+
+    If `None`, batches are always up to `max_batch_size` calls.
+    """
+
+    _condition: threading.Condition = PrivateAttr(default_factory=threading.Condition)
+    _pending: deque[_PendingCall] = PrivateAttr(default_factory=deque)
+    _collecting: bool = PrivateAttr(default=False)
+    _async_queues: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _AsyncQueue] = (
+        PrivateAttr(default_factory=weakref.WeakKeyDictionary)
+    )
+    _stats_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _batch_size_limit: int | None = PrivateAttr(default=None)
+    _batch_sizes: Counter[int] = PrivateAttr(default_factory=Counter)
+    _queue_depths: Counter[int] = PrivateAttr(default_factory=Counter)
+    _mean_latency: float | None = PrivateAttr(default=None)
+
+    @property
+    def batch_size_limit(self) -> int:
+        """The current maximum number of calls per batch."""
+        if self._batch_size_limit is None:
+            return self.max_batch_size
+        return self._batch_size_limit
+
+    def stats(self) -> MicroBatcherStats:
+        """Get the metrics of the batches run so far.
+
+        Returns:
+            The current batch size limit, histograms of the batch sizes and queue
+            depths, and the mean batch latency.
+        """
+        with self._stats_lock:
+            return MicroBatcherStats(
+                batch_size_limit=self.batch_size_limit,
+                batch_sizes=dict(self._batch_sizes),
+                queue_depths=dict(self._queue_depths),
+                mean_latency=self._mean_latency,
+            )
+
+    def _record_queued(self, depth: int) -> None:
+        with self._stats_lock:
+            self._queue_depths[depth] += 1
+
+    def _record_batch(self, size: int, latency: float) -> None:
+        with self._stats_lock:
+            self._batch_sizes[size] += 1
+            self._mean_latency = (
+                latency
+                if self._mean_latency is None
+                else 0.8 * self._mean_latency + 0.2 * latency
+            )
+            if self.target_latency is None:
+                return
+            limit = self.batch_size_limit
+            if latency > self.target_latency:
+                self._batch_size_limit = max(1, limit // 2)
+            elif size >= limit:
+                self._batch_size_limit = min(self.max_batch_size, limit + 1)
+
+    @override
+    def invoke(
+        self,
+        input: Input,
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> Output:
+        if kwargs:
+            return super().invoke(input, config, **kwargs)
+        call = _PendingCall(input, self._merge_configs(config))
+        batch = None
+        with self._condition:
+            self._pending.append(call)
+            self._record_queued(len(self._pending))
+            self._condition.notify_all()
+            while not call.done:
+                # The oldest waiting call collects the next batch.
+                if not self._collecting and self._pending and self._pending[0] is call:
+                    batch = self._collect()
+                    break
+                self._condition.wait()
+        if batch is not None:
+            self._run_batch(batch)
+        if isinstance(call.output, BaseException):
+            raise call.output
+        return cast("Output", call.output)
+
+    def _collect(self) -> list[_PendingCall]:
+        """Wait for a batch to fill up, with the condition held."""
+        self._collecting = True
+        limit = self.batch_size_limit
+        deadline = time.monotonic() + self.max_wait
+        while len(self._pending) < limit:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            self._condition.wait(remaining)
+        batch = [self._pending.popleft() for _ in range(min(limit, len(self._pending)))]
+        self._collecting = False
+        self._condition.notify_all()
+        return batch
+
+    def _run_batch(self, batch: list[_PendingCall]) -> None:
+        start = time.monotonic()
+        try:
+            # Each call carries its own config, so don't inherit the one of the
+            # call that happens to run the batch.
+            outputs: list[Any] = copy_context().run(self._batch_without_parent, batch)
+        except BaseException as e:
+            outputs = [e] * len(batch)
+        self._record_batch(len(batch), time.monotonic() - start)
+        with self._condition:
+            for call, output in zip(batch, outputs, strict=True):
+                call.output = output
+                call.done = True
+            self._condition.notify_all()
+
+    def _batch_without_parent(self, batch: list[_PendingCall]) -> list[Any]:
+        var_child_runnable_config.set(None)
+        return self.bound.batch(
+            [call.input for call in batch],
+            [call.config for call in batch],
+            return_exceptions=True,
+            **self.kwargs,
+        )
+
+    @override
+    async def ainvoke(
+        self,
+        input: Input,
+        config: RunnableConfig | None = None,
+        **kwargs: Any | None,
+    ) -> Output:
+        if kwargs:
+            return await super().ainvoke(input, config, **kwargs)
+        loop = asyncio.get_running_loop()
+        if (queue := self._async_queues.get(loop)) is None:
+            queue = self._async_queues[loop] = _AsyncQueue()
+        future: asyncio.Future[Output] = loop.create_future()
+        queue.pending.append((input, self._merge_configs(config), future))
+        self._record_queued(len(queue.pending))
+        if len(queue.pending) >= self.batch_size_limit:
+            self._aflush(queue)
+        elif queue.timer is None:
+            queue.timer = loop.call_later(self.max_wait, self._aflush, queue)
+        return await future
+
+    def _aflush(self, queue: _AsyncQueue) -> None:
+        if queue.timer is not None:
+            queue.timer.cancel()
+            queue.timer = None
+        limit = self.batch_size_limit
+        batch = [queue.pending.popleft() for _ in range(min(limit, len(queue.pending)))]
+        task = asyncio.get_running_loop().create_task(self._arun_batch(batch))
+        queue.tasks.add(task)
+        task.add_done_callback(queue.tasks.discard)
+        if queue.pending:
+            if len(queue.pending) >= limit:
+                self._aflush(queue)
+            else:
+                queue.timer = asyncio.get_running_loop().call_later(
+                    self.max_wait, self._aflush, queue
+                )
+
+    async def _arun_batch(
+        self, batch: list[tuple[Any, RunnableConfig, asyncio.Future[Any]]]
+    ) -> None:
+        # Each call carries its own config, so don't inherit the one of the call
+        # that happened to start the batch.
+        var_child_runnable_config.set(None)
+        start = time.monotonic()
+        try:
+            outputs: list[Any] = await self.bound.abatch(
+                [input_ for input_, _, _ in batch],
+                [config for _, config, _ in batch],
+                return_exceptions=True,
+                **self.kwargs,
+            )
+        except BaseException as e:
+            outputs = [e] * len(batch)
+            if isinstance(e, asyncio.CancelledError):
+                for _, _, future in batch:
+                    future.cancel()
+                raise
+        self._record_batch(len(batch), time.monotonic() - start)
+        for (_, _, future), output in zip(batch, outputs, strict=True):
+            if future.done():
+                continue
+            if isinstance(output, BaseException):
+                future.set_exception(output)
+            else:
+                future.set_result(output)
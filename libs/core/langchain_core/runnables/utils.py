@@ -22,6 +22,8 @@ from typing import (
 
 from typing_extensions import override
 
+from langchain_core.messages.ai import AIMessageChunk, MessageChunkAccumulator
+
 # Re-export create-model for backwards compatibility
 from langchain_core.utils.pydantic import create_model  # noqa: F401
 
@@ -526,10 +528,10 @@ def add(addables: Iterable[Addable]) -> Addable | None:
     Returns:
         The result of adding the addable objects.
     """
-    final: Addable | None = None
+    final = _ChunkAccumulator()
     for chunk in addables:
-        final = chunk if final is None else final + chunk
-    return final
+        final.add(chunk)
+    return final.value
 
 
 async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
@@ -541,10 +543,52 @@ async def aadd(addables: AsyncIterable[Addable]) -> Addable | None:
     Returns:
         The result of adding the addable objects.
     """
-    final: Addable | None = None
+    final = _ChunkAccumulator()
     async for chunk in addables:
-        final = chunk if final is None else final + chunk
-    return final
+        final.add(chunk)
+    return final.value
+
+
+class _ChunkAccumulator:
+    """Add up the chunks of a stream with `+`.
+
+    `AIMessageChunk` chunks are collected with a `MessageChunkAccumulator`, so a long
+    stream of them is not copied and re-merged on every chunk.
+    """
+
+    def __init__(self) -> None:
+        self._value: Any = None
+        self._messages: MessageChunkAccumulator | None = None
+
+    @property
+    def value(self) -> Any:
+        """The sum of the chunks added so far, or `None` if there are none."""
+        if self._messages is not None:
+            return self._messages.message
+        return self._value
+
+    def add(self, chunk: Any) -> None:
+        """Add the next chunk.
+
+        Raises:
+            TypeError: If the chunk cannot be added to the chunks before it.
+        """
+        if self._messages is not None:
+            self._messages.add(chunk)
+        elif self._value is None:
+            self.reset(chunk)
+        else:
+            self._value = self._value + chunk
+
+    def reset(self, chunk: Any) -> None:
+        """Drop the chunks added so far and start again from `chunk`."""
+        if isinstance(chunk, AIMessageChunk):
+            self._value = None
+            self._messages = MessageChunkAccumulator()
+            self._messages.add(chunk)
+        else:
+            self._value = chunk
+            self._messages = None
 
 
 class ConfigurableField(NamedTuple):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import copy
 import functools
 import inspect
 import json
@@ -388,6 +389,8 @@ ArgsSchema = TypeBaseModel | dict[str, Any]
 
 _EMPTY_SET: frozenset[str] = frozenset()
 
+_T = TypeVar("_T")
+
 
 class BaseTool(RunnableSerializable[str | dict | ToolCall, Any]):
     """Base class for all LangChain tools.
@@ -555,6 +558,11 @@ class ChildTool(BaseTool):
         Returns:
             `dict` containing the tool's argument properties.
         """
+        if isinstance(self.args_schema, dict):
+            return self.args_schema["properties"]
+        return copy.deepcopy(self._get_cached_schema("args", self._create_args))
+
+    def _create_args(self) -> dict:
         if isinstance(self.args_schema, dict):
             json_schema = self.args_schema
         elif self.args_schema and issubclass(self.args_schema, BaseModelV1):
@@ -580,6 +588,11 @@ class ChildTool(BaseTool):
 
             return self.args_schema
 
+        return self._get_cached_schema(
+            "tool_call_schema", self._create_tool_call_schema
+        )
+
+    def _create_tool_call_schema(self) -> ArgsSchema:
         full_schema = self.get_input_schema()
         fields = []
         for name, type_ in get_all_basemodel_annotations(full_schema).items():
@@ -594,6 +607,43 @@ class ChildTool(BaseTool):
         # base implementation doesn't manage injected args
         return _EMPTY_SET
 
+    @functools.cached_property
+    def _schema_cache(self) -> dict[str, tuple[ArgsSchema | None, str, str, Any]]:
+        # Values derived from `args_schema`, `name` and `description`, keyed by kind,
+        # along with the field values they were derived from.
+        return {}
+
+    def _get_cached_schema(self, kind: str, create: Callable[[], _T]) -> _T:
+        """Get a value derived from the tool's schema, creating it on first use.
+
+        Schemas are needed on every call of the tool and every time it is bound to a
+        model, and generating them is slow. The value is created again when
+        `args_schema`, `name` or `description` is reassigned.
+
+        Args:
+            kind: The kind of value, e.g. `'tool_call_schema'`.
+            create: Creates the value.
+
+        Returns:
+            The value.
+        """
+        entry = self._schema_cache.get(kind)
+        if (
+            entry is not None
+            and entry[0] is self.args_schema
+            and entry[1] == self.name
+            and entry[2] == self.description
+        ):
+            return cast("_T", entry[3])
+        value = create()
+        self._schema_cache[kind] = (
+            self.args_schema,
+            self.name,
+            self.description,
+            value,
+        )
+        return value
+
     # --- Runnable ---
 
     @override
@@ -673,36 +723,25 @@ class ChildTool(BaseTool):
         if input_args is not None:
             if isinstance(input_args, dict):
                 return tool_input
-            if issubclass(input_args, BaseModel):
+            if issubclass(input_args, (BaseModel, BaseModelV1)):
                 # Check args_schema for InjectedToolCallId
-                for k, v in get_all_basemodel_annotations(input_args).items():
-                    if _is_injected_arg_type(v, injected_type=InjectedToolCallId):
-                        if tool_call_id is None:
-                            msg = (
-                                "When tool includes an InjectedToolCallId "
-                                "argument, tool must always be invoked with a full "
-                                "model ToolCall of the form: {'args': {...}, "
-                                "'name': '...', 'type': 'tool_call', "
-                                "'tool_call_id': '...'}"
-                            )
-                            raise ValueError(msg)
-                        tool_input[k] = tool_call_id
+                for k in self._get_cached_schema(
+                    "tool_call_id_args", self._create_tool_call_id_args
+                ):
+                    if tool_call_id is None:
+                        msg = (
+                            "When tool includes an InjectedToolCallId "
+                            "argument, tool must always be invoked with a full "
+                            "model ToolCall of the form: {'args': {...}, "
+                            "'name': '...', 'type': 'tool_call', "
+                            "'tool_call_id': '...'}"
+                        )
+                        raise ValueError(msg)
+                    tool_input[k] = tool_call_id
+            if issubclass(input_args, BaseModel):
                 result = input_args.model_validate(tool_input)
                 result_dict = result.model_dump()
             elif issubclass(input_args, BaseModelV1):
-                # Check args_schema for InjectedToolCallId
-                for k, v in get_all_basemodel_annotations(input_args).items():
-                    if _is_injected_arg_type(v, injected_type=InjectedToolCallId):
-                        if tool_call_id is None:
-                            msg = (
-                                "When tool includes an InjectedToolCallId "
-                                "argument, tool must always be invoked with a full "
-                                "model ToolCall of the form: {'args': {...}, "
-                                "'name': '...', 'type': 'tool_call', "
-                                "'tool_call_id': '...'}"
-                            )
-                            raise ValueError(msg)
-                        tool_input[k] = tool_call_id
                 result = input_args.parse_obj(tool_input)
                 result_dict = result.dict()
             else:
@@ -768,6 +807,20 @@ class ChildTool(BaseTool):
         Returns:
             A filtered dictionary with injected arguments removed.
         """
+        filtered_keys = self._get_cached_schema(
+            "filtered_args", self._create_filtered_args
+        )
+        # Filter out the injected keys from tool_input
+        return {k: v for k, v in tool_input.items() if k not in filtered_keys}
+
+    def _create_tool_call_id_args(self) -> tuple[str, ...]:
+        return tuple(
+            k
+            for k, v in get_all_basemodel_annotations(self.args_schema).items()
+            if _is_injected_arg_type(v, injected_type=InjectedToolCallId)
+        )
+
+    def _create_filtered_args(self) -> frozenset[str]:
         # Start with filtered args from the constant
         filtered_keys = set[str](FILTERED_ARGS)
 
@@ -781,9 +834,7 @@ class ChildTool(BaseTool):
             except Exception:  # noqa: S110
                 # If we can't get annotations, just use FILTERED_ARGS
                 pass
-
-        # Filter out the injected keys from tool_input
-        return {k: v for k, v in tool_input.items() if k not in filtered_keys}
+        return frozenset(filtered_keys)
 
     def _to_args_and_kwargs(
         self, tool_input: str | dict, tool_call_id: str | None
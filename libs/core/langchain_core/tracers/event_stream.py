@@ -830,7 +830,8 @@ async def _astream_events_implementation_v1(
         _schema_format="streaming_events",
     )
 
-    run_log = RunLog(state=None)  # type: ignore[arg-type]
+    # Only the latest state is read, so states can share their unchanged parts.
+    run_log = RunLog(state=None, structural_sharing=True)  # type: ignore[arg-type]
     encountered_start_event = False
 
     root_event_filter = _RootEventFilter(
@@ -7,6 +7,7 @@ import contextlib
 import copy
 import threading
 from collections import defaultdict
+from collections.abc import MutableMapping, MutableSequence
 from pprint import pformat
 from typing import (
     TYPE_CHECKING,
@@ -148,15 +149,29 @@ class RunLog(RunLogPatch):
     state: RunState
     """Current state of the log, obtained from applying all ops in sequence."""
 
-    def __init__(self, *ops: dict[str, Any], state: RunState) -> None:
+    structural_sharing: bool
+    """Whether logs made by adding patches to this log share the unchanged parts of
+    its state instead of deep-copying it."""
+
+    def __init__(
+        self,
+        *ops: dict[str, Any],
+        state: RunState,
+        structural_sharing: bool = False,
+    ) -> None:
         """Create a RunLog.
 
         Args:
             *ops: The operations to apply to the state.
             state: The initial state of the run log.
+            structural_sharing: Whether adding a patch to this log copies only the
+                objects and arrays the patch changes, sharing the rest of the state
+                with the new log. Modifying the state of either log in place then
+                also modifies the other.
         """
         super().__init__(*ops)
         self.state = state
+        self.structural_sharing = structural_sharing
 
     def __add__(self, other: RunLogPatch | Any) -> RunLog:
         """Combine two `RunLog`s.
@@ -172,8 +187,11 @@ class RunLog(RunLogPatch):
         """
         if type(other) is RunLogPatch:
             ops = self.ops + other.ops
-            state = jsonpatch.apply_patch(self.state, other.ops)
-            return RunLog(*ops, state=state)
+            if self.structural_sharing:
+                state = _apply_patch_shared(self.state, other.ops)
+            else:
+                state = jsonpatch.apply_patch(self.state, other.ops)
+            return RunLog(*ops, state=state, structural_sharing=self.structural_sharing)
 
         msg = f"unsupported operand type(s) for +: '{type(self)}' and '{type(other)}'"
         raise TypeError(msg)
@@ -203,6 +221,192 @@ class RunLog(RunLogPatch):
     __hash__ = None
 
 
+def _split_pointer(pointer: str) -> list[str]:
+    if not pointer:
+        return []
+    return [
+        part.replace("~1", "/").replace("~0", "~") for part in pointer.split("/")[1:]
+    ]
+
+
+def _join_pointer(pointer: str, key: Any) -> str:
+    return pointer + "/" + str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _shallow_copy(node: Any) -> Any:
+    if type(node) in {dict, list}:
+        return node.copy()
+    return copy.copy(node)
+
+
+def _resolve(node: Any, path: list[str]) -> Any:
+    for part in path:
+        node = node[int(part)] if isinstance(node, MutableSequence) else node[part]
+    return node
+
+
+def _update(
+    root: Any,
+    path: list[str],
+    op: Literal["add", "replace", "remove"],
+    value: Any,
+    copies: dict[int, Any],
+) -> Any:
+    """Apply one op, copying the objects and arrays on its path first.
+
+    Objects and arrays in `copies` were copied by an earlier op of the same patch,
+    so they are updated in place.
+    """
+    if not path:
+        if op == "remove":
+            msg = "Cannot remove the root of the document"
+            raise jsonpatch.JsonPatchConflict(msg)
+        return value
+
+    def writable(node: Any) -> Any:
+        if id(node) in copies:
+            return node
+        if not isinstance(node, (MutableMapping, MutableSequence)):
+            msg = f"Cannot apply patch to a value of type {type(node).__name__}"
+            raise jsonpatch.JsonPatchConflict(msg)
+        node_copy = _shallow_copy(node)
+        copies[id(node_copy)] = node_copy
+        return node_copy
+
+    root = node = writable(root)
+    try:
+        for part in path[:-1]:
+            key: Any = int(part) if isinstance(node, MutableSequence) else part
+            child = writable(node[key])
+            node[key] = child
+            node = child
+        last = path[-1]
+        if isinstance(node, MutableSequence):
+            if op == "add" and last == "-":
+                node.append(value)
+            elif op == "add":
+                if int(last) > len(node):
+                    msg = f"Can't insert at index {last} of a list of {len(node)}"
+                    raise jsonpatch.JsonPatchConflict(msg)
+                node.insert(int(last), value)
+            elif op == "replace":
+                node[int(last)] = value
+            else:
+                del node[int(last)]
+        elif op == "add":
+            node[last] = value
+        elif last not in node:
+            msg = f"Can't {op} non-existent key {last!r}"
+            raise jsonpatch.JsonPatchConflict(msg)
+        elif op == "replace":
+            node[last] = value
+        else:
+            del node[last]
+    except (KeyError, IndexError, ValueError) as e:
+        raise jsonpatch.JsonPatchConflict(str(e)) from e
+    return root
+
+
+def _apply_patch_shared(state: Any, ops: Sequence[dict[str, Any]]) -> Any:
+    """Apply JSON patch ops to `state` without modifying or deep-copying it.
+
+    Only the objects and arrays along the path of each op are copied, so the result
+    shares everything else with `state`, and op values are used as they are.
+    """
+    copies: dict[int, Any] = {}
+    for op in ops:
+        path = _split_pointer(op["path"])
+        kind = op["op"]
+        if kind == "test":
+            if _resolve(state, path) != op["value"]:
+                msg = f"{_resolve(state, path)!r} is not equal to {op['value']!r}"
+                raise jsonpatch.JsonPatchTestFailed(msg)
+        elif kind in {"move", "copy"}:
+            from_path = _split_pointer(op["from"])
+            value = _resolve(state, from_path)
+            if kind == "move":
+                state = _update(state, from_path, "remove", None, copies)
+            state = _update(state, path, "add", value, copies)
+        elif kind in {"add", "replace", "remove"}:
+            state = _update(state, path, kind, op.get("value"), copies)
+        else:
+            msg = f"Unknown operation {kind!r}"
+            raise jsonpatch.InvalidJsonPatch(msg)
+    return state
+
+
+def _diff_shared(pointer: str, prev: Any, next_: Any) -> list[dict[str, Any]]:
+    """Get the JSON patch from `prev` to `next_`, skipping the values they share."""
+    if prev is next_:
+        return []
+    if (
+        isinstance(prev, dict)
+        and isinstance(next_, dict)
+        and all(key in next_ for key in prev)
+    ):
+        ops: list[dict[str, Any]] = []
+        for key, value in next_.items():
+            if key in prev:
+                ops.extend(_diff_shared(_join_pointer(pointer, key), prev[key], value))
+            else:
+                ops.append(
+                    {"op": "add", "path": _join_pointer(pointer, key), "value": value}
+                )
+        return ops
+    ops = []
+    for op in jsonpatch.JsonPatch.from_diff(prev, next_, dumps=dumps):
+        op["path"] = pointer + op["path"]
+        if "from" in op:
+            op["from"] = pointer + op["from"]
+        ops.append(op)
+    return ops
+
+
+def _omit_in_value(value: Any, pattern: list[str]) -> Any:
+    """Remove the values matching `pattern` from `value`, copying what changes."""
+    if isinstance(value, MutableMapping):
+        keys = [key for key in value if pattern[0] in {"*", str(key)}]
+    elif isinstance(value, MutableSequence):
+        keys = [i for i in range(len(value)) if pattern[0] in {"*", str(i)}]
+    else:
+        return value
+    if not keys:
+        return value
+    value = _shallow_copy(value)
+    for key in reversed(keys):
+        if len(pattern) == 1:
+            del value[key]
+        else:
+            value[key] = _omit_in_value(value[key], pattern[1:])
+    return value
+
+
+def _omit_paths(
+    ops: Sequence[dict[str, Any]], patterns: Sequence[list[str]]
+) -> list[dict[str, Any]]:
+    """Leave values matching any of `patterns` out of `ops`.
+
+    Ops at or below a matching path are dropped, and matching values are removed
+    from the values of ops above it.
+    """
+    kept = []
+    for op in ops:
+        path = _split_pointer(op["path"])
+        value = op.get("value")
+        for pattern in patterns:
+            if not all(
+                p in {"*", part} for p, part in zip(pattern, path, strict=False)
+            ):
+                continue
+            if len(pattern) <= len(path):
+                break
+            if "value" in op:
+                value = _omit_in_value(value, pattern[len(path) :])
+        else:
+            kept.append(op if value is op.get("value") else {**op, "value": value})
+    return kept
+
+
 T = TypeVar("T")
 
 
@@ -219,6 +423,7 @@ class LogStreamCallbackHandler(BaseTracer, _StreamingCallbackHandler):
         exclude_names: Sequence[str] | None = None,
         exclude_types: Sequence[str] | None = None,
         exclude_tags: Sequence[str] | None = None,
+        omit_paths: Sequence[str] | None = None,
         # Schema format is for internal use only.
         _schema_format: Literal["original", "streaming_events"] = "streaming_events",
     ) -> None:
@@ -232,6 +437,9 @@ class LogStreamCallbackHandler(BaseTracer, _StreamingCallbackHandler):
             exclude_names: Exclude runs from Runnables with matching names.
             exclude_types: Exclude runs from Runnables with matching types.
             exclude_tags: Exclude runs from Runnables with matching tags.
+            omit_paths: JSON pointers of values to leave out of the log, such as
+                `'/logs/*/inputs'` or `'/logs/*/streamed_output'`. `*` matches any
+                single key or index.
             _schema_format: Primarily changes how the inputs and outputs are
                 handled.
 
@@ -263,6 +471,8 @@ class LogStreamCallbackHandler(BaseTracer, _StreamingCallbackHandler):
         self.exclude_names = exclude_names
         self.exclude_types = exclude_types
         self.exclude_tags = exclude_tags
+        self.omit_paths = omit_paths
+        self._omit_patterns = [_split_pointer(path) for path in omit_paths or ()]
 
         try:
             loop = asyncio.get_event_loop()
@@ -297,6 +507,10 @@ class LogStreamCallbackHandler(BaseTracer, _StreamingCallbackHandler):
         # to handle exceptions that might arise at run time.
         # For now we'll let the exception bubble up, and always return
         # True on the happy path.
+        if self._omit_patterns:
+            ops = tuple(_omit_paths(ops, self._omit_patterns))
+            if not ops:
+                return True
         self.send_stream.send_nowait(RunLogPatch(*ops))
         return True
 
@@ -622,6 +836,7 @@ def _astream_log_implementation(
     stream: LogStreamCallbackHandler,
     diff: Literal[True] = True,
     with_streamed_output_list: bool = True,
+    structural_sharing: bool = False,
     **kwargs: Any,
 ) -> AsyncIterator[RunLogPatch]: ...
 
@@ -635,6 +850,7 @@ def _astream_log_implementation(
     stream: LogStreamCallbackHandler,
     diff: Literal[False],
     with_streamed_output_list: bool = True,
+    structural_sharing: bool = False,
     **kwargs: Any,
 ) -> AsyncIterator[RunLog]: ...
 
@@ -647,6 +863,7 @@ async def _astream_log_implementation(
     stream: LogStreamCallbackHandler,
     diff: bool = True,
     with_streamed_output_list: bool = True,
+    structural_sharing: bool = False,
     **kwargs: Any,
 ) -> AsyncIterator[RunLogPatch] | AsyncIterator[RunLog]:
     """Implementation of astream_log for a given runnable.
@@ -663,6 +880,8 @@ async def _astream_log_implementation(
         with_streamed_output_list: Whether to include a list of all streamed
             outputs in each patch. If `False`, only the final output will be included
             in the patches.
+        structural_sharing: Whether streamed chunks are logged without copying
+            them, and run logs share the unchanged parts of their states.
         **kwargs: Additional keyword arguments to pass to the runnable.
 
     Raises:
@@ -715,16 +934,26 @@ async def _astream_log_implementation(
                             # chunk cannot be shared between
                             # streamed_output and final_output
                             # otherwise jsonpatch.apply will
-                            # modify both
-                            "value": copy.deepcopy(chunk),
+                            # modify both, unless patches are
+                            # applied with structural sharing
+                            "value": chunk
+                            if structural_sharing
+                            else copy.deepcopy(chunk),
                         }
                     )
-                patches.extend(
-                    {**op, "path": f"/final_output{op['path']}"}
-                    for op in jsonpatch.JsonPatch.from_diff(
-                        prev_final_output, final_output, dumps=dumps
+                if structural_sharing:
+                    patches.extend(
+                        _diff_shared("/final_output", prev_final_output, final_output)
                     )
-                )
+                else:
+                    patches.extend(
+                        {**op, "path": f"/final_output{op['path']}"}
+                        for op in jsonpatch.JsonPatch.from_diff(
+                            prev_final_output, final_output, dumps=dumps
+                        )
+                    )
+                if stream._omit_patterns:  # noqa: SLF001
+                    patches = _omit_paths(patches, stream._omit_patterns)  # noqa: SLF001
                 await stream.send_stream.send(RunLogPatch(*patches))
         finally:
             await stream.send_stream.aclose()
@@ -737,7 +966,7 @@ async def _astream_log_implementation(
             async for log in stream:
                 yield log
         else:
-            state = RunLog(state=None)  # type: ignore[arg-type]
+            state = RunLog(state=None, structural_sharing=structural_sharing)  # type: ignore[arg-type]
             async for log in stream:
                 state += log
                 yield state
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 
 
@@ -192,3 +193,144 @@ def merge_obj(left: Any, right: Any) -> Any:
         f"list, or else be two equal objects."
     )
     raise ValueError(msg)
+
+
+class _TextBuffer:
+    """A string that is being concatenated, joined only when its value is read."""
+
+    __slots__ = ("parts",)
+
+    def __init__(self, text: str) -> None:
+        self.parts = [text]
+
+    @property
+    def value(self) -> str:
+        if len(self.parts) > 1:
+            self.parts[:] = ["".join(self.parts)]
+        return self.parts[0]
+
+    def __contains__(self, item: str) -> bool:
+        return item in self.value
+
+
+class _MergeList(list):
+    """A list being merged into, with the position of each `index` it holds."""
+
+    def __init__(self, items: list) -> None:
+        super().__init__()
+        self.positions: dict[Any, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Any) -> None:
+        if isinstance(item, dict) and "index" in item:
+            # Unhashable indexes are never merged by `merge_lists` either.
+            with contextlib.suppress(TypeError):
+                self.positions.setdefault(item["index"], len(self))
+        self.append(_own(item))
+
+
+_MERGED_TYPES: dict[type, type] = {_TextBuffer: str, _MergeList: list}
+
+
+def _own(value: Any) -> Any:
+    """Copy the dicts and lists in `value` so they can be merged into in place."""
+    if isinstance(value, dict):
+        return {k: _own(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return _MergeList(value)
+    return value
+
+
+def _export(value: Any) -> Any:
+    """Build plain dicts, lists and strings from a value merged into in place."""
+    if isinstance(value, _TextBuffer):
+        return value.value
+    if isinstance(value, dict):
+        return {k: _export(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_export(v) for v in value]
+    return value
+
+
+def _merge_dict_into(merged: dict[str, Any], right: dict[str, Any]) -> None:
+    """Merge `right` into `merged` in place, like `merge_dicts(merged, right)`.
+
+    `merged` must have been built with `_own`. Strings are appended to text buffers
+    instead of being copied on every merge.
+    """
+    for right_k, right_v in right.items():
+        if right_k not in merged or (right_v is not None and merged[right_k] is None):
+            merged[right_k] = _own(right_v)
+            continue
+        if right_v is None:
+            continue
+        left_v: Any = merged[right_k]
+        is_buffer = type(left_v) is _TextBuffer
+        left_type = _MERGED_TYPES.get(type(left_v), type(left_v))
+        right_type = type(right_v)
+        if left_type is not right_type:
+            msg = (
+                f'additional_kwargs["{right_k}"] already exists in this message,'
+                " but with a different type."
+            )
+            raise TypeError(msg)
+        if is_buffer or isinstance(left_v, str):
+            if right_k in ("index", "id", "output_version", "model_provider"):
+                left_str = left_v.value if is_buffer else left_v
+                if (right_k == "index" and left_str.startswith("lc_")) or (
+                    right_k != "index" and left_str == right_v
+                ):
+                    continue
+            if not is_buffer:
+                left_v = merged[right_k] = _TextBuffer(left_v)
+            left_v.parts.append(right_v)
+        elif isinstance(left_v, dict):
+            _merge_dict_into(left_v, right_v)
+        elif isinstance(left_v, _MergeList):
+            _merge_list_into(left_v, right_v)
+        elif left_v == right_v:
+            continue
+        elif isinstance(left_v, int):
+            merged[right_k] = left_v + right_v
+        else:
+            msg = (
+                f"Additional kwargs key {right_k} already exists in left dict and "
+                f"value has unsupported type {type(left_v)}."
+            )
+            raise TypeError(msg)
+
+
+def _merge_list_into(merged: _MergeList, other: list | None) -> None:
+    """Merge `other` into `merged` in place, like `merge_lists(merged, other)`."""
+    if other is None:
+        return
+    for e in other:
+        if (
+            isinstance(e, dict)
+            and "index" in e
+            and (
+                isinstance(e["index"], int)
+                or (isinstance(e["index"], str) and e["index"].startswith("lc_"))
+            )
+            and (position := merged.positions.get(e["index"])) is not None
+        ):
+            left_e = merged[position]
+            left_type = left_e.get("type")
+            if type(left_type) is _TextBuffer:
+                left_type = left_type.value
+            if left_type and (e.get("type") == "non_standard" and "value" in e):
+                value = {k: v for k, v in e["value"].items() if k != "type"}
+                if left_type != "non_standard":
+                    new_e: dict[str, Any] = {"extras": value}
+                else:
+                    new_e = {"value": value}
+                    if "index" in e:
+                        new_e["index"] = e["index"]
+            else:
+                new_e = (
+                    {k: v for k, v in e.items() if k != "type"} if "type" in e else e
+                )
+            _merge_dict_into(left_e, new_e)
+        else:
+            merged.add(e)
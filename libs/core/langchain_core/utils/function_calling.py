@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import collections
+import copy
 import inspect
 import logging
 import types
@@ -283,6 +284,9 @@ def _convert_any_typed_dicts_to_pydantic(
 def _format_tool_to_openai_function(tool: BaseTool) -> FunctionDescription:
     """Format tool into the OpenAI function API.
 
+    Tools are usually formatted each time they are bound to a model, so the function
+    description is created once per tool, and a copy of it is returned.
+
     Args:
         tool: The tool to format.
 
@@ -292,6 +296,13 @@ def _format_tool_to_openai_function(tool: BaseTool) -> FunctionDescription:
     Returns:
         The function description.
     """
+    function = tool._get_cached_schema(  # noqa: SLF001
+        "openai_function", lambda: _create_openai_function(tool)
+    )
+    return copy.deepcopy(function)
+
+
+def _create_openai_function(tool: BaseTool) -> FunctionDescription:
     is_simple_oai_tool = (
         isinstance(tool, langchain_core.tools.simple.Tool) and not tool.args_schema
     )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 from langchain_core.exceptions import OutputParserException
 
@@ -44,6 +44,295 @@ def _custom_parser(multiline_string: str | bytes | bytearray) -> str:
     )
 
 
+_MISSING = object()
+
+_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_STRING_BODY_RE = re.compile(r'(?:[^"\\]|\\.)*', re.DOTALL)
+_NUMBER_CHARS_RE = re.compile(r"[-+0-9.eE]*")
+_LITERAL_CHARS_RE = re.compile(r"[a-z]*")
+_NUMBER_RE = re.compile(r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?")
+_PARTIAL_ESCAPE_RE = re.compile(r"(\\+)(?:u[0-9a-fA-F]{0,3})?$")
+_HIGH_SURROGATE_RE = re.compile(r"(\\+)u[dD][89abAB][0-9a-fA-F]{2}$")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+# Parser states: what the next non-whitespace character may be.
+_VALUE = 0
+_VALUE_OR_CLOSE = 1
+_KEY = 2
+_KEY_OR_CLOSE = 3
+_COLON = 4
+_COMMA_OR_CLOSE = 5
+_DONE = 6
+
+# Tokens that can span chunks.
+_STRING = 1
+_KEY_STRING = 2
+_NUMBER = 3
+_LITERAL = 4
+
+
+class PartialJsonParser:
+    """Incrementally parse a JSON document that arrives in chunks.
+
+    The tokenizer state is kept between calls to `feed`, so each chunk is only
+    scanned once. `value` returns the document parsed so far, completed the same
+    way as `parse_partial_json`: open strings, objects and arrays are closed, and
+    keys without a value and unfinished literals are left out.
+
+    Values that are complete are shared between the objects returned by `value`;
+    only the objects and arrays that are still open are copied. Treat the returned
+    objects as read-only, since changing one of them also changes the values
+    returned later: copy them first, e.g. with `copy.deepcopy`, to modify them.
+
+    Example:
+        ```python
+        parser = PartialJsonParser()
+        parser.feed('{"setup": "Why did')
+        parser.value  # {"setup": "Why did"}
+        parser.feed(' the chicken", "punchline": ')
+        parser.value  # {"setup": "Why did the chicken"}
+        ```
+    """
+
+    _partial_strip_chars = ""
+    """Characters to strip from the end of an unfinished string."""
+
+    def __init__(self, *, strict: bool = False) -> None:
+        """Create a parser.
+
+        Args:
+            strict: Whether to reject control characters inside strings.
+        """
+        self.strict = strict
+        self._state = _VALUE
+        # Open objects and arrays, with the key awaiting a value for objects.
+        self._stack: list[list[Any]] = []
+        self._root: Any = _MISSING
+        self._token = 0
+        self._buffer: list[str] = []
+        self._escaped = False
+        # Decoded value of the first `_decoded_items` entries of the buffer of an
+        # unfinished string.
+        self._decoded = ""
+        self._decoded_items = 0
+        self._error: json.JSONDecodeError | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether a complete JSON value has been parsed."""
+        return self._state == _DONE
+
+    @property
+    def value(self) -> Any:
+        """The value parsed so far, or `None` if no value has started yet."""
+        value = self._partial_value()
+        return None if value is _MISSING else value
+
+    def feed(self, text: str) -> None:
+        """Parse the next chunk of the document.
+
+        Args:
+            text: The next chunk.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON, including any
+                non-whitespace text after a complete value. The parser cannot be
+                used after an error.
+        """
+        if self._error is not None:
+            raise self._error
+        try:
+            self._feed(text)
+        except json.JSONDecodeError as e:
+            self._error = e
+            raise
+
+    def _feed(self, text: str) -> None:
+        pos = 0
+        end = len(text)
+        while pos < end:
+            token = self._token
+            if token in {_STRING, _KEY_STRING}:
+                if self._escaped:
+                    self._buffer.append(text[pos])
+                    self._escaped = False
+                    pos += 1
+                stop = _STRING_BODY_RE.match(text, pos).end()  # type: ignore[union-attr]
+                if stop > pos:
+                    self._buffer.append(text[pos:stop])
+                if stop == end:
+                    return
+                pos = stop + 1
+                if text[stop] == "\\":
+                    # A backslash at the end of the chunk escapes the next one.
+                    self._buffer.append("\\")
+                    self._escaped = True
+                else:
+                    self._end_string(text, stop)
+            elif token:
+                chars = _NUMBER_CHARS_RE if token == _NUMBER else _LITERAL_CHARS_RE
+                stop = chars.match(text, pos).end()  # type: ignore[union-attr]
+                if stop > pos:
+                    self._buffer.append(text[pos:stop])
+                if stop == end:
+                    return
+                pos = stop
+                self._end_scalar(text, pos)
+            else:
+                pos = _WHITESPACE_RE.match(text, pos).end()  # type: ignore[union-attr]
+                if pos < end:
+                    pos = self._read(text, pos)
+
+    def _read(self, text: str, pos: int) -> int:
+        """Handle the character at `pos` and return the position to continue at."""
+        char = text[pos]
+        state = self._state
+        if state in {_VALUE, _VALUE_OR_CLOSE}:
+            if char == "{":
+                self._stack.append([{}, None])
+                self._state = _KEY_OR_CLOSE
+            elif char == "[":
+                self._stack.append([[], None])
+                self._state = _VALUE_OR_CLOSE
+            elif char == '"':
+                self._token = _STRING
+            elif char == "-" or "0" <= char <= "9":
+                # Numbers and literals are read from their first character.
+                self._token = _NUMBER
+                return pos
+            elif char in {"t", "f", "n"}:
+                self._token = _LITERAL
+                return pos
+            elif char == "]" and state == _VALUE_OR_CLOSE:
+                self._add_value(self._stack.pop()[0])
+            else:
+                self._fail("Expecting value", text, pos)
+        elif state in {_KEY, _KEY_OR_CLOSE}:
+            if char == '"':
+                self._token = _KEY_STRING
+            elif char == "}" and state == _KEY_OR_CLOSE:
+                self._add_value(self._stack.pop()[0])
+            else:
+                self._fail(
+                    "Expecting property name enclosed in double quotes", text, pos
+                )
+        elif state == _COLON:
+            if char != ":":
+                self._fail("Expecting ':' delimiter", text, pos)
+            self._state = _VALUE
+        elif state == _COMMA_OR_CLOSE:
+            is_object = isinstance(self._stack[-1][0], dict)
+            if char == ",":
+                self._state = _KEY if is_object else _VALUE
+            elif char == ("}" if is_object else "]"):
+                self._add_value(self._stack.pop()[0])
+            else:
+                self._fail("Expecting ',' delimiter", text, pos)
+        else:
+            self._fail("Extra data", text, pos)
+        return pos + 1
+
+    def _add_value(self, value: Any) -> None:
+        if not self._stack:
+            self._root = value
+            self._state = _DONE
+            return
+        frame = self._stack[-1]
+        if isinstance(frame[0], dict):
+            frame[0][frame[1]] = value
+            frame[1] = None
+        else:
+            frame[0].append(value)
+        self._state = _COMMA_OR_CLOSE
+
+    def _take_buffer(self) -> str:
+        text = "".join(self._buffer)
+        self._buffer = []
+        self._decoded = ""
+        self._decoded_items = 0
+        return text
+
+    def _decode_string(self, text: str) -> str:
+        """Decode the body of a JSON string, without its quotes."""
+        return json.decoder.scanstring(  # type: ignore[attr-defined]
+            text + '"', 0, self.strict
+        )[0]
+
+    def _end_string(self, text: str, pos: int) -> None:
+        try:
+            value = self._decode_string(self._take_buffer())
+        except json.JSONDecodeError as e:
+            self._fail(e.msg, text, pos)
+        if self._token == _KEY_STRING:
+            self._stack[-1][1] = value
+            self._state = _COLON
+        else:
+            self._add_value(value)
+        self._token = 0
+
+    def _end_scalar(self, text: str, pos: int) -> None:
+        token = self._take_buffer()
+        if self._token == _NUMBER:
+            if not _NUMBER_RE.fullmatch(token):
+                self._fail("Invalid number", text, pos)
+            value = json.loads(token)
+        elif token in _LITERALS:
+            value = _LITERALS[token]
+        else:
+            self._fail("Expecting value", text, pos)
+        self._token = 0
+        self._add_value(value)
+
+    def _fail(self, msg: str, text: str, pos: int) -> NoReturn:
+        raise json.JSONDecodeError(msg, text, pos)
+
+    def _partial_token(self) -> Any:
+        """Return the value of the unfinished token, completed where possible."""
+        if self._token == _STRING:
+            # Only decode the text added since the last call, which starts after a
+            # complete character or escape sequence.
+            start = self._decoded_items
+            tail = "".join(self._buffer[start:])
+            text = tail.rstrip(self._partial_strip_chars)
+            # Drop an escape sequence that is cut off.
+            match = _PARTIAL_ESCAPE_RE.search(text)
+            if match and len(match.group(1)) % 2:
+                text = text[: match.end(1) - 1]
+            # Hold back a trailing high surrogate until the low surrogate of its pair
+            # arrives, since it can't be encoded on its own.
+            match = _HIGH_SURROGATE_RE.search(text)
+            cut = match.end(1) - 1 if match and len(match.group(1)) % 2 else len(text)
+            try:
+                decoded = self._decode_string(text[:cut])
+            except json.JSONDecodeError:
+                self._buffer[start:] = [tail]
+                return _MISSING
+            self._buffer[start:] = [text[:cut], tail[cut:]]
+            self._decoded += decoded
+            self._decoded_items = start + 1
+            return self._decoded
+        if self._token == _NUMBER:
+            match = _NUMBER_RE.match("".join(self._buffer))
+            return json.loads(match.group()) if match else _MISSING
+        if self._token == _LITERAL:
+            return _LITERALS.get("".join(self._buffer), _MISSING)
+        return _MISSING
+
+    def _partial_value(self) -> Any:
+        if self._state == _DONE:
+            return self._root
+        value = self._partial_token()
+        for container, key in reversed(self._stack):
+            partial = container.copy()
+            if value is not _MISSING:
+                if isinstance(partial, list):
+                    partial.append(value)
+                elif key is not None:
+                    partial[key] = value
+            value = partial
+        return value
+
+
 # Adapted from https://github.com/KillianLucas/open-interpreter/blob/5b6080fae1f8c68938a1e4fa8667e3744084ee21/interpreter/utils/parse_partial_json.py
 # MIT License
 
@@ -5,6 +5,7 @@ MIT License.
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Iterator, Mapping, Sequence
 from types import MappingProxyType
@@ -440,7 +441,17 @@ def _get_partial(name: str, partials_dict: Mapping[str, str]) -> str:
 #
 # The main rendering function
 #
+# The tags of the sections passed to lambdas, keyed by the text of the section.
 g_token_cache: dict[str, list[tuple[str, str]]] = {}
+_TOKEN_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def _tokenize_cached(
+    template: str, def_ldel: str, def_rdel: str
+) -> tuple[tuple[str, str], ...]:
+    return tuple(tokenize(template, def_ldel, def_rdel))
+
 
 EMPTY_DICT: MappingProxyType[str, str] = MappingProxyType({})
 
@@ -493,8 +504,8 @@ def render(
     elif template in g_token_cache:
         tokens = (token for token in g_token_cache[template])
     else:
-        # Otherwise make a generator
-        tokens = tokenize(template, def_ldel, def_rdel)
+        # Otherwise tokenize it, once per template
+        tokens = iter(_tokenize_cached(template, def_ldel, def_rdel))
 
     output = ""
 
@@ -587,6 +598,8 @@ def render(
                             def_rdel,
                         )
 
+                if len(g_token_cache) >= _TOKEN_CACHE_SIZE:
+                    del g_token_cache[next(iter(g_token_cache))]
                 g_token_cache[text] = tags
 
                 rend = scope(
@@ -0,0 +1,54 @@
+import asyncio
+from itertools import cycle
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.documents import Document
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda, RunnablePassthrough
+
+
+def _rag_chain() -> Runnable:
+    docs = [
+        Document(page_content=f"Document {i}. " + "lorem ipsum " * 100)
+        for i in range(10)
+    ]
+    retriever = RunnableLambda(lambda _: docs, name="retriever")
+    prompt = ChatPromptTemplate.from_messages(
+        [("system", "Answer using the context:\n{context}"), ("human", "{question}")]
+    )
+    answer = AIMessage(content=" ".join(["token"] * 100))
+    model = GenericFakeChatModel(messages=cycle([answer]))
+    return (
+        RunnablePassthrough.assign(
+            context=retriever
+            | (lambda docs: "\n\n".join(doc.page_content for doc in docs))
+        )
+        | prompt
+        | model
+        | StrOutputParser()
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("structural_sharing", [False, True])
+def test_astream_log_rag_states(
+    benchmark: BenchmarkFixture, *, structural_sharing: bool
+) -> None:
+    chain = _rag_chain()
+
+    async def consume() -> None:
+        async for _ in chain.astream_log(
+            {"question": "What is lorem ipsum?"},
+            diff=False,
+            structural_sharing=structural_sharing,
+        ):
+            pass
+
+    @benchmark  # type: ignore[misc]
+    def run() -> None:
+        asyncio.run(consume())
@@ -0,0 +1,57 @@
+"""Per-step framework overhead of cheap runnables, without callbacks."""
+
+import asyncio
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.runnables import (
+    Runnable,
+    RunnableLambda,
+    RunnableParallel,
+    RunnableSequence,
+)
+
+STEPS = 10
+
+
+def _add_one(x: int) -> int:
+    return x + 1
+
+
+async def _aadd_one(x: int) -> int:
+    return x + 1
+
+
+def _runnables() -> dict[str, Runnable[int, object]]:
+    step = RunnableLambda(_add_one, afunc=_aadd_one)
+    return {
+        "lambda": step,
+        "sequence": RunnableSequence(*[step] * STEPS),
+        "parallel": RunnableParallel({str(i): step for i in range(STEPS)}),
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("kind", ["lambda", "sequence", "parallel"])
+def test_invoke_overhead(benchmark: BenchmarkFixture, kind: str) -> None:
+    runnable = _runnables()[kind]
+
+    @benchmark  # type: ignore[misc]
+    def invoke() -> None:
+        for i in range(100):
+            runnable.invoke(i)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("kind", ["lambda", "sequence", "parallel"])
+def test_ainvoke_overhead(benchmark: BenchmarkFixture, kind: str) -> None:
+    runnable = _runnables()[kind]
+
+    async def ainvoke() -> None:
+        for i in range(100):
+            await runnable.ainvoke(i)
+
+    @benchmark  # type: ignore[misc]
+    def run() -> None:
+        asyncio.run(ainvoke())
@@ -0,0 +1,45 @@
+import asyncio
+import statistics
+import time
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_core.runnables import Runnable, RunnableLambda, RunnableSequence
+
+
+async def _retrieve(x: int) -> int:
+    # One in eight retrievals is slow.
+    await asyncio.sleep(0.2 if x % 8 == 0 else 0.01)
+    return x
+
+
+async def _generate(x: int) -> int:
+    await asyncio.sleep(0.05)
+    return x
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pipelined", [False, True])
+def test_sequence_abatch_latency(
+    benchmark: BenchmarkFixture, *, pipelined: bool
+) -> None:
+    chain: RunnableSequence[int, int] = RunnableSequence(
+        RunnableLambda(_retrieve), RunnableLambda(_generate)
+    )
+    runnable: Runnable = chain.pipelined() if pipelined else chain
+    inputs = list(range(32))
+
+    async def run() -> list[float]:
+        start = time.perf_counter()
+        if pipelined:
+            return [
+                time.perf_counter() - start
+                async for _ in runnable.abatch_as_completed(inputs)
+            ]
+        await runnable.abatch(inputs)
+        return [time.perf_counter() - start] * len(inputs)
+
+    latencies = benchmark.pedantic(lambda: asyncio.run(run()), rounds=5)  # type: ignore[no-untyped-call]
+    benchmark.extra_info["p50_latency"] = statistics.median(latencies)
+    benchmark.extra_info["max_latency"] = max(latencies)
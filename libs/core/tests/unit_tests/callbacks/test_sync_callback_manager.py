@@ -1,6 +1,25 @@
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Any, Literal
+
 import pytest
+from blockbuster import BlockBuster
+from typing_extensions import override
 
-from langchain_core.callbacks.base import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.callbacks.base import (
+    AsyncCallbackHandler,
+    BaseCallbackHandler,
+    BaseCallbackManager,
+)
+from langchain_core.callbacks.manager import (
+    CallbackManager,
+    _CallbackLoop,
+    dispatch_custom_event,
+)
+from langchain_core.runnables import RunnableConfig, RunnableLambda, RunnableParallel
+from langchain_core.tracers.context import _tracing_v2_is_enabled, collect_runs
 
 
 def test_remove_handler() -> None:
@@ -41,3 +60,191 @@ def test_merge_preserves_handler_distinction() -> None:
 
     assert set(merged.handlers) == {h1, h2}
     assert set(merged.inheritable_handlers) == {ih1, ih2}
+
+
+class _RecordingAsyncHandler(AsyncCallbackHandler):
+    def __init__(self, *, run_in_background: bool = False) -> None:
+        self.run_in_background = run_in_background
+        self.texts: list[str] = []
+        self.threads: set[int] = set()
+
+    @override
+    async def on_text(self, text: str, **kwargs: Any) -> None:
+        # Yield control so that deliveries could interleave if unordered.
+        await asyncio.sleep(0)
+        self.threads.add(threading.get_ident())
+        self.texts.append(text)
+
+
+def test_async_handler_from_sync_code_reuses_loop_thread() -> None:
+    handler = _RecordingAsyncHandler()
+    run_manager = CallbackManager(handlers=[handler]).on_chain_start({}, {})
+    for i in range(5):
+        run_manager.on_text(str(i))
+    assert handler.texts == ["0", "1", "2", "3", "4"]
+    assert len(handler.threads) == 1
+    assert threading.get_ident() not in handler.threads
+
+
+async def test_async_handler_from_sync_code_with_running_loop(
+    blockbuster: BlockBuster,
+) -> None:
+    # Sync callbacks called from a coroutine wait for their handlers by design.
+    blockbuster.deactivate()
+    context_var: contextvars.ContextVar[str] = contextvars.ContextVar("test_context")
+    context_var.set("test_value")
+    values: list[str] = []
+
+    class ContextHandler(AsyncCallbackHandler):
+        @override
+        async def on_text(self, text: str, **kwargs: Any) -> None:
+            values.append(context_var.get("not_found"))
+
+    run_manager = CallbackManager(handlers=[ContextHandler()]).on_chain_start({}, {})
+    run_manager.on_text("a")
+    run_manager.on_text("b")
+    assert values == ["test_value", "test_value"]
+
+
+def test_async_handler_run_in_background_preserves_order() -> None:
+    handler = _RecordingAsyncHandler(run_in_background=True)
+    run_manager = CallbackManager(handlers=[handler]).on_chain_start({}, {})
+    expected = [str(i) for i in range(100)]
+    for text in expected:
+        run_manager.on_text(text)
+    # A blocking delivery to the same handler is queued behind the background
+    # ones, so once it returns every earlier event has been delivered.
+    handler.run_in_background = False
+    run_manager.on_text("done")
+    assert handler.texts == [*expected, "done"]
+
+
+def test_callback_loop_shutdown_cancels_hung_callbacks() -> None:
+    handler = BaseCallbackHandler()
+    delivered: list[str] = []
+    cancelled = threading.Event()
+
+    async def deliver(text: str, delay: float) -> None:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        delivered.append(text)
+
+    callback_loop = _CallbackLoop()
+    callback_loop.submit(
+        handler, deliver("fast", 0.01), contextvars.copy_context(), wait=False
+    )
+    callback_loop.submit(
+        BaseCallbackHandler(),
+        deliver("hung", 3600),
+        contextvars.copy_context(),
+        wait=False,
+    )
+
+    start = time.monotonic()
+    callback_loop.shutdown(timeout=0.2)
+
+    assert time.monotonic() - start < 2
+    assert delivered == ["fast"]
+    assert cancelled.is_set()
+    assert not callback_loop._thread.is_alive()
+
+
+def test_configure_without_handlers_resolves_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that child runs reuse the root's finding that there are no handlers."""
+    calls = 0
+
+    def counting_tracing_v2_is_enabled() -> bool | Literal["local"]:
+        nonlocal calls
+        calls += 1
+        return _tracing_v2_is_enabled()
+
+    monkeypatch.setattr(
+        "langchain_core.callbacks.manager._tracing_v2_is_enabled",
+        counting_tracing_v2_is_enabled,
+    )
+    chain = RunnableLambda(lambda x: x + 1) | RunnableParallel(
+        a=RunnableLambda(lambda x: x * 2), b=RunnableLambda(lambda x: x * 3)
+    )
+
+    assert chain.invoke(1) == {"a": 4, "b": 6}
+    assert calls == 1
+
+
+def test_configure_without_handlers_sees_context_entered_in_child() -> None:
+    """Test that a tracing context entered inside a child run is still used."""
+    inner = RunnableLambda(lambda x: x + 1)
+
+    def outer(x: int) -> int:
+        with collect_runs() as cb:
+            result = inner.invoke(x)
+        assert len(cb.traced_runs) == 1
+        return result
+
+    async def aouter(x: int) -> int:
+        with collect_runs() as cb:
+            result = await inner.ainvoke(x)
+        assert len(cb.traced_runs) == 1
+        return result
+
+    chain = RunnableLambda(lambda x: x) | RunnableLambda(outer, afunc=aouter)
+
+    assert chain.invoke(1) == 2
+    assert asyncio.run(chain.ainvoke(1)) == 2
+
+
+class _RecordingHandler(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.chain_starts: list[tuple[list[str] | None, dict[str, Any] | None]] = []
+        self.custom_events: list[Any] = []
+
+    @override
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any],
+        inputs: dict[str, Any],
+        *,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.chain_starts.append((tags, metadata))
+
+    @override
+    def on_custom_event(self, name: str, data: Any, **kwargs: Any) -> None:
+        self.custom_events.append(data)
+
+
+def test_configure_without_handlers_keeps_local_callbacks() -> None:
+    """Test that callbacks added below a run without handlers still get events."""
+
+    def emit(x: int) -> int:
+        dispatch_custom_event("event", x)
+        return x
+
+    def run(root_callbacks: list[BaseCallbackHandler]) -> _RecordingHandler:
+        handler = _RecordingHandler()
+        chain = RunnableLambda(emit) | RunnableLambda(emit).with_config(
+            callbacks=[handler]
+        )
+        config: RunnableConfig = {
+            "tags": ["root"],
+            "metadata": {"key": "value"},
+            "callbacks": root_callbacks,
+        }
+        assert chain.invoke(1, config) == 1
+        return handler
+
+    without_root_handlers = run([])
+    with_root_handlers = run([BaseCallbackHandler()])
+
+    assert without_root_handlers.custom_events == [1]
+    assert without_root_handlers.chain_starts == with_root_handlers.chain_starts
+    assert sorted(without_root_handlers.chain_starts[0][0] or []) == [
+        "root",
+        "seq:step:2",
+    ]
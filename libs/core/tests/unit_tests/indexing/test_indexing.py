@@ -1,3 +1,4 @@
+import hashlib
 from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import (
@@ -2940,3 +2941,217 @@ async def test_aindex_with_upsert_kwargs(
         # Check other arguments
         assert kwargs["batch_size"] == 100
         assert kwargs["vector_field"] == "embedding"
+
+
+def _pipelined_corpus(version: int) -> list[Document]:
+    """Documents spread over 10 sources, with duplicates across batches."""
+    docs = [
+        Document(
+            page_content=f"document {d} version {version if d % 3 else 0}",
+            metadata={"source": str(d % 10)},
+        )
+        for d in range(50)
+    ]
+    return docs + docs[:5]
+
+
+@pytest.mark.parametrize("cleanup", [None, "incremental", "full", "scoped_full"])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_index_pipelined_matches_sequential(cleanup: Any, max_concurrency: int) -> None:
+    """Pipelined indexing should leave the index in the same state."""
+    stores = []
+    for pipelined in (False, True):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        for version in range(3):
+            result = index(
+                _pipelined_corpus(version),
+                record_manager,
+                vector_store,
+                batch_size=7,
+                cleanup=cleanup,
+                source_id_key="source",
+                key_encoder="sha256",
+                max_concurrency=max_concurrency if pipelined else None,
+            )
+            if pipelined:
+                stages = result.pop("stages")
+                assert stages["hash"]["num_docs"] == 55
+                assert stages["exists"]["num_docs"] == 55
+                assert stages["write"]["num_docs"] == result["num_added"]
+            assert "stages" not in result
+        stores.append(
+            (
+                set(vector_store.store),
+                set(record_manager.list_keys()),
+            )
+        )
+    assert stores[0] == stores[1]
+
+
+def test_index_pipelined_counts() -> None:
+    """Cross-batch duplicates are skipped as if batches ran one at a time."""
+    record_manager = InMemoryRecordManager(namespace="hello")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+    docs = _pipelined_corpus(1)
+    result = index(
+        docs,
+        record_manager,
+        vector_store,
+        batch_size=7,
+        key_encoder="sha256",
+        max_concurrency=4,
+    )
+    result.pop("stages")
+    assert result == {
+        "num_added": 50,
+        "num_deleted": 0,
+        "num_skipped": 5,
+        "num_updated": 0,
+    }
+    result = index(
+        docs,
+        record_manager,
+        vector_store,
+        batch_size=7,
+        force_update=True,
+        key_encoder="sha256",
+        max_concurrency=4,
+    )
+    result.pop("stages")
+    assert result == {
+        "num_added": 0,
+        "num_deleted": 0,
+        "num_skipped": 0,
+        "num_updated": 55,
+    }
+
+
+def _content_key(doc: Document) -> str:
+    """Key documents by content, so that a document can move between sources."""
+    return hashlib.sha256(doc.page_content.encode()).hexdigest()
+
+
+def _moved_documents() -> tuple[list[Document], list[Document]]:
+    """A source that shrinks, while its documents move to another source."""
+    shared = [f"shared {i}" for i in range(4)]
+    before = [
+        Document(page_content=content, metadata={"source": "a"})
+        for content in [*shared, "old a"]
+    ]
+    after = [Document(page_content="new a", metadata={"source": "a"})] + [
+        Document(page_content=content, metadata={"source": "b"}) for content in shared
+    ]
+    return before, after
+
+
+def test_index_pipelined_cleanup_more_pending_than_cleanup_batch_size() -> None:
+    """Cleanup completes when a whole page of stale records is still in flight."""
+    before, after = _moved_documents()
+    record_manager = InMemoryRecordManager(namespace="hello")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+    index(
+        before,
+        record_manager,
+        vector_store,
+        cleanup="incremental",
+        source_id_key="source",
+        key_encoder=_content_key,
+    )
+
+    result = index(
+        after,
+        record_manager,
+        vector_store,
+        batch_size=1,
+        cleanup="incremental",
+        source_id_key="source",
+        cleanup_batch_size=2,
+        key_encoder=_content_key,
+        max_concurrency=4,
+    )
+
+    assert result["num_deleted"] == 1
+    assert sorted(doc["text"] for doc in vector_store.store.values()) == [
+        "new a",
+        "shared 0",
+        "shared 1",
+        "shared 2",
+        "shared 3",
+    ]
+    assert set(record_manager.list_keys()) == set(vector_store.store)
+
+
+def test_index_pipelined_invalid_max_concurrency(
+    record_manager: InMemoryRecordManager, vector_store: InMemoryVectorStore
+) -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        index([], record_manager, vector_store, max_concurrency=0)
+
+
+@pytest.mark.parametrize("cleanup", [None, "incremental", "full", "scoped_full"])
+async def test_aindex_pipelined_matches_sequential(cleanup: Any) -> None:
+    """Pipelined indexing should leave the index in the same state."""
+    stores = []
+    for pipelined in (False, True):
+        record_manager = InMemoryRecordManager(namespace="hello")
+        vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+        for version in range(3):
+            result = await aindex(
+                _pipelined_corpus(version),
+                record_manager,
+                vector_store,
+                batch_size=7,
+                cleanup=cleanup,
+                source_id_key="source",
+                key_encoder="sha256",
+                max_concurrency=4 if pipelined else None,
+            )
+            if pipelined:
+                stages = result.pop("stages")
+                assert stages["hash"]["num_docs"] == 55
+            assert "stages" not in result
+        stores.append(
+            (
+                set(vector_store.store),
+                set(await record_manager.alist_keys()),
+            )
+        )
+    assert stores[0] == stores[1]
+
+
+async def test_aindex_pipelined_cleanup_more_pending_than_cleanup_batch_size() -> None:
+    """Cleanup completes when a whole page of stale records is still in flight."""
+    before, after = _moved_documents()
+    record_manager = InMemoryRecordManager(namespace="hello")
+    vector_store = InMemoryVectorStore(DeterministicFakeEmbedding(size=5))
+    await aindex(
+        before,
+        record_manager,
+        vector_store,
+        cleanup="incremental",
+        source_id_key="source",
+        key_encoder=_content_key,
+    )
+
+    result = await aindex(
+        after,
+        record_manager,
+        vector_store,
+        batch_size=1,
+        cleanup="incremental",
+        source_id_key="source",
+        cleanup_batch_size=2,
+        key_encoder=_content_key,
+        max_concurrency=4,
+    )
+
+    assert result["num_deleted"] == 1
+    assert sorted(doc["text"] for doc in vector_store.store.values()) == [
+        "new a",
+        "shared 0",
+        "shared 1",
+        "shared 2",
+        "shared 3",
+    ]
+    assert set(await record_manager.alist_keys()) == set(vector_store.store)
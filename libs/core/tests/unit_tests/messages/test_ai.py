@@ -1,7 +1,18 @@
+import copy
+import functools
+import operator
 from typing import cast
 
+import pytest
+
 from langchain_core.load import dumpd, load
-from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.messages import (
+    AIMessage,
+    AIMessageChunk,
+    BaseMessageChunk,
+    HumanMessageChunk,
+    MessageChunkAccumulator,
+)
 from langchain_core.messages import content as types
 from langchain_core.messages.ai import (
     InputTokenDetails,
@@ -201,6 +212,103 @@ def test_add_ai_message_chunks_usage() -> None:
     )
 
 
+_ACCUMULATOR_STREAMS = [
+    [
+        AIMessageChunk(content="Hello", id="lc_run-1"),
+        AIMessageChunk(content=" World", id="provider-id"),
+        AIMessageChunk(
+            content="!",
+            response_metadata={"model_name": "model", "finish_reason": "stop"},
+            usage_metadata=UsageMetadata(
+                input_tokens=1, output_tokens=2, total_tokens=3
+            ),
+            chunk_position="last",
+        ),
+    ],
+    [
+        AIMessageChunk(
+            content="",
+            additional_kwargs={"function_call": {"name": "f", "arguments": ""}},
+        ),
+        *(
+            AIMessageChunk(
+                content="", additional_kwargs={"function_call": {"arguments": part}}
+            )
+            for part in ['{"a"', ": ", "1}"]
+        ),
+    ],
+    [
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                create_tool_call_chunk(name="f", args="", id="call_1", index=0)
+            ],
+        ),
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                create_tool_call_chunk(name=None, args='{"a": ', id=None, index=0),
+                create_tool_call_chunk(name="g", args="{}", id="call_2", index=1),
+            ],
+        ),
+        AIMessageChunk(
+            content="",
+            tool_call_chunks=[
+                create_tool_call_chunk(name=None, args="1}", id=None, index=0)
+            ],
+            chunk_position="last",
+        ),
+    ],
+    [
+        AIMessageChunk(content=[{"type": "text", "text": "Hel", "index": 0}]),
+        AIMessageChunk(content=[{"type": "text", "text": "lo", "index": 0}]),
+        AIMessageChunk(
+            content=[
+                {"type": "tool_use", "id": "t", "partial_json": "", "index": 1},
+                {"type": "text", "text": "!", "index": "lc_a"},
+            ]
+        ),
+        AIMessageChunk(
+            content=[{"type": "tool_use", "partial_json": "{}", "index": 1}]
+        ),
+        AIMessageChunk(content=" trailing"),
+    ],
+    [
+        AIMessageChunk(content="Hello"),
+        AIMessageChunk(content=[{"type": "text", "text": " World", "index": 0}]),
+        AIMessageChunk(content=[{"type": "text", "text": "!", "index": 0}]),
+    ],
+]
+
+
+@pytest.mark.parametrize("chunks", _ACCUMULATOR_STREAMS)
+def test_message_chunk_accumulator(chunks: list[AIMessageChunk]) -> None:
+    expected = functools.reduce(operator.add, copy.deepcopy(chunks))
+    originals = copy.deepcopy(chunks)
+    accumulator = MessageChunkAccumulator()
+    assert accumulator.message is None
+    for i, chunk in enumerate(chunks, 1):
+        accumulator.add(chunk)
+        assert accumulator.message == functools.reduce(
+            operator.add, copy.deepcopy(chunks[:i])
+        )
+    assert accumulator.message == expected
+    assert add_ai_message_chunks(chunks[0], *chunks[1:]) == expected
+    assert chunks == originals
+
+
+def test_message_chunk_accumulator_other_chunks() -> None:
+    accumulator = MessageChunkAccumulator()
+    accumulator.add(HumanMessageChunk(content="a"))
+    accumulator.add(HumanMessageChunk(content="b"))
+    assert accumulator.message == HumanMessageChunk(content="ab")
+
+    accumulator = MessageChunkAccumulator()
+    accumulator.add(AIMessageChunk(content="a"))
+    with pytest.raises(TypeError):
+        accumulator.add(cast("BaseMessageChunk", "b"))
+
+
 def test_init_tool_calls() -> None:
     # Test we add "type" key on init
     msg = AIMessage("", tool_calls=[{"name": "foo", "args": {"a": "b"}, "id": "abc"}])
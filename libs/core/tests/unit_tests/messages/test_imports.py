@@ -1,6 +1,7 @@
 from langchain_core.messages import __all__
 
 EXPECTED_ALL = [
+    "MessageChunkAccumulator",
     "MessageLikeRepresentation",
     "_message_from_dict",
     "AIMessage",
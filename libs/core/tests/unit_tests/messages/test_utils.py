@@ -17,6 +17,7 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langchain_core.messages.utils import (
+    MessageTokenCounter,
     convert_to_messages,
     convert_to_openai_messages,
     count_tokens_approximately,
@@ -673,6 +674,81 @@ def test_trim_messages_start_on_with_allow_partial() -> None:
     assert messages == messages_copy
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_tokens": 30, "strategy": "first"},
+        {"max_tokens": 30, "strategy": "first", "allow_partial": True},
+        {"max_tokens": 30, "strategy": "first", "end_on": "human"},
+        {"max_tokens": 30, "strategy": "last", "include_system": True},
+        {
+            "max_tokens": 40,
+            "strategy": "last",
+            "include_system": True,
+            "allow_partial": True,
+            "start_on": "human",
+        },
+        {"max_tokens": 100, "strategy": "last", "end_on": "human"},
+    ],
+)
+def test_trim_messages_message_token_counter(kwargs: dict[str, Any]) -> None:
+    batches: list[list[BaseMessage]] = []
+
+    def count_messages(messages: list[BaseMessage]) -> list[int]:
+        batches.append(messages)
+        return [dummy_token_counter([message]) for message in messages]
+
+    token_counter = MessageTokenCounter(count_messages=count_messages)
+    expected = trim_messages(
+        _MESSAGES_TO_TRIM, token_counter=dummy_token_counter, **kwargs
+    )
+    assert trim_messages(_MESSAGES_TO_TRIM, token_counter=token_counter, **kwargs) == (
+        expected
+    )
+    assert _MESSAGES_TO_TRIM == _MESSAGES_TO_TRIM_COPY
+
+    # Partial messages are counted after the messages they are cut from.
+    partial = [
+        message
+        for batch in batches
+        for message in batch
+        if message not in _MESSAGES_TO_TRIM
+    ]
+    assert bool(partial) == bool(kwargs.get("allow_partial"))
+
+    # The second call finds every count, partial messages included, in the cache.
+    counted = len(batches)
+    assert trim_messages(_MESSAGES_TO_TRIM, token_counter=token_counter, **kwargs) == (
+        expected
+    )
+    assert batches[counted:] == []
+
+
+def test_message_token_counter() -> None:
+    counted: list[BaseMessage] = []
+
+    def count_message(message: BaseMessage) -> int:
+        counted.append(message)
+        return len(message.text)
+
+    token_counter = MessageTokenCounter(count_message, maxsize=2)
+    messages = [HumanMessage("a"), AIMessage("bb", id="1"), HumanMessage("a")]
+    assert token_counter.count_each(messages) == [1, 2, 1]
+    assert token_counter(messages) == 4
+    assert counted == messages[:2]
+
+    # Same id with different content is counted again.
+    assert token_counter([AIMessage("ccc", id="1")]) == 3
+    # Only the two most recently used counts are kept.
+    assert token_counter([HumanMessage("a")]) == 1
+    assert len(counted) == 3
+    assert token_counter([AIMessage("bb", id="1")]) == 2
+    assert len(counted) == 4
+
+    with pytest.raises(ValueError, match="must be provided"):
+        MessageTokenCounter()
+
+
 class FakeTokenCountingModel(FakeChatModel):
     @override
     def get_num_tokens_from_messages(
@@ -2,15 +2,19 @@ import json
 from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
+import jsonpatch  # type: ignore[import-untyped]
 import pytest
 from pydantic import BaseModel, Field
 
 from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessageChunk
 from langchain_core.output_parsers.json import (
+    JsonOutputParser,
     SimpleJsonOutputParser,
 )
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langchain_core.utils.json import (
+    PartialJsonParser,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -264,6 +268,91 @@ def test_parse_partial_json(json_strings: tuple[str, str]) -> None:
     assert parsed == json.loads(expected)
 
 
+@pytest.mark.parametrize("json_strings", TEST_CASES_PARTIAL)
+def test_partial_json_parser(json_strings: tuple[str, str]) -> None:
+    case, expected = json_strings
+    parser = PartialJsonParser()
+    for char in case:
+        parser.feed(char)
+    assert parser.value == json.loads(expected)
+
+
+def test_partial_json_parser_chunks() -> None:
+    text = json.dumps(
+        {
+            "text": 'Why "did"\n the \\ bears \u00e9',
+            "numbers": [0, -1, 2.5, 1e-3, True, False, None],
+            "nested": {"list": [[], {}, [{"a": "b"}]], "empty": ""},
+        },
+        ensure_ascii=False,
+    )
+    for size in (1, 2, 3, 7):
+        parser = PartialJsonParser()
+        for i in range(0, len(text), size):
+            parser.feed(text[i : i + size])
+            assert parser.value == parse_partial_json(text[: i + size])
+        assert parser.done
+        assert parser.value == json.loads(text)
+
+
+def test_partial_json_parser_shares_complete_values() -> None:
+    parser = PartialJsonParser()
+    parser.feed('{"a": {"b": [1, 2]}, "c": "x')
+    first = parser.value
+    parser.feed("yz")
+    second = parser.value
+    assert first == {"a": {"b": [1, 2]}, "c": "x"}
+    assert second == {"a": {"b": [1, 2]}, "c": "xyz"}
+    assert first is not second
+    assert first["a"] is second["a"]
+
+
+def test_partial_json_parser_cut_off_escape() -> None:
+    parser = PartialJsonParser()
+    parser.feed('["a\\u00')
+    assert parser.value == ["a"]
+    parser.feed("e9\\")
+    assert parser.value == ["a\u00e9"]
+    parser.feed('"b"]')
+    assert parser.value == ['a\u00e9"b']
+
+
+def test_partial_json_parser_long_string_with_escapes() -> None:
+    text = json.dumps({"text": 'caf\u00e9 \U0001f600 "q" \\ \n' * 20})
+    assert "\\ud83d\\ude00" in text
+    for size in (1, 2, 5):
+        parser = PartialJsonParser()
+        for i in range(0, len(text), size):
+            parser.feed(text[i : i + size])
+            # Strings decoded across chunks match strings decoded at once
+            whole = PartialJsonParser()
+            whole.feed(text[: i + size])
+            assert parser.value == whole.value
+        assert parser.value == json.loads(text)
+
+
+def test_partial_json_parser_holds_back_high_surrogate() -> None:
+    parser = PartialJsonParser()
+    parser.feed('{"root": "\\ud83d')
+    assert parser.value == {"root": ""}
+    parser.feed("\\ude00 a\\ud83d")
+    assert parser.value == {"root": "\U0001f600 a"}
+    parser.feed('\\ude00"}')
+    assert parser.value == {"root": "\U0001f600 a\U0001f600"}
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a": 1]', '{"a" 1}', '{"a": 01}', '{"a": tru}', '{"a": "\\q"}', '{"a": 1} x'],
+)
+def test_partial_json_parser_invalid(text: str) -> None:
+    parser = PartialJsonParser()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(text)
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed("")
+
+
 STREAMED_TOKENS = """
 {
 
@@ -543,6 +632,50 @@ async def test_partial_text_json_output_parser_diff_async() -> None:
     assert [p async for p in chain.astream(None)] == EXPECTED_STREAMED_JSON_DIFF
 
 
+def test_partial_text_json_output_parser_diff_applies() -> None:
+    tokens = [
+        '{"a": [1, {"b": "x',
+        'y"}, [2',
+        ']], "c": {"d',
+        '": null, "e": "',
+        "f",
+        '"}, "g": 1.5}',
+    ]
+    prev: Any = None
+    for patch in SimpleJsonOutputParser(diff=True).transform(iter(tokens)):
+        prev = jsonpatch.apply_patch(prev, patch)
+    assert prev == json.loads("".join(tokens))
+
+
+def test_partial_text_json_output_parser_message_chunks() -> None:
+    messages = [AIMessageChunk(content=token) for token in STREAMED_TOKENS]
+    assert list(SimpleJsonOutputParser().transform(iter(messages))) == (
+        EXPECTED_STREAMED_JSON
+    )
+
+
+def test_partial_text_json_output_parser_content_blocks() -> None:
+    # Content blocks are not parsed incrementally, but streaming still works.
+    messages = [
+        AIMessageChunk(content=[{"type": "text", "text": token, "index": 0}])
+        for token in STREAMED_TOKENS
+    ]
+    assert list(SimpleJsonOutputParser().transform(iter(messages))) == (
+        EXPECTED_STREAMED_JSON
+    )
+
+
+def test_partial_text_json_output_parser_subclass() -> None:
+    class UpperJsonOutputParser(JsonOutputParser):
+        def parse_result(self, result: list[Any], *, partial: bool = False) -> Any:
+            parsed = super().parse_result(result, partial=partial)
+            return {key.upper(): value for key, value in (parsed or {}).items()}
+
+    parsed = list(UpperJsonOutputParser().transform(iter(STREAMED_TOKENS)))
+    assert parsed[0] == {}
+    assert parsed[-1]["AUDIENCE"] == ["Haha", "So funny"]
+
+
 def test_raises_error() -> None:
     parser = SimpleJsonOutputParser()
     with pytest.raises(OutputParserException):
@@ -803,6 +803,57 @@ async def test_partial_pydantic_output_parser_async() -> None:
         assert actual == EXPECTED_STREAMED_PYDANTIC
 
 
+def _interleaved_tool_call_chunks() -> list[AIMessageChunk]:
+    args = [
+        '{"names": ["suzy", "jer\\"maine"], "person": {"age": 39}}',
+        '{"names": [], "person": {"age": 1, "hair_color": "red", "job": "x"}}',
+    ]
+    chunks = [AIMessageChunk(content="")]
+    for start in range(0, max(len(arg) for arg in args), 5):
+        chunks.extend(
+            AIMessageChunk(
+                content="",
+                tool_call_chunks=[
+                    ToolCallChunk(
+                        name="NameCollector" if start == 0 else None,
+                        args=arg[start : start + 5],
+                        id=f"call_{index}" if start == 0 else None,
+                        index=index,
+                    )
+                ],
+            )
+            for index, arg in enumerate(args)
+            if start < len(arg)
+        )
+    return chunks
+
+
+@pytest.mark.parametrize(
+    "parser",
+    [
+        JsonOutputToolsParser(),
+        JsonOutputToolsParser(return_id=True, first_tool_only=True),
+        JsonOutputKeyToolsParser(key_name="NameCollector"),
+        PydanticToolsParser(tools=[NameCollector]),
+    ],
+)
+def test_partial_tools_parser_matches_accumulated_message(
+    parser: JsonOutputToolsParser,
+) -> None:
+    chunks = _interleaved_tool_call_chunks()
+    expected: list[Any] = []
+    accumulated = None
+    for chunk in chunks:
+        accumulated = chunk if accumulated is None else accumulated + chunk
+        parsed = parser.parse_result(
+            [ChatGeneration(message=accumulated)], partial=True
+        )
+        if parsed is not None and (not expected or parsed != expected[-1]):
+            expected.append(parsed)
+
+    assert list(parser.transform(iter(chunks))) == expected
+
+
 def test_parse_with_different_pydantic_2_v1() -> None:
     """Test with pydantic.v1.BaseModel from pydantic 2."""
 
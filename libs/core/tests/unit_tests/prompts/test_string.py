@@ -1,7 +1,15 @@
 import pytest
 from packaging import version
 
-from langchain_core.prompts.string import mustache_schema
+from langchain_core.prompts.string import (
+    DEFAULT_FORMATTER_MAPPING,
+    _compile_jinja2,
+    get_template_variables,
+    mustache_formatter,
+    mustache_schema,
+)
+from langchain_core.utils import mustache
+from langchain_core.utils.formatting import formatter
 from langchain_core.utils.pydantic import PYDANTIC_VERSION
 
 PYDANTIC_VERSION_AT_LEAST_29 = version.parse("2.9") <= PYDANTIC_VERSION
@@ -30,3 +38,85 @@ def test_mustache_schema_parent_child() -> None:
     }
     actual = mustache_schema(template).model_json_schema()
     assert expected == actual
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "Hello {name}!",
+        "{name!r} is {age:>5} and {{escaped}}",
+        "{value:.2f} and {value!s:^10}",
+        "{name:{width}}",
+        "{0} and {}",
+    ],
+)
+def test_f_string_formatter_matches_strict_formatter(template: str) -> None:
+    kwargs = {"name": "Bob", "age": 42, "value": 3.14159, "width": 8}
+    f_string_formatter = DEFAULT_FORMATTER_MAPPING["f-string"]
+    try:
+        expected: str | type[Exception] = formatter.format(template, **kwargs)
+    except (IndexError, KeyError) as e:
+        expected = type(e)
+    if isinstance(expected, str):
+        assert f_string_formatter(template, **kwargs) == expected
+    else:
+        with pytest.raises(expected):
+            f_string_formatter(template, **kwargs)
+
+
+def test_f_string_formatter_missing_variable() -> None:
+    with pytest.raises(KeyError, match="name"):
+        DEFAULT_FORMATTER_MAPPING["f-string"]("Hello {name}!", other="x")
+
+
+def test_jinja2_templates_are_compiled_once() -> None:
+    pytest.importorskip("jinja2")
+    template = "Hello {{ name }}, the compiled template is reused!"
+    jinja2_formatter = DEFAULT_FORMATTER_MAPPING["jinja2"]
+
+    assert jinja2_formatter(template, name="Bob") == (
+        "Hello Bob, the compiled template is reused!"
+    )
+    hits = _compile_jinja2.cache_info().hits
+    assert jinja2_formatter(template, name="Alice") == (
+        "Hello Alice, the compiled template is reused!"
+    )
+    assert _compile_jinja2.cache_info().hits == hits + 1
+
+
+def test_mustache_templates_are_tokenized_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = 0
+    tokenize = mustache.tokenize
+
+    def counting_tokenize(*args: object, **kwargs: object) -> object:
+        nonlocal calls
+        calls += 1
+        return tokenize(*args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(mustache, "tokenize", counting_tokenize)
+    template = "Hi {{name}}{{#items}} {{.}}{{/items}}, tokenized once!"
+
+    for name in ("Bob", "Alice"):
+        assert mustache_formatter(template, name=name, items=[1, 2]) == (
+            f"Hi {name} 1 2, tokenized once!"
+        )
+    assert calls == 1
+
+
+def test_mustache_lambda_token_cache_is_bounded() -> None:
+    def upper(text: str, _render: object) -> str:
+        return text.upper()
+
+    for i in range(mustache._TOKEN_CACHE_SIZE + 10):
+        assert mustache_formatter(f"{{{{#upper}}}}{i}{{{{/upper}}}}", upper=upper) == (
+            str(i)
+        )
+    assert len(mustache.g_token_cache) <= mustache._TOKEN_CACHE_SIZE
+
+
+def test_get_template_variables_returns_a_new_list() -> None:
+    variables = get_template_variables("{a} {b}", "f-string")
+    variables.append("c")
+    assert get_template_variables("{a} {b}", "f-string") == ["a", "b"]
@@ -1,13 +1,21 @@
 """Test concurrency behavior of batch and async batch operations."""
 
 import asyncio
+import threading
 import time
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables import (
+    ExecutorPool,
+    RunnableConfig,
+    RunnableLambda,
+    RunnableParallel,
+    get_executor_pool,
+    set_default_executor_pool,
+)
 
 if TYPE_CHECKING:
     from langchain_core.runnables.base import Runnable
@@ -143,3 +151,79 @@ def test_batch_as_completed_concurrency() -> None:
 
     assert len(results) == num_tasks
     assert max_running_tasks <= max_concurrency
+
+
+def test_batch_concurrency_with_executor_pool() -> None:
+    """Test that batch in a shared pool respects max_concurrency."""
+    running_tasks = 0
+    max_running_tasks = 0
+    thread_names = set()
+
+    lock = Lock()
+
+    def tracked_function(x: Any) -> str:
+        nonlocal running_tasks, max_running_tasks
+        with lock:
+            running_tasks += 1
+            max_running_tasks = max(max_running_tasks, running_tasks)
+            thread_names.add(threading.current_thread().name)
+
+        time.sleep(0.05)  # Simulate work
+
+        with lock:
+            running_tasks -= 1
+
+        return f"Completed {x}"
+
+    runnable: Runnable = RunnableLambda(tracked_function)
+    pool = ExecutorPool(max_workers=8, thread_name_prefix="test-pool")
+    config = RunnableConfig(max_concurrency=3, executor_pool=pool)
+
+    results = runnable.batch(list(range(10)), config=config)
+    assert results == [f"Completed {x}" for x in range(10)]
+    results = [
+        result for _, result in runnable.batch_as_completed([0, 1, 2], config=config)
+    ]
+    assert sorted(results) == [f"Completed {x}" for x in range(3)]
+
+    assert max_running_tasks == 3
+    assert all(name.startswith("test-pool") for name in thread_names)
+    assert pool.stats() == {"max_workers": 8, "active": 0, "queued": 0, "rejected": 0}
+    pool.shutdown()
+
+
+def test_nested_batch_with_executor_pool() -> None:
+    """Test that nested batches don't deadlock a pool with few workers."""
+    pool = ExecutorPool(max_workers=2)
+    inner = RunnableLambda(lambda x: x * 2)
+
+    def outer(x: int) -> list[int]:
+        time.sleep(0.01)
+        return inner.batch([x, x + 1, x + 2])
+
+    runnable = RunnableLambda(outer) | RunnableParallel(
+        total=lambda xs: sum(xs), first=lambda xs: xs[0]
+    )
+    results = runnable.batch(list(range(6)), {"executor_pool": pool})
+
+    assert results == [{"total": 6 * x + 6, "first": 2 * x} for x in range(6)]
+    assert pool.stats()["rejected"] > 0
+    pool.shutdown()
+
+
+def test_default_executor_pool() -> None:
+    pool = get_executor_pool("test-default", max_workers=4)
+    assert get_executor_pool("test-default") is pool
+    thread_names = []
+
+    def record_thread(_: Any) -> None:
+        thread_names.append(threading.current_thread().name)
+
+    set_default_executor_pool(pool)
+    try:
+        RunnableParallel(a=record_thread, b=record_thread).invoke(None)
+    finally:
+        set_default_executor_pool(None)
+
+    assert len(thread_names) == 2
+    assert all(name.startswith("langchain-test-default") for name in thread_names)
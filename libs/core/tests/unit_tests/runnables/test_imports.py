@@ -20,6 +20,7 @@ EXPECTED_ALL = [
     "RunnableGenerator",
     "RunnableLambda",
     "RunnableMap",
+    "RunnableMicroBatcher",
     "RunnableParallel",
     "RunnablePassthrough",
     "RunnableAssign",
@@ -28,6 +29,9 @@ EXPECTED_ALL = [
     "RunnableWithFallbacks",
     "RunnableWithMessageHistory",
     "get_config_list",
+    "ExecutorPool",
+    "get_executor_pool",
+    "set_default_executor_pool",
     "aadd",
     "add",
 ]
@@ -0,0 +1,241 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from typing_extensions import override
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import (
+    Runnable,
+    RunnableConfig,
+    RunnableLambda,
+    RunnableMicroBatcher,
+)
+
+
+class _BatchRecorder(Runnable[int, int]):
+    """Doubles its inputs and records the size of each batch."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.batch_sizes: list[int] = []
+
+    @staticmethod
+    def _double(input_: int) -> int:
+        if input_ < 0:
+            msg = f"negative input: {input_}"
+            raise ValueError(msg)
+        return input_ * 2
+
+    @override
+    def invoke(
+        self, input: int, config: RunnableConfig | None = None, **kwargs: Any
+    ) -> int:
+        return self._call_with_config(self._double, input, config)
+
+    @override
+    def batch(
+        self,
+        inputs: list[int],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        self.batch_sizes.append(len(inputs))
+        time.sleep(self.delay)
+        return super().batch(
+            inputs, config, return_exceptions=return_exceptions, **kwargs
+        )
+
+    @override
+    async def abatch(
+        self,
+        inputs: list[int],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[Any]:
+        self.batch_sizes.append(len(inputs))
+        await asyncio.sleep(self.delay)
+        return await super().abatch(
+            inputs, config, return_exceptions=return_exceptions, **kwargs
+        )
+
+
+class _RootInputCollector(BaseCallbackHandler):
+    def __init__(self) -> None:
+        self.inputs: list[Any] = []
+
+    @override
+    def on_chain_start(
+        self, serialized: dict[str, Any], inputs: Any, **kwargs: Any
+    ) -> None:
+        if kwargs.get("parent_run_id") is None:
+            self.inputs.append(inputs)
+
+
+def test_micro_batcher_coalesces_concurrent_invokes() -> None:
+    recorder = _BatchRecorder(delay=0.01)
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=recorder, max_batch_size=8, max_wait=1
+    )
+    barrier = threading.Barrier(16)
+
+    def call(i: int) -> int:
+        barrier.wait()
+        return batched.invoke(i)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        outputs = list(executor.map(call, range(16)))
+
+    assert outputs == [i * 2 for i in range(16)]
+    assert recorder.batch_sizes == [8, 8]
+
+    stats = batched.stats()
+    assert sum(size * count for size, count in stats["batch_sizes"].items()) == 16
+    assert sum(stats["queue_depths"].values()) == 16
+    assert max(stats["queue_depths"]) > 1
+    assert stats["batch_size_limit"] == 8
+    assert stats["mean_latency"] is not None
+
+
+def test_micro_batcher_single_invoke() -> None:
+    recorder = _BatchRecorder()
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=recorder, max_wait=0.001
+    )
+
+    assert batched.invoke(3) == 6
+    assert recorder.batch_sizes == [1]
+
+
+def test_micro_batcher_exceptions_and_callbacks_are_per_call() -> None:
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=_BatchRecorder(), max_batch_size=4, max_wait=0.05
+    )
+    handlers = [_RootInputCollector() for _ in range(4)]
+
+    def call(i: int) -> int | Exception:
+        try:
+            return batched.invoke(i if i != 2 else -1, {"callbacks": [handlers[i]]})
+        except ValueError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outputs = list(executor.map(call, range(4)))
+
+    assert outputs[0] == 0
+    assert outputs[1] == 2
+    assert isinstance(outputs[2], ValueError)
+    assert outputs[3] == 6
+    assert [handler.inputs for handler in handlers] == [[0], [1], [-1], [3]]
+
+
+def test_micro_batcher_batch_error_reaches_all_calls() -> None:
+    def fail(*_: Any, **__: Any) -> list[int]:
+        msg = "batch failed"
+        raise RuntimeError(msg)
+
+    bound = RunnableLambda(lambda x: x)
+    bound.batch = fail  # type: ignore[method-assign]
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=bound, max_batch_size=2, max_wait=0.05
+    )
+
+    def call(i: int) -> str:
+        try:
+            batched.invoke(i)
+        except RuntimeError as e:
+            return str(e)
+        return "ok"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(call, range(2))) == ["batch failed"] * 2
+
+
+def test_micro_batcher_adapts_batch_size() -> None:
+    recorder = _BatchRecorder(delay=0.3)
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=recorder, max_batch_size=8, max_wait=0.001, target_latency=0.15
+    )
+
+    batched.invoke(1)
+    assert batched.batch_size_limit == 4
+
+    recorder.delay = 0.0
+    batched.invoke(1)
+    assert batched.batch_size_limit == 4
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(batched.invoke, range(4)))
+    assert batched.stats()["batch_size_limit"] >= 4
+
+
+async def test_micro_batcher_ainvoke() -> None:
+    recorder = _BatchRecorder(delay=0.01)
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=recorder, max_batch_size=8, max_wait=0.05
+    )
+    handlers = [_RootInputCollector() for _ in range(20)]
+
+    outputs = await asyncio.gather(
+        *(batched.ainvoke(i, {"callbacks": [handlers[i]]}) for i in range(20)),
+        batched.ainvoke(-1),
+        return_exceptions=True,
+    )
+
+    assert outputs[:20] == [i * 2 for i in range(20)]
+    assert isinstance(outputs[20], ValueError)
+    assert recorder.batch_sizes == [8, 8, 5]
+    assert [handler.inputs for handler in handlers] == [[i] for i in range(20)]
+    assert batched.stats()["queue_depths"] == {
+        1: 3,
+        2: 3,
+        3: 3,
+        4: 3,
+        5: 3,
+        6: 2,
+        7: 2,
+        8: 2,
+    }
+
+
+async def test_micro_batcher_ainvoke_flushes_after_max_wait() -> None:
+    recorder = _BatchRecorder()
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=recorder, max_batch_size=8, max_wait=0.01
+    )
+
+    assert await batched.ainvoke(2) == 4
+    assert list(await asyncio.gather(batched.ainvoke(1), batched.ainvoke(2))) == [
+        2,
+        4,
+    ]
+    assert recorder.batch_sizes == [1, 2]
+
+
+def test_micro_batcher_kwargs_are_not_batched() -> None:
+    recorder = _BatchRecorder()
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(bound=recorder)
+
+    assert batched.invoke(2, extra=True) == 4
+    assert recorder.batch_sizes == []
+
+
+@pytest.mark.parametrize("max_batch_size", [1, 3])
+def test_micro_batcher_many_threads(max_batch_size: int) -> None:
+    recorder = _BatchRecorder()
+    batched: RunnableMicroBatcher[int, int] = RunnableMicroBatcher(
+        bound=recorder, max_batch_size=max_batch_size, max_wait=0.001
+    )
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        outputs = list(executor.map(batched.invoke, range(200)))
+
+    assert outputs == [i * 2 for i in range(200)]
+    assert max(recorder.batch_sizes) <= max_batch_size
@@ -1,9 +1,12 @@
 import asyncio
+import copy
 import re
 import sys
+import threading
 import time
 import uuid
 import warnings
+from collections import Counter
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from functools import partial
 from operator import itemgetter
@@ -5455,6 +5458,214 @@ async def test_astream_log_deep_copies() -> None:
     }
 
 
+def _strip_run_log_ids(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _strip_run_log_ids(item)
+            for key, item in value.items()
+            if key not in {"id", "start_time", "end_time"}
+        }
+    if isinstance(value, list):
+        return [_strip_run_log_ids(item) for item in value]
+    if isinstance(value, BaseMessage):
+        return value.model_copy(update={"id": None})
+    return value
+
+
+async def test_astream_log_structural_sharing() -> None:
+    prompt = ChatPromptTemplate.from_messages(
+        [("system", "Context: {context}"), ("human", "{question}")]
+    )
+    chain = (
+        RunnableLambda(lambda x: {"context": x * 3, "question": x})
+        | prompt
+        | FakeListChatModel(responses=["the answer is forty two"])
+        | StrOutputParser()
+    )
+
+    expected = [
+        _strip_run_log_ids(log.state)
+        async for log in chain.astream_log("why?", diff=False)
+    ]
+
+    logs = []
+    snapshots = []
+    async for log in chain.astream_log("why?", diff=False, structural_sharing=True):
+        logs.append(log)
+        snapshots.append(copy.deepcopy(log.state))
+    # Earlier states are not modified by later patches.
+    assert [log.state for log in logs] == snapshots
+    assert [_strip_run_log_ids(log.state) for log in logs] == expected
+    assert (
+        logs[-1].state["logs"]["ChatPromptTemplate"]
+        is logs[-2].state["logs"]["ChatPromptTemplate"]
+    )
+
+    patches = [
+        patch async for patch in chain.astream_log("why?", structural_sharing=True)
+    ]
+    state = cast("RunLog", sum(patches, RunLog(state=None)))  # type: ignore[arg-type]
+    assert _strip_run_log_ids(state.state) == expected[-1]
+
+
+async def test_astream_log_omit_paths() -> None:
+    chain = RunnableLambda(lambda x: x * 2) | RunnableLambda(lambda x: x + 1)
+
+    state = None
+    async for patch in chain.astream_log(
+        3, omit_paths=["/logs/*/streamed_output", "/logs/*/inputs"]
+    ):
+        state = patch if state is None else state + patch
+    state = cast("RunLog", state)
+
+    assert state.state["final_output"] == 7
+    assert state.state["streamed_output"] == [7]
+    for entry in state.state["logs"].values():
+        assert "streamed_output" not in entry
+        assert "inputs" not in entry
+        assert entry["final_output"] is not None
+
+    patches = [
+        patch async for patch in chain.astream_log(3, omit_paths=["/final_output"])
+    ]
+    assert all(
+        not op["path"].startswith("/final_output")
+        for patch in patches
+        for op in patch.ops
+    )
+
+
+def test_sequence_pipelined_batch() -> None:
+    release_slow = threading.Event()
+    finished: list[int] = []
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def retrieve(x: int) -> int:
+        if x == 0:
+            # The slow input can't finish until all the others have.
+            release_slow.wait(5)
+        return x
+
+    def generate(x: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+            finished.append(x)
+            if len(finished) == 5:
+                release_slow.set()
+        if x == 3:
+            msg = "boom"
+            raise ValueError(msg)
+        return x * 10
+
+    chain: RunnableSequence[int, int] = RunnableSequence(
+        RunnableLambda(retrieve), RunnableLambda(generate)
+    )
+    pipelined = chain.pipelined([None, 2])
+    assert pipelined.get_name() == chain.get_name()
+
+    class RootRunHandler(BaseCallbackHandler):
+        def __init__(self) -> None:
+            self.ended: list[Any] = []
+            self.errors: list[BaseException] = []
+            self.children: list[UUID] = []
+
+        @override
+        def on_chain_start(self, *args: Any, **kwargs: Any) -> None:
+            if kwargs.get("parent_run_id") is not None:
+                self.children.append(kwargs["parent_run_id"])
+
+        @override
+        def on_chain_end(self, outputs: Any, **kwargs: Any) -> None:
+            if kwargs.get("parent_run_id") is None:
+                self.ended.append(outputs)
+
+        @override
+        def on_chain_error(self, error: BaseException, **kwargs: Any) -> None:
+            if kwargs.get("parent_run_id") is None:
+                self.errors.append(error)
+
+    handler = RootRunHandler()
+    outputs = pipelined.batch(
+        list(range(6)), {"callbacks": [handler]}, return_exceptions=True
+    )
+
+    assert outputs[:3] == [0, 10, 20]
+    assert isinstance(outputs[3], ValueError)
+    assert outputs[4:] == [40, 50]
+    assert finished[-1] == 0
+    assert max_running == 2
+    assert sorted(handler.ended) == [0, 10, 20, 40, 50]
+    assert handler.errors == [outputs[3]]
+    # Each root run has a child run per step.
+    assert sorted(Counter(handler.children).values()) == [2] * 6
+
+    with pytest.raises(ValueError, match="Got 3 concurrency limits"):
+        chain.pipelined([1, 2, 3])
+    for limit in (0, -1):
+        with pytest.raises(ValueError, match="positive integers"):
+            chain.pipelined([None, limit])
+
+
+async def test_sequence_pipelined_abatch() -> None:
+    async def retrieve(x: int) -> int:
+        await asyncio.sleep(0.2 if x == 0 else 0)
+        return x
+
+    finished: list[int] = []
+
+    async def generate(x: int) -> int:
+        await asyncio.sleep(0.01)
+        finished.append(x)
+        return x * 10
+
+    chain: RunnableSequence[int, int] = RunnableSequence(
+        RunnableLambda(retrieve), RunnableLambda(generate)
+    )
+    pipelined = chain.pipelined([None, 1])
+
+    assert await pipelined.abatch(list(range(4))) == [0, 10, 20, 30]
+    assert finished == [1, 2, 3, 0]
+    results = [item async for item in pipelined.abatch_as_completed([0, 1])]
+    assert results == [(1, 10), (0, 0)]
+
+
+def test_sequence_pipelined_stream() -> None:
+    def gen(chunks: Iterator[str]) -> Iterator[str]:
+        for chunk in chunks:
+            yield from chunk
+
+    chain: RunnableSequence[int, str] = RunnableSequence(
+        RunnableLambda(lambda x: "ab" * x), RunnableGenerator(gen)
+    )
+    pipelined = chain.pipelined()
+
+    assert list(pipelined.stream(3)) == list(chain.stream(3)) == ["a", "b"] * 3
+    assert list(pipelined.transform(iter([2]))) == ["a", "b"] * 2
+
+
+async def test_sequence_pipelined_astream() -> None:
+    async def gen(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+        async for chunk in chunks:
+            for char in chunk:
+                yield char
+
+    chain: RunnableSequence[int, str] = RunnableSequence(
+        RunnableLambda(lambda x: "ab" * x), RunnableGenerator(gen)
+    )
+    pipelined = chain.pipelined()
+
+    expected = [chunk async for chunk in chain.astream(3)]
+    assert [chunk async for chunk in pipelined.astream(3)] == expected
+    assert expected == ["a", "b"] * 3
+
+
 def test_transform_of_runnable_lambda_with_dicts() -> None:
     """Test transform of runnable lamdbda."""
     runnable = RunnableLambda(lambda x: x)
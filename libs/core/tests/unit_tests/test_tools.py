@@ -3345,3 +3345,82 @@ async def test_tool_call_id_passed_via_run_method(method: str) -> None:
     assert handler.tool_starts == 1
     assert len(handler.captured_tool_call_ids) == 1
     assert handler.captured_tool_call_ids[0] == "run_method_tool_call_id"
+
+
+def test_tool_schemas_are_cached() -> None:
+    @tool
+    def search(query: str, limit: int = 10) -> str:
+        """Search for a query."""
+        return query
+
+    schema = search.tool_call_schema
+    assert search.tool_call_schema is schema
+    assert search.args == {
+        "query": {"title": "Query", "type": "string"},
+        "limit": {"default": 10, "title": "Limit", "type": "integer"},
+    }
+    search.args.clear()
+    search.args["query"]["title"] = "Changed"
+    assert search.args == {
+        "query": {"title": "Query", "type": "string"},
+        "limit": {"default": 10, "title": "Limit", "type": "integer"},
+    }
+
+    search.description = "Search the web."
+    assert search.tool_call_schema is not schema
+    assert _schema(search.tool_call_schema)["description"] == "Search the web."
+
+
+def test_convert_to_openai_tool_is_cached_per_tool() -> None:
+    class SearchInput(BaseModel):
+        query: str
+
+    @tool
+    def search(query: str, limit: int = 10) -> str:
+        """Search for a query."""
+        return query
+
+    formatted = convert_to_openai_tool(search)
+    formatted["function"]["parameters"]["properties"].clear()
+    assert convert_to_openai_tool(search) == {
+        "type": "function",
+        "function": {
+            "name": "search",
+            "description": "Search for a query.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"default": 10, "type": "integer"},
+                },
+                "required": ["query"],
+            },
+        },
+    }
+
+    search.args_schema = SearchInput
+    assert convert_to_openai_tool(search)["function"]["parameters"] == {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"],
+    }
+
+    renamed = search.model_copy(update={"name": "web_search"})
+    assert convert_to_openai_tool(renamed)["function"]["name"] == "web_search"
+    assert convert_to_openai_tool(search)["function"]["name"] == "search"
+
+
+def test_injected_tool_call_id_is_cached_per_schema() -> None:
+    @tool
+    def echo(x: str, call_id: Annotated[str, InjectedToolCallId]) -> str:
+        """Echo the input."""
+        return f"{x}:{call_id}"
+
+    for call_id in ("1", "2"):
+        result = echo.invoke(
+            {"type": "tool_call", "id": call_id, "name": "echo", "args": {"x": "a"}}
+        )
+        assert result.content == f"a:{call_id}"
+
+    with pytest.raises(ValueError, match="InjectedToolCallId"):
+        echo.invoke({"x": "a"})
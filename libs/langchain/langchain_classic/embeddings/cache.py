@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import struct
 import uuid
 import warnings
 from collections.abc import Callable, Sequence
@@ -22,6 +23,13 @@ from langchain_core.utils.iter import batch_iterate
 
 from langchain_classic.storage.encoder_backed import EncoderBackedStore
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
 NAMESPACE_UUID = uuid.UUID(int=1985)
 
 
@@ -80,9 +88,42 @@ def _value_serializer(value: Sequence[float]) -> bytes:
 
 def _value_deserializer(serialized_value: bytes) -> list[float]:
     """Deserialize a value."""
+    if serialized_value[:1] in _BINARY_DTYPES:
+        return _binary_value_deserializer(serialized_value)
     return cast("list[float]", json.loads(serialized_value.decode()))
 
 
+# Binary values start with their `struct` format character, which can't start a
+# JSON array, followed by the little-endian floats.
+_BINARY_FORMATS = {"float32": b"f", "float16": b"e"}
+_BINARY_DTYPES = {b"f": "<f4", b"e": "<f2"}
+
+
+def _make_binary_value_serializer(
+    value_format: Literal["float32", "float16"],
+) -> Callable[[Sequence[float]], bytes]:
+    """Create a serializer that packs a value into float32 or float16 bytes."""
+    tag = _BINARY_FORMATS[value_format]
+
+    def _binary_value_serializer(value: Sequence[float]) -> bytes:
+        return tag + struct.pack(f"<{len(value)}{tag.decode()}", *value)
+
+    return _binary_value_serializer
+
+
+def _binary_value_deserializer(serialized_value: bytes) -> list[float]:
+    """Deserialize a value packed by a binary value serializer."""
+    tag = serialized_value[:1]
+    if _HAS_NUMPY:
+        return cast(
+            "list[float]",
+            np.frombuffer(serialized_value, _BINARY_DTYPES[tag], offset=1).tolist(),
+        )
+    value_format = tag.decode()
+    count = (len(serialized_value) - 1) // struct.calcsize(value_format)
+    return list(struct.unpack_from(f"<{count}{value_format}", serialized_value, 1))
+
+
 # The warning is global; track emission, so it appears only once.
 _warned_about_sha1: bool = False
 
@@ -295,6 +336,7 @@ class CacheBackedEmbeddings(Embeddings):
         query_embedding_cache: bool | ByteStore = False,
         key_encoder: Callable[[str], str]
         | Literal["sha1", "blake2b", "sha256", "sha512"] = "sha1",
+        value_format: Literal["json", "float32", "float16"] = "json",
     ) -> CacheBackedEmbeddings:
         """On-ramp that adds the necessary serialization and encoding to the store.
 
@@ -321,6 +363,14 @@ class CacheBackedEmbeddings(Embeddings):
                 just creating a new cache, to avoid (the potential for)
                 collisions with existing keys or having duplicate keys
                 for the same text in the cache.
+            value_format: How embeddings are written to the cache.
+                * `'json'` - JSON lists of floats
+                * `'float32'` - packed float32 values, about 5x smaller than JSON
+                * `'float16'` - packed float16 values, half the size of float32
+                  at lower precision
+
+                Values in any of these formats can be read, so the format of an
+                existing cache can be changed.
 
         Returns:
             An instance of CacheBackedEmbeddings that uses the provided cache.
@@ -344,10 +394,15 @@ class CacheBackedEmbeddings(Embeddings):
             )
             raise ValueError(msg)  # noqa: TRY004
 
+        value_serializer = (
+            _value_serializer
+            if value_format == "json"
+            else _make_binary_value_serializer(value_format)
+        )
         document_embedding_store = EncoderBackedStore[str, list[float]](
             document_embedding_cache,
             key_encoder,
-            _value_serializer,
+            value_serializer,
             _value_deserializer,
         )
         if query_embedding_cache is True:
@@ -358,7 +413,7 @@ class CacheBackedEmbeddings(Embeddings):
             query_embedding_store = EncoderBackedStore[str, list[float]](
                 query_embedding_cache,
                 key_encoder,
-                _value_serializer,
+                value_serializer,
                 _value_deserializer,
             )
 
@@ -0,0 +1,262 @@
+"""Byte store that packs values into a few append-only segment files.
+
+The root directory holds segment files named `00000000.seg`, `00000001.seg`, and so
+on. Each segment is a sequence of records: a header with the little-endian 32-bit
+lengths of the key and of the value, the UTF-8 encoded key, then the value. A value
+length of `0xFFFFFFFF` marks a deleted key and is not followed by a value. Records
+are only ever appended, so the latest record of a key wins; opening a store replays
+the segments in order and drops an incomplete record left by an interrupted write.
+
+Overwritten and deleted values stay on disk until `PackedFileStore.compact` rewrites
+the live values into new segments. Call it when `PackedFileStore.dead_bytes` is a
+large share of the store, e.g. after bulk overwrites or deletes. Compaction holds
+the store lock while it copies every live value, so run it periodically rather than
+after each write.
+"""
+
+import struct
+import threading
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+
+from langchain_core.stores import ByteStore
+
+# Each record is a header with the key and value lengths, followed by the key and
+# the value. Deleted keys are recorded with a tombstone value length.
+_HEADER = struct.Struct("<II")
+_TOMBSTONE = 0xFFFFFFFF
+_SEGMENT_SUFFIX = ".seg"
+# Values in the same segment that are closer than this are fetched with one read.
+_MAX_READ_GAP = 64 * 1024
+
+
+class PackedFileStore(ByteStore):
+    """`BaseStore` interface that packs values into append-only segment files.
+
+    `LocalFileStore` writes every value to its own file, which is slow for caches
+    with many small values such as embeddings. This store appends values to a few
+    large segment files instead, and keeps an in-memory index from each key to the
+    position of its latest value. `mset` appends all values with a single write,
+    and `mget` reads neighbouring values of a segment with a single read.
+
+    Overwritten and deleted values keep using disk space until `compact` rewrites
+    the live values into new segments. The store can be shared between threads,
+    but not between processes.
+
+    Examples:
+        ```python
+        from langchain_classic.storage import PackedFileStore
+
+        store = PackedFileStore("/path/to/root")
+
+        store.mset([("key1", b"value1"), ("key2", b"value2")])
+        values = store.mget(["key1", "key2"])  # Returns [b"value1", b"value2"]
+
+        store.mdelete(["key1"])
+        store.compact()
+        ```
+    """
+
+    def __init__(
+        self,
+        root_path: str | Path,
+        *,
+        max_segment_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        """Open or create a packed file store.
+
+        Args:
+            root_path: The directory holding the segment files.
+            max_segment_size: The size in bytes after which new values are written to
+                a new segment.
+        """
+        self.root_path = Path(root_path).absolute()
+        self.max_segment_size = max_segment_size
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        # Key -> (segment, offset, length) of its latest value.
+        self._index: dict[str, tuple[int, int, int]] = {}
+        self._dead_bytes = 0
+        self._segments: list[int] = []
+        self._active_size = 0
+        self._load()
+
+    @property
+    def dead_bytes(self) -> int:
+        """The number of bytes taken by overwritten and deleted values."""
+        return self._dead_bytes
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.root_path / f"{segment:08d}{_SEGMENT_SUFFIX}"
+
+    def _load(self) -> None:
+        """Build the index by replaying the segments in order."""
+        self._segments = sorted(
+            int(path.stem)
+            for path in self.root_path.glob(f"*{_SEGMENT_SUFFIX}")
+            if path.stem.isdigit()
+        )
+        for segment in self._segments:
+            data = self._segment_path(segment).read_bytes()
+            offset = 0
+            while offset + _HEADER.size <= len(data):
+                key_length, value_length = _HEADER.unpack_from(data, offset)
+                key_end = offset + _HEADER.size + key_length
+                end = key_end + (0 if value_length == _TOMBSTONE else value_length)
+                if end > len(data):
+                    break
+                key = data[offset + _HEADER.size : key_end].decode("utf-8")
+                self._discard(key)
+                if value_length == _TOMBSTONE:
+                    self._dead_bytes += end - offset
+                else:
+                    self._index[key] = (segment, key_end, value_length)
+                offset = end
+            if offset < len(data):
+                # A write was interrupted; drop the incomplete record.
+                with self._segment_path(segment).open("r+b") as f:
+                    f.truncate(offset)
+            self._active_size = offset
+        if not self._segments:
+            self._segments.append(0)
+            self._active_size = 0
+
+    def _discard(self, key: str) -> None:
+        location = self._index.pop(key, None)
+        if location is not None:
+            self._dead_bytes += _HEADER.size + len(key.encode("utf-8")) + location[2]
+
+    def _append(self, records: list[tuple[str, bytes | None]]) -> None:
+        """Append records to the active segment with a single write."""
+        if not records:
+            return
+        buffer = bytearray()
+        offsets = []
+        for key, value in records:
+            encoded_key = key.encode("utf-8")
+            value_length = _TOMBSTONE if value is None else len(value)
+            buffer += _HEADER.pack(len(encoded_key), value_length)
+            buffer += encoded_key
+            offsets.append(len(buffer))
+            if value is not None:
+                buffer += value
+        if (
+            self._active_size
+            and self._active_size + len(buffer) > self.max_segment_size
+        ):
+            self._segments.append(self._segments[-1] + 1)
+            self._active_size = 0
+        segment = self._segments[-1]
+        with self._segment_path(segment).open("ab") as f:
+            f.write(buffer)
+        for (key, value), offset in zip(records, offsets, strict=True):
+            self._discard(key)
+            if value is None:
+                self._dead_bytes += _HEADER.size + len(key.encode("utf-8"))
+            else:
+                self._index[key] = (segment, self._active_size + offset, len(value))
+        self._active_size += len(buffer)
+
+    def _read(
+        self, locations: Sequence[tuple[int, int, int] | None]
+    ) -> list[bytes | None]:
+        """Read the values at the given locations, one read per run of values."""
+        values: list[bytes | None] = [None] * len(locations)
+        by_segment: defaultdict[int, list[tuple[int, int, int]]] = defaultdict(list)
+        for i, location in enumerate(locations):
+            if location is not None:
+                segment, offset, length = location
+                by_segment[segment].append((offset, length, i))
+        for segment, entries in by_segment.items():
+            entries.sort()
+            with self._segment_path(segment).open("rb") as f:
+                start = 0
+                while start < len(entries):
+                    end = start + 1
+                    while (
+                        end < len(entries)
+                        and entries[end][0]
+                        - (entries[end - 1][0] + entries[end - 1][1])
+                        <= _MAX_READ_GAP
+                    ):
+                        end += 1
+                    first = entries[start][0]
+                    last = max(
+                        offset + length for offset, length, _ in entries[start:end]
+                    )
+                    f.seek(first)
+                    data = f.read(last - first)
+                    for offset, length, i in entries[start:end]:
+                        values[i] = data[offset - first : offset - first + length]
+                    start = end
+        return values
+
+    def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Get the values associated with the given keys.
+
+        Args:
+            keys: A sequence of keys.
+
+        Returns:
+            A sequence of optional values associated with the keys.
+            If a key is not found, the corresponding value will be `None`.
+        """
+        with self._lock:
+            return self._read([self._index.get(key) for key in keys])
+
+    def mset(self, key_value_pairs: Sequence[tuple[str, bytes]]) -> None:
+        """Set the values for the given keys.
+
+        Args:
+            key_value_pairs: A sequence of key-value pairs.
+        """
+        with self._lock:
+            self._append(list(key_value_pairs))
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        """Delete the given keys and their associated values.
+
+        Args:
+            keys: A sequence of keys to delete.
+        """
+        with self._lock:
+            self._append(
+                [(key, None) for key in dict.fromkeys(keys) if key in self._index]
+            )
+
+    def yield_keys(self, prefix: str | None = None) -> Iterator[str]:
+        """Get an iterator over keys that match the given prefix.
+
+        Args:
+            prefix: The prefix to match.
+
+        Yields:
+            Keys that match the given prefix.
+        """
+        with self._lock:
+            keys = list(self._index)
+        for key in keys:
+            if prefix is None or key.startswith(prefix):
+                yield key
+
+    def compact(self) -> None:
+        """Rewrite the live values into new segments and remove the old segments.
+
+        The new segments are written before the old ones are removed, so an
+        interrupted compaction leaves the store with the same contents.
+        """
+        with self._lock:
+            old_segments = self._segments
+            self._segments = [old_segments[-1] + 1]
+            self._active_size = 0
+            by_segment: defaultdict[int, list[str]] = defaultdict(list)
+            for key, (segment, _, _) in self._index.items():
+                by_segment[segment].append(key)
+            for segment in old_segments:
+                keys = by_segment[segment]
+                values = self._read([self._index[key] for key in keys])
+                self._append(list(zip(keys, values, strict=True)))
+            for segment in old_segments:
+                self._segment_path(segment).unlink(missing_ok=True)
+            self._dead_bytes = 0
@@ -4,13 +4,14 @@ import contextlib
 import hashlib
 import importlib
 import warnings
+from typing import Literal
 
 import pytest
 from langchain_core.embeddings import Embeddings
 from typing_extensions import override
 
 from langchain_classic.embeddings import CacheBackedEmbeddings
-from langchain_classic.storage.in_memory import InMemoryStore
+from langchain_classic.storage.in_memory import InMemoryByteStore, InMemoryStore
 
 
 class MockEmbeddings(Embeddings):
@@ -251,3 +252,42 @@ def test_custom_encoder() -> None:
     cbe.embed_documents([txt])
 
     assert list(cbe.document_embedding_store.yield_keys()) == ["CUSTOM_X"]
+
+
+@pytest.mark.parametrize(
+    ("value_format", "size"), [("json", 6), ("float32", 9), ("float16", 5)]
+)
+def test_binary_value_format(
+    value_format: Literal["json", "float32", "float16"], size: int
+) -> None:
+    """Test that embeddings can be cached as packed floats."""
+    store = InMemoryByteStore()
+    cbe = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(), store, key_encoder="blake2b", value_format=value_format
+    )
+
+    assert cbe.embed_documents(["foo", "hello"]) == [[3.0, 4.0], [5.0, 6.0]]
+    (value,) = store.mget([hashlib.blake2b(b"foo").hexdigest()])
+    assert value is not None
+    assert len(value) == size
+    # Cached values are read back in any format.
+    for other_format in ("json", "float32", "float16"):
+        reader = CacheBackedEmbeddings.from_bytes_store(
+            MockEmbeddings(), store, key_encoder="blake2b", value_format=other_format
+        )
+        assert reader.document_embedding_store.mget(["foo", "hello"]) == [
+            [3.0, 4.0],
+            [5.0, 6.0],
+        ]
+
+
+def test_binary_value_format_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = importlib.import_module(CacheBackedEmbeddings.__module__)
+    monkeypatch.setattr(module, "_HAS_NUMPY", False)
+    store = InMemoryByteStore()
+    cbe = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(), store, key_encoder="blake2b", value_format="float32"
+    )
+    cbe.embed_documents(["foo"])
+
+    assert cbe.document_embedding_store.mget(["foo"]) == [[3.0, 4.0]]
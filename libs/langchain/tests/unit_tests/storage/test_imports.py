@@ -5,6 +5,7 @@ EXPECTED_ALL = [
     "InMemoryStore",
     "InMemoryByteStore",
     "LocalFileStore",
+    "PackedFileStore",
     "RedisStore",
     "InvalidKeyException",
     "create_lc_store",
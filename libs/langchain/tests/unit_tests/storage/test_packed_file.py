@@ -0,0 +1,101 @@
+import tempfile
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from langchain_classic.storage.packed_file import PackedFileStore
+
+
+@pytest.fixture
+def root_path() -> Generator[Path, None, None]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+def test_mset_and_mget(root_path: Path) -> None:
+    store = PackedFileStore(root_path)
+    store.mset([("key1", b"value1"), ("key2", b"value2"), ("key3", b"")])
+
+    assert store.mget(["key2", "missing", "key1", "key3"]) == [
+        b"value2",
+        None,
+        b"value1",
+        b"",
+    ]
+    # All values were appended to a single segment.
+    assert len(list(root_path.iterdir())) == 1
+
+
+def test_overwrite_and_mdelete(root_path: Path) -> None:
+    store = PackedFileStore(root_path)
+    store.mset([("key1", b"value1"), ("key2", b"value2")])
+    store.mset([("key1", b"new value")])
+    store.mdelete(["key2", "missing"])
+
+    assert store.mget(["key1", "key2"]) == [b"new value", None]
+    assert list(store.yield_keys()) == ["key1"]
+    assert store.dead_bytes > 0
+
+
+def test_reopen(root_path: Path) -> None:
+    store = PackedFileStore(root_path, max_segment_size=32)
+    store.mset([(f"key{i}", f"value{i}".encode()) for i in range(3)])
+    store.mset([("key0", b"new value")])
+    store.mdelete(["key1"])
+    store.mset([(f"other{i}", b"x" * 40) for i in range(3)])
+
+    reopened = PackedFileStore(root_path, max_segment_size=32)
+    assert sorted(reopened.yield_keys()) == sorted(store.yield_keys())
+    assert reopened.mget(["key0", "key1", "key2", "other2"]) == [
+        b"new value",
+        None,
+        b"value2",
+        b"x" * 40,
+    ]
+    assert reopened.dead_bytes == store.dead_bytes
+
+
+def test_reopen_drops_incomplete_record(root_path: Path) -> None:
+    store = PackedFileStore(root_path)
+    store.mset([("key1", b"value1"), ("key2", b"value2")])
+    (segment,) = root_path.iterdir()
+    segment.write_bytes(segment.read_bytes()[:-3])
+
+    reopened = PackedFileStore(root_path)
+    assert reopened.mget(["key1", "key2"]) == [b"value1", None]
+    reopened.mset([("key3", b"value3")])
+    assert PackedFileStore(root_path).mget(["key1", "key3"]) == [
+        b"value1",
+        b"value3",
+    ]
+
+
+def test_yield_keys_prefix(root_path: Path) -> None:
+    store = PackedFileStore(root_path)
+    store.mset([("a/key1", b"1"), ("b/key2", b"2"), ("a/key3", b"3")])
+
+    assert sorted(store.yield_keys(prefix="a/")) == ["a/key1", "a/key3"]
+
+
+def test_compact(root_path: Path) -> None:
+    store = PackedFileStore(root_path, max_segment_size=64)
+    for i in range(10):
+        store.mset([(f"key{i % 3}", f"value{i}".encode() * 4)])
+    store.mdelete(["key0"])
+    old_segments = set(root_path.iterdir())
+    expected = store.mget(["key0", "key1", "key2"])
+
+    store.compact()
+
+    assert store.dead_bytes == 0
+    assert not old_segments & set(root_path.iterdir())
+    assert store.mget(["key0", "key1", "key2"]) == expected
+    assert PackedFileStore(root_path).mget(["key0", "key1", "key2"]) == expected
+
+
+async def test_amget_and_amset(root_path: Path) -> None:
+    store = PackedFileStore(root_path)
+    await store.amset([("key1", b"value1")])
+
+    assert await store.amget(["key1", "key2"]) == [b"value1", None]
@@ -0,0 +1,285 @@
+"""In-memory index of a directory tree for the file search middleware."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse  # type: ignore[attr-defined]
+else:
+    import sre_parse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_TRIGRAM_LENGTH = 3
+
+# Approximate memory used by one trigram of one file: its entries in the inverted
+# index and in the file's own trigram set.
+_POSTING_BYTES = 64
+
+
+@dataclass
+class _FileEntry:
+    """Indexed state of a file."""
+
+    mtime_ns: int
+    size: int
+    trigrams: frozenset[str] | None
+    """Trigrams of the lowercased content, or `None` if the file is not indexed and
+    must always be searched."""
+
+
+@dataclass
+class _DirNode:
+    """Node of the path trie."""
+
+    dirs: dict[str, _DirNode] = field(default_factory=dict)
+    files: dict[str, _FileEntry] = field(default_factory=dict)
+
+
+def _trigrams(text: str) -> frozenset[str]:
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+def _required_literals(parsed: Any) -> list[str]:
+    """Get literal strings that any match of a parsed regex must contain.
+
+    Case-insensitive parts of the regex are ignored, since they may match characters
+    that don't lowercase to the literal.
+    """
+    literals: list[str] = []
+    run: list[str] = []
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if op is sre_parse.AT:
+            # Anchors don't consume characters
+            continue
+        literals.append("".join(run))
+        run = []
+        if op is sre_parse.SUBPATTERN:
+            _, add_flags, _, subpattern = av
+            if not add_flags & re.IGNORECASE:
+                literals.extend(_required_literals(subpattern))
+        elif op in {sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT} and av[0] >= 1:
+            literals.extend(_required_literals(av[2]))
+    literals.append("".join(run))
+    # Lowercasing non-ASCII text depends on context, so only ASCII literals can be
+    # looked up in the index of lowercased content.
+    return [
+        literal.lower()
+        for literal in literals
+        if len(literal) >= _TRIGRAM_LENGTH and literal.isascii()
+    ]
+
+
+class FileIndex:
+    """In-memory index of the files under a directory.
+
+    Keeps a trie of the file paths, used to match glob patterns without walking the
+    filesystem, and an inverted index from the trigrams of the lowercased content of
+    each file to the files, used to skip the files that can't match a regex.
+
+    The index is built on first use. Before each search, if `refresh_interval` has
+    elapsed, the modification time and size of every file are checked and changed
+    files are reindexed. Files that don't fit in the memory budget, or can't be
+    decoded, are not indexed and are always searched. Files larger than
+    `max_file_size_bytes` are matched by glob patterns, but are never searched.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        max_file_size_bytes: int,
+        max_memory_bytes: int,
+        refresh_interval: float = 0.0,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            root: Resolved root directory to index.
+            max_file_size_bytes: Files larger than this are not indexed or searched.
+            max_memory_bytes: Approximate memory budget of the trigram index.
+            refresh_interval: Minimum time, in seconds, between two checks of the
+                filesystem for changes.
+        """
+        self.root = root
+        self.max_file_size_bytes = max_file_size_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self.refresh_interval = refresh_interval
+        self._tree: _DirNode | None = None
+        self._postings: dict[str, set[str]] = {}
+        self._memory_bytes = 0
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+
+    def glob(self, base: Path, pattern: str) -> list[Path]:
+        """Get the files under `base` matching a glob pattern.
+
+        Args:
+            base: Resolved directory to match the pattern from.
+            pattern: Glob pattern with `pathlib` semantics.
+
+        Returns:
+            The matching files, without duplicates.
+        """
+        parts = [part for part in pattern.split("/") if part not in {"", "."}]
+        with self._lock:
+            node, prefix = self._find(base)
+            if node is None or not parts:
+                return []
+            matches = dict.fromkeys(self._glob(node, parts, prefix))
+        return [self.root / relative for relative in matches]
+
+    def candidates(self, base: Path, pattern: str) -> list[Path]:
+        """Get the files under `base` that may contain a match of a regex.
+
+        Args:
+            base: Resolved directory to search.
+            pattern: Valid regular expression.
+
+        Returns:
+            The files that contain every trigram required by the regex, and the
+                files that are not indexed, sorted by path. Files larger than
+                `max_file_size_bytes` are left out.
+        """
+        parsed = sre_parse.parse(pattern)
+        literals = [] if parsed.state.flags & re.IGNORECASE else _required_literals(parsed)
+        trigrams = {literal[i : i + 3] for literal in literals for i in range(len(literal) - 2)}
+
+        with self._lock:
+            node, prefix = self._find(base)
+            if node is None:
+                return []
+            required: set[str] | None = None
+            for trigram in sorted(trigrams, key=lambda t: len(self._postings.get(t, ()))):
+                postings = self._postings.get(trigram, set())
+                required = postings.copy() if required is None else required & postings
+                if not required:
+                    break
+            files = [
+                relative
+                for relative, entry in self._walk_files(node, prefix)
+                if entry.size <= self.max_file_size_bytes
+                and (required is None or entry.trigrams is None or relative in required)
+            ]
+        return [self.root / relative for relative in sorted(files)]
+
+    def _find(self, base: Path) -> tuple[_DirNode | None, str]:
+        """Refresh the index and find the node of a directory, with the lock held."""
+        if self._tree is None or time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self._refresh()
+        node = self._tree
+        relative = base.relative_to(self.root)
+        for name in relative.parts:
+            if node is None:
+                break
+            node = node.dirs.get(name)
+        prefix = "" if not relative.parts else relative.as_posix() + "/"
+        return node, prefix
+
+    def _glob(self, node: _DirNode, parts: list[str], prefix: str) -> Iterator[str]:
+        part, rest = parts[0], parts[1:]
+        if part == "**":
+            if rest:
+                yield from self._glob(node, rest, prefix)
+            else:
+                yield from (relative for relative, _ in self._walk_files(node, prefix))
+                return
+            for name, child in node.dirs.items():
+                yield from self._glob(child, parts, f"{prefix}{name}/")
+        elif rest:
+            for name, child in node.dirs.items():
+                if fnmatch.fnmatchcase(name, part):
+                    yield from self._glob(child, rest, f"{prefix}{name}/")
+        else:
+            for name in node.files:
+                if fnmatch.fnmatchcase(name, part):
+                    yield prefix + name
+
+    def _walk_files(self, node: _DirNode, prefix: str) -> Iterator[tuple[str, _FileEntry]]:
+        for name, entry in node.files.items():
+            yield prefix + name, entry
+        for name, child in node.dirs.items():
+            yield from self._walk_files(child, f"{prefix}{name}/")
+
+    def _refresh(self) -> None:
+        """Update the index to the current state of the filesystem."""
+        old_files = dict(self._walk_files(self._tree, "")) if self._tree else {}
+        self._tree = self._scan(self.root, "", old_files)
+        for relative, entry in old_files.items():
+            self._remove(relative, entry)
+        self._last_refresh = time.monotonic()
+
+    def _scan(self, directory: Path, prefix: str, old_files: dict[str, _FileEntry]) -> _DirNode:
+        """Build the trie of a directory, reusing the entries of unchanged files.
+
+        Entries that are reused or replaced are removed from `old_files`.
+        """
+        node = _DirNode()
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError:
+            return node
+        for dir_entry in entries:
+            relative = prefix + dir_entry.name
+            try:
+                if dir_entry.is_dir(follow_symlinks=False):
+                    node.dirs[dir_entry.name] = self._scan(
+                        directory / dir_entry.name, relative + "/", old_files
+                    )
+                    continue
+                if not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            old = old_files.pop(relative, None)
+            if old is not None:
+                if old.mtime_ns == stat.st_mtime_ns and old.size == stat.st_size:
+                    node.files[dir_entry.name] = old
+                    continue
+                self._remove(relative, old)
+            node.files[dir_entry.name] = self._add(
+                relative, directory / dir_entry.name, stat.st_mtime_ns, stat.st_size
+            )
+        return node
+
+    def _add(self, relative: str, path: Path, mtime_ns: int, size: int) -> _FileEntry:
+        entry = _FileEntry(mtime_ns=mtime_ns, size=size, trigrams=None)
+        if size > self.max_file_size_bytes:
+            return entry
+        try:
+            content = path.read_text()
+        except (OSError, UnicodeDecodeError):
+            return entry
+        trigrams = _trigrams(content.lower())
+        cost = len(trigrams) * _POSTING_BYTES
+        if self._memory_bytes + cost > self.max_memory_bytes:
+            return entry
+        self._memory_bytes += cost
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, set()).add(relative)
+        entry.trigrams = trigrams
+        return entry
+
+    def _remove(self, relative: str, entry: _FileEntry) -> None:
+        if entry.trigrams is None:
+            return
+        self._memory_bytes -= len(entry.trigrams) * _POSTING_BYTES
+        for trigram in entry.trigrams:
+            postings = self._postings[trigram]
+            postings.discard(relative)
+            if not postings:
+                del self._postings[trigram]
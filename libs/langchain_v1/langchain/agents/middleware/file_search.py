@@ -17,6 +17,7 @@ from typing import Literal
 
 from langchain_core.tools import tool
 
+from langchain.agents.middleware._file_index import FileIndex
 from langchain.agents.middleware.types import AgentMiddleware
 
 
@@ -92,6 +93,11 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
     - Glob: Fast file pattern matching by file path
     - Grep: Fast content search using ripgrep or Python fallback
 
+    With `use_index=True`, the files are indexed in memory once, and the index is
+    updated as files change. Glob patterns are then matched against the indexed
+    paths, and the Python fallback only reads the files that contain the literal
+    parts of the regex.
+
     Example:
         ```python
         from langchain.agents import create_agent
@@ -115,6 +121,9 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
         root_path: str,
         use_ripgrep: bool = True,
         max_file_size_mb: int = 10,
+        use_index: bool = False,
+        index_memory_mb: int = 256,
+        index_refresh_interval: float = 0.0,
     ) -> None:
         """Initialize the search middleware.
 
@@ -124,10 +133,30 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
 
                 Falls back to Python if `ripgrep` unavailable.
             max_file_size_mb: Maximum file size to search in MB.
+            use_index: Whether to keep an in-memory index of the files for glob
+                search and the Python grep search.
+            index_memory_mb: Approximate memory budget of the content index in MB.
+
+                Files that don't fit are not indexed and are read on every search.
+            index_refresh_interval: Minimum time in seconds between two checks of
+                the filesystem for changed files.
+
+                By default, changes are checked before every search, which only
+                reads the metadata of unchanged files.
         """
         self.root_path = Path(root_path).resolve()
         self.use_ripgrep = use_ripgrep
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self.index = (
+            FileIndex(
+                self.root_path,
+                max_file_size_bytes=self.max_file_size_bytes,
+                max_memory_bytes=index_memory_mb * 1024 * 1024,
+                refresh_interval=index_refresh_interval,
+            )
+            if use_index
+            else None
+        )
 
         # Create tool instances as closures that capture self
         @tool
@@ -157,15 +186,22 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
             if not base_full.exists() or not base_full.is_dir():
                 return "No files found"
 
-            # Use pathlib glob
+            # Use the index or pathlib glob
+            if self.index is not None:
+                matches = self.index.glob(base_full, pattern)
+            else:
+                matches = [match for match in base_full.glob(pattern) if match.is_file()]
+
             matching: list[tuple[str, str]] = []
-            for match in base_full.glob(pattern):
-                if match.is_file():
-                    # Convert to virtual path
-                    virtual_path = "/" + str(match.relative_to(self.root_path))
+            for match in matches:
+                # Convert to virtual path
+                virtual_path = "/" + str(match.relative_to(self.root_path))
+                try:
                     stat = match.stat()
-                    modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat()
-                    matching.append((virtual_path, modified_at))
+                except FileNotFoundError:
+                    continue
+                modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat()
+                matching.append((virtual_path, modified_at))
 
             if not matching:
                 return "No files found"
@@ -324,22 +360,24 @@ class FilesystemFileSearchMiddleware(AgentMiddleware):
         regex = re.compile(pattern)
         results: dict[str, list[tuple[int, str]]] = {}
 
-        # Walk directory tree
-        for file_path in base_full.rglob("*"):
-            if not file_path.is_file():
-                continue
+        # Use the files that may match from the index, or walk directory tree
+        if self.index is not None:
+            file_paths = self.index.candidates(base_full, pattern)
+        else:
+            file_paths = [path for path in base_full.rglob("*") if path.is_file()]
 
+        for file_path in file_paths:
             # Check include filter
             if include and not _match_include_pattern(file_path.name, include):
                 continue
 
-            # Skip files that are too large
-            if file_path.stat().st_size > self.max_file_size_bytes:
-                continue
-
             try:
+                # Skip files that are too large
+                if file_path.stat().st_size > self.max_file_size_bytes:
+                    continue
+
                 content = file_path.read_text()
-            except (UnicodeDecodeError, PermissionError):
+            except (UnicodeDecodeError, PermissionError, FileNotFoundError):
                 continue
 
             # Search content
@@ -1,8 +1,17 @@
 """Summarization middleware."""
 
+import asyncio
+import bisect
+import contextvars
+import itertools
+import threading
 import uuid
 import warnings
+import weakref
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 from functools import partial
 from typing import Any, Literal, cast
 
@@ -56,6 +65,7 @@ Messages to summarize:
 _DEFAULT_MESSAGES_TO_KEEP = 20
 _DEFAULT_TRIM_TOKEN_LIMIT = 4000
 _DEFAULT_FALLBACK_MESSAGE_COUNT = 15
+_MAX_BACKGROUND_SUMMARIES = 64
 
 ContextFraction = tuple[Literal["fraction"], float]
 """Fraction of model's maximum input tokens.
@@ -128,6 +138,62 @@ def _get_approximate_token_counter(model: BaseChatModel) -> TokenCounter:
     return count_tokens_approximately
 
 
+class _BackgroundSummary:
+    """A summary of the start of a conversation, generated in the background."""
+
+    def __init__(
+        self,
+        message_ids: tuple[str | None, ...],
+        future: Future[str] | asyncio.Task[str],
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        self.message_ids = message_ids
+        self.future = future
+        self.loop = loop
+
+    def failed(self) -> bool:
+        """Whether generating the summary was cancelled or raised."""
+        return self.future.done() and (
+            self.future.cancelled() or self.future.exception() is not None
+        )
+
+    def usable_on(self, loop: asyncio.AbstractEventLoop | None) -> bool:
+        """Whether the summary can still be used from `loop`.
+
+        A summary that failed can't be used. A pending task can only be awaited on
+        the event loop that runs it, which may have been closed since it started.
+        """
+        if self.failed():
+            return False
+        return self.future.done() or self.loop is None or self.loop is loop
+
+    def result(self) -> str | None:
+        """Wait for the summary, unless it's a task, without raising if it fails."""
+        if isinstance(self.future, Future):
+            wait_futures([self.future])
+        if self.failed():
+            return None
+        return self.future.result()
+
+    async def wait(self) -> str | None:
+        """Wait for the summary, without raising if generating it fails."""
+        future = self.future
+        waited = asyncio.wrap_future(future) if isinstance(future, Future) else future
+        await asyncio.wait({waited})
+        if waited.cancelled() or waited.exception() is not None:
+            return None
+        return waited.result()
+
+    def applies_to(self, messages: list[AnyMessage]) -> bool:
+        """Whether the summarized messages are still the start of `messages`."""
+        cutoff = len(self.message_ids)
+        return (
+            cutoff < len(messages)
+            and not isinstance(messages[cutoff], ToolMessage)
+            and tuple(message.id for message in messages[:cutoff]) == self.message_ids
+        )
+
+
 class SummarizationMiddleware(AgentMiddleware):
     """Summarizes conversation history when token limits are approached.
 
@@ -145,6 +211,7 @@ class SummarizationMiddleware(AgentMiddleware):
         token_counter: TokenCounter = count_tokens_approximately,
         summary_prompt: str = DEFAULT_SUMMARY_PROMPT,
         trim_tokens_to_summarize: int | None = _DEFAULT_TRIM_TOKEN_LIMIT,
+        background_trigger: ContextSize | list[ContextSize] | None = None,
         **deprecated_kwargs: Any,
     ) -> None:
         """Initialize summarization middleware.
@@ -196,11 +263,37 @@ class SummarizationMiddleware(AgentMiddleware):
                     ("fraction", 0.3)
                     ```
             token_counter: Function to count tokens in messages.
+
+                With the default approximate counter, each message is counted once and
+                its count is reused on later model calls. Other counters are called
+                with the whole list of messages, since they may not be additive.
             summary_prompt: Prompt template for generating summaries.
             trim_tokens_to_summarize: Maximum tokens to keep when preparing messages for
                 the summarization call.
 
                 Pass `None` to skip trimming entirely.
+            background_trigger: One or more thresholds, lower than `trigger`, at which
+                a summary starts being generated in the background, without blocking
+                the agent.
+
+                The summary replaces the messages it covers on the first model call
+                after it is ready. If a `trigger` threshold is reached first, that model
+                call waits for the summary, as it does without `background_trigger`.
+
+                Background summaries are kept in memory, so they are only applied by
+                the process that started them.
+
+                !!! example
+
+                    ```python
+                    # Start summarizing at 60% of the model's max input tokens, and
+                    # block at 80% if the summary isn't ready yet
+                    SummarizationMiddleware(
+                        model,
+                        trigger=("fraction", 0.8),
+                        background_trigger=("fraction", 0.6),
+                    )
+                    ```
         """
         # Handle deprecated parameters
         if "max_tokens_before_summary" in deprecated_kwargs:
@@ -242,15 +335,44 @@ class SummarizationMiddleware(AgentMiddleware):
             trigger_conditions = [validated]
         self._trigger_conditions = trigger_conditions
 
+        if background_trigger is None:
+            self.background_trigger: ContextSize | list[ContextSize] | None = None
+            background_trigger_conditions: list[ContextSize] = []
+        elif isinstance(background_trigger, list):
+            validated_list = [
+                self._validate_context_size(item, "background_trigger")
+                for item in background_trigger
+            ]
+            self.background_trigger = validated_list
+            background_trigger_conditions = validated_list
+        else:
+            validated = self._validate_context_size(background_trigger, "background_trigger")
+            self.background_trigger = validated
+            background_trigger_conditions = [validated]
+        self._background_trigger_conditions = background_trigger_conditions
+        self._background_summaries: OrderedDict[str | None, _BackgroundSummary] = OrderedDict()
+        self._background_summaries_lock = threading.Lock()
+        self._background_executor: ThreadPoolExecutor | None = None
+        self._background_tasks: set[asyncio.Task[str]] = set()
+
         self.keep = self._validate_context_size(keep, "keep")
         if token_counter is count_tokens_approximately:
             self.token_counter = _get_approximate_token_counter(self.model)
         else:
             self.token_counter = token_counter
+        # The approximate counter is additive, so messages can be counted one at a time,
+        # and their counts reused on later model calls.
+        self._additive_token_counter: TokenCounter | None = (
+            self.token_counter if token_counter is count_tokens_approximately else None
+        )
+        self._message_token_counts: dict[str, tuple[weakref.ref[AnyMessage], int]] = {}
         self.summary_prompt = summary_prompt
         self.trim_tokens_to_summarize = trim_tokens_to_summarize
 
-        requires_profile = any(condition[0] == "fraction" for condition in self._trigger_conditions)
+        requires_profile = any(
+            condition[0] == "fraction"
+            for condition in [*self._trigger_conditions, *self._background_trigger_conditions]
+        )
         if self.keep[0] == "fraction":
             requires_profile = True
         if requires_profile and self._get_profile_limits() is None:
@@ -269,8 +391,28 @@ class SummarizationMiddleware(AgentMiddleware):
         messages = state["messages"]
         self._ensure_message_ids(messages)
 
-        total_tokens = self.token_counter(messages)
-        if not self._should_summarize(messages, total_tokens):
+        total_tokens = self._count_tokens(messages)
+        should_summarize = self._should_summarize(messages, total_tokens)
+        background_summary = self._pop_background_summary(messages)
+        if background_summary is not None and not background_summary.usable_on(None):
+            background_summary = None
+        if background_summary is not None:
+            future = background_summary.future
+            # Wait for the summary only once a blocking threshold is reached. A summary
+            # started on an event loop can't be waited for here.
+            if future.done() or (should_summarize and isinstance(future, Future)):
+                summary = background_summary.result()
+                if summary is not None:
+                    return self._build_update(
+                        summary, messages[len(background_summary.message_ids) :]
+                    )
+            elif not should_summarize:
+                self._put_background_summary(messages, background_summary)
+        if not should_summarize:
+            if background_summary is None and self._should_summarize_in_background(
+                messages, total_tokens
+            ):
+                self._start_background_summary(messages)
             return None
 
         cutoff_index = self._determine_cutoff_index(messages)
@@ -281,15 +423,7 @@ class SummarizationMiddleware(AgentMiddleware):
         messages_to_summarize, preserved_messages = self._partition_messages(messages, cutoff_index)
 
         summary = self._create_summary(messages_to_summarize)
-        new_messages = self._build_new_messages(summary)
-
-        return {
-            "messages": [
-                RemoveMessage(id=REMOVE_ALL_MESSAGES),
-                *new_messages,
-                *preserved_messages,
-            ]
-        }
+        return self._build_update(summary, preserved_messages)
 
     @override
     async def abefore_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
@@ -297,8 +431,29 @@ class SummarizationMiddleware(AgentMiddleware):
         messages = state["messages"]
         self._ensure_message_ids(messages)
 
-        total_tokens = self.token_counter(messages)
-        if not self._should_summarize(messages, total_tokens):
+        total_tokens = self._count_tokens(messages)
+        should_summarize = self._should_summarize(messages, total_tokens)
+        background_summary = self._pop_background_summary(messages)
+        if background_summary is not None and not background_summary.usable_on(
+            asyncio.get_running_loop()
+        ):
+            background_summary = None
+        if background_summary is not None:
+            # Wait for the summary only once a blocking threshold is reached. If it
+            # fails meanwhile, summarize without it.
+            if background_summary.future.done() or should_summarize:
+                summary = await background_summary.wait()
+                if summary is not None:
+                    return self._build_update(
+                        summary, messages[len(background_summary.message_ids) :]
+                    )
+            else:
+                self._put_background_summary(messages, background_summary)
+        if not should_summarize:
+            if background_summary is None and self._should_summarize_in_background(
+                messages, total_tokens
+            ):
+                self._astart_background_summary(messages)
             return None
 
         cutoff_index = self._determine_cutoff_index(messages)
@@ -309,6 +464,10 @@ class SummarizationMiddleware(AgentMiddleware):
         messages_to_summarize, preserved_messages = self._partition_messages(messages, cutoff_index)
 
         summary = await self._acreate_summary(messages_to_summarize)
+        return self._build_update(summary, preserved_messages)
+
+    def _build_update(self, summary: str, preserved_messages: list[AnyMessage]) -> dict[str, Any]:
+        """Build the state update replacing the summarized messages with the summary."""
         new_messages = self._build_new_messages(summary)
 
         return {
@@ -319,12 +478,65 @@ class SummarizationMiddleware(AgentMiddleware):
             ]
         }
 
+    def _count_tokens(self, messages: list[AnyMessage]) -> int:
+        """Count the tokens of the messages, reusing per-message counts if possible."""
+        token_counts = self._get_message_token_counts(messages)
+        if token_counts is None:
+            return self.token_counter(messages)
+        return sum(token_counts)
+
+    def _get_message_token_counts(self, messages: list[AnyMessage]) -> list[int] | None:
+        """Count the tokens of each message, reusing the counts of messages seen before.
+
+        Counts are cached by message ID, and only reused for the same message object,
+        so messages replaced with an edited copy are counted again.
+
+        Returns:
+            The token count of each message, or `None` if the token counter isn't known
+            to be additive.
+        """
+        if (
+            self._additive_token_counter is None
+            or self.token_counter is not self._additive_token_counter
+        ):
+            return None
+        cache = self._message_token_counts
+        token_counts = []
+        for message in messages:
+            message_id = message.id
+            if message_id is not None and (entry := cache.get(message_id)) is not None:
+                ref, token_count = entry
+                if ref() is message:
+                    token_counts.append(token_count)
+                    continue
+            token_count = self.token_counter([message])
+            if message_id is not None:
+                cache[message_id] = (
+                    weakref.ref(message, partial(_forget_token_count, cache, message_id)),
+                    token_count,
+                )
+            token_counts.append(token_count)
+        return token_counts
+
     def _should_summarize(self, messages: list[AnyMessage], total_tokens: int) -> bool:
         """Determine whether summarization should run for the current token usage."""
-        if not self._trigger_conditions:
+        return self._is_threshold_reached(self._trigger_conditions, messages, total_tokens)
+
+    def _should_summarize_in_background(
+        self, messages: list[AnyMessage], total_tokens: int
+    ) -> bool:
+        """Determine whether a background summary should start."""
+        return self._is_threshold_reached(
+            self._background_trigger_conditions, messages, total_tokens
+        )
+
+    def _is_threshold_reached(
+        self, conditions: list[ContextSize], messages: list[AnyMessage], total_tokens: int
+    ) -> bool:
+        if not conditions:
             return False
 
-        for kind, value in self._trigger_conditions:
+        for kind, value in conditions:
             if kind == "messages" and len(messages) >= value:
                 return True
             if kind == "tokens" and total_tokens >= value:
@@ -371,27 +583,37 @@ class SummarizationMiddleware(AgentMiddleware):
         if target_token_count <= 0:
             target_token_count = 1
 
-        if self.token_counter(messages) <= target_token_count:
-            return 0
-
-        # Use binary search to identify the earliest message index that keeps the
-        # suffix within the token budget.
-        left, right = 0, len(messages)
-        cutoff_candidate = len(messages)
-        max_iterations = len(messages).bit_length() + 1
-        for _ in range(max_iterations):
-            if left >= right:
-                break
-
-            mid = (left + right) // 2
-            if self.token_counter(messages[mid:]) <= target_token_count:
-                cutoff_candidate = mid
-                right = mid
-            else:
-                left = mid + 1
+        token_counts = self._get_message_token_counts(messages)
+        if token_counts is not None:
+            if sum(token_counts) <= target_token_count:
+                return 0
+            # The token counts of the suffixes, from the shortest to the longest, are
+            # increasing, so the longest suffix within the budget can be bisected.
+            suffix_token_counts = list(itertools.accumulate(reversed(token_counts)))
+            kept = bisect.bisect_right(suffix_token_counts, target_token_count)
+            cutoff_candidate = len(messages) - kept
+        else:
+            if self.token_counter(messages) <= target_token_count:
+                return 0
 
-        if cutoff_candidate == len(messages):
-            cutoff_candidate = left
+            # Use binary search to identify the earliest message index that keeps the
+            # suffix within the token budget.
+            left, right = 0, len(messages)
+            cutoff_candidate = len(messages)
+            max_iterations = len(messages).bit_length() + 1
+            for _ in range(max_iterations):
+                if left >= right:
+                    break
+
+                mid = (left + right) // 2
+                if self.token_counter(messages[mid:]) <= target_token_count:
+                    cutoff_candidate = mid
+                    right = mid
+                else:
+                    left = mid + 1
+
+            if cutoff_candidate == len(messages):
+                cutoff_candidate = left
 
         if cutoff_candidate >= len(messages):
             if len(messages) == 1:
@@ -482,6 +704,62 @@ class SummarizationMiddleware(AgentMiddleware):
             cutoff_index += 1
         return cutoff_index
 
+    def _pop_background_summary(self, messages: list[AnyMessage]) -> _BackgroundSummary | None:
+        """Take the background summary of the start of `messages`, if there is one."""
+        if not messages:
+            return None
+        with self._background_summaries_lock:
+            background_summary = self._background_summaries.pop(messages[0].id, None)
+        if background_summary is None or not background_summary.applies_to(messages):
+            return None
+        return background_summary
+
+    def _put_background_summary(
+        self, messages: list[AnyMessage], background_summary: _BackgroundSummary
+    ) -> None:
+        with self._background_summaries_lock:
+            self._background_summaries[messages[0].id] = background_summary
+            while len(self._background_summaries) > _MAX_BACKGROUND_SUMMARIES:
+                self._background_summaries.popitem(last=False)
+
+    def _get_background_cutoff(self, messages: list[AnyMessage]) -> int | None:
+        cutoff_index = self._determine_cutoff_index(messages)
+        if cutoff_index <= 0 or cutoff_index >= len(messages):
+            return None
+        return cutoff_index
+
+    def _start_background_summary(self, messages: list[AnyMessage]) -> None:
+        """Start summarizing the start of `messages` in a background thread."""
+        if (cutoff_index := self._get_background_cutoff(messages)) is None:
+            return
+        if self._background_executor is None:
+            self._background_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="summarization"
+            )
+        future = self._background_executor.submit(self._create_summary, messages[:cutoff_index])
+        self._put_background_summary(
+            messages,
+            _BackgroundSummary(tuple(message.id for message in messages[:cutoff_index]), future),
+        )
+
+    def _astart_background_summary(self, messages: list[AnyMessage]) -> None:
+        """Start summarizing the start of `messages` in a background task."""
+        if (cutoff_index := self._get_background_cutoff(messages)) is None:
+            return
+        # Run the summary outside of the current run, which may end before it does.
+        loop = asyncio.get_running_loop()
+        task = contextvars.Context().run(
+            loop.create_task, self._acreate_summary(messages[:cutoff_index])
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        self._put_background_summary(
+            messages,
+            _BackgroundSummary(
+                tuple(message.id for message in messages[:cutoff_index]), task, loop
+            ),
+        )
+
     def _create_summary(self, messages_to_summarize: list[AnyMessage]) -> str:
         """Generate summary for the given messages."""
         if not messages_to_summarize:
@@ -533,3 +811,14 @@ class SummarizationMiddleware(AgentMiddleware):
             )
         except Exception:
             return messages[-_DEFAULT_FALLBACK_MESSAGE_COUNT:]
+
+
+def _forget_token_count(
+    cache: dict[str, tuple[weakref.ref[AnyMessage], int]],
+    message_id: str,
+    ref: weakref.ref[AnyMessage],
+) -> None:
+    """Drop the cached token count of a message once it is garbage collected."""
+    entry = cache.get(message_id)
+    if entry is not None and entry[0] is ref:
+        cache.pop(message_id, None)
@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Annotated, Literal, Union
+import math
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Annotated, Any, Literal, Union
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
+    from langchain_core.runnables import Runnable
+
     from langchain.tools import BaseTool
 
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import HumanMessage
 from pydantic import Field, TypeAdapter
@@ -23,6 +32,7 @@ from langchain.agents.middleware.types import (
     ModelResponse,
 )
 from langchain.chat_models.base import init_chat_model
+from langchain.embeddings.base import init_embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,9 @@ DEFAULT_SYSTEM_PROMPT = (
     "Your goal is to select the most relevant tools for answering the user's query."
 )
 
+_SCHEMA_CACHE_SIZE = 32
+_QUERY_CACHE_SIZE = 64
+
 
 @dataclass
 class _SelectionRequest:
@@ -52,6 +65,10 @@ def _create_tool_selection_response(tools: list[BaseTool]) -> TypeAdapter:
         `TypeAdapter` for a schema where each tool name is a `Literal` with its
             description.
     """
+    return _create_selection_adapter(tuple((tool.name, tool.description) for tool in tools))
+
+
+def _create_selection_adapter(tools: tuple[tuple[str, str], ...]) -> TypeAdapter:
     if not tools:
         msg = "Invalid usage: tools must be non-empty"
         raise AssertionError(msg)
@@ -59,7 +76,7 @@ def _create_tool_selection_response(tools: list[BaseTool]) -> TypeAdapter:
     # Create a Union of Annotated Literal types for each tool name with description
     # For instance: Union[Annotated[Literal["tool1"], Field(description="...")], ...]
     literals = [
-        Annotated[Literal[tool.name], Field(description=tool.description)] for tool in tools
+        Annotated[Literal[name], Field(description=description)] for name, description in tools
     ]
     selected_tool_type = Union[tuple(literals)]  # type: ignore[valid-type]  # noqa: UP007
 
@@ -73,6 +90,40 @@ def _create_tool_selection_response(tools: list[BaseTool]) -> TypeAdapter:
     return TypeAdapter(ToolSelectionResponse)
 
 
+@functools.lru_cache(maxsize=_SCHEMA_CACHE_SIZE)
+def _cached_selection_schema(tools: tuple[tuple[str, str], ...]) -> dict[str, Any]:
+    return _create_selection_adapter(tools).json_schema()
+
+
+def _get_tool_selection_schema(tools: list[BaseTool]) -> dict[str, Any]:
+    """Get the JSON schema of the tool selection response, cached per tool set.
+
+    Args:
+        tools: Available tools to include in the schema.
+
+    Returns:
+        A copy of the JSON schema, so that callers may modify it.
+    """
+    key = tuple((tool.name, tool.description) for tool in tools)
+    return copy.deepcopy(_cached_selection_schema(key))
+
+
+def _tool_text(tool: BaseTool) -> str:
+    """Text embedded for a tool."""
+    return f"{tool.name}: {tool.description}"
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(sum(value * value for value in vector))
+    if not norm:
+        return vector
+    return [value / norm for value in vector]
+
+
+def _dot(x: list[float], y: list[float]) -> float:
+    return sum(map(operator.mul, x, y))
+
+
 def _render_tool_list(tools: list[BaseTool]) -> str:
     """Format tools as markdown list.
 
@@ -112,6 +163,20 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
             ```python
             middleware = LLMToolSelectorMiddleware(model="openai:gpt-4o-mini", max_tools=2)
             ```
+
+        !!! example "Shortlist tools by embedding similarity"
+
+            ```python
+            middleware = LLMToolSelectorMiddleware(
+                max_tools=3,
+                embeddings="openai:text-embedding-3-small",
+            )
+            ```
+
+            Tool descriptions are embedded once, and the selection model is only called
+            when the most similar tools are not clearly ahead of the others.
+
+    The outcome of each selection and its duration are logged at `DEBUG` level.
     """
 
     def __init__(
@@ -121,6 +186,9 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
         system_prompt: str = DEFAULT_SYSTEM_PROMPT,
         max_tools: int | None = None,
         always_include: list[str] | None = None,
+        embeddings: str | Embeddings | None = None,
+        max_candidates: int | None = None,
+        similarity_margin: float | None = 0.05,
     ) -> None:
         """Initialize the tool selector.
 
@@ -139,17 +207,45 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
             always_include: Tool names to always include regardless of selection.
 
                 These do not count against the `max_tools` limit.
+            embeddings: Embedding model used to shortlist tools by the similarity of
+                their name and description to the last user message.
+
+                Can be a model identifier string or `Embeddings` instance.
+
+                Tool descriptions are embedded once and kept in memory. If not
+                specified, all tools are passed to the selection model.
+            max_candidates: Maximum number of shortlisted tools passed to the
+                selection model.
+
+                If not specified, twice `max_tools`, or all tools if there is no
+                `max_tools` limit.
+            similarity_margin: Minimum similarity gap between the `max_tools`-th
+                most similar tool and the next one for the most similar tools to be
+                selected without calling the selection model.
+
+                If `None`, the selection model is always called.
         """
         super().__init__()
         self.system_prompt = system_prompt
         self.max_tools = max_tools
         self.always_include = always_include or []
+        self.max_candidates = max_candidates
+        self.similarity_margin = similarity_margin
 
         if isinstance(model, (BaseChatModel, type(None))):
             self.model: BaseChatModel | None = model
         else:
             self.model = init_chat_model(model)
 
+        if isinstance(embeddings, (Embeddings, type(None))):
+            self.embeddings: Embeddings | None = embeddings
+        else:
+            self.embeddings = init_embeddings(embeddings)
+
+        # Normalized embeddings of tools and of recent user messages
+        self._tool_vectors: dict[tuple[str, str], list[float]] = {}
+        self._query_vectors: OrderedDict[str, list[float]] = OrderedDict()
+
     def _prepare_selection_request(self, request: ModelRequest) -> _SelectionRequest | None:
         """Prepare inputs for tool selection.
 
@@ -257,6 +353,100 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
 
         return request.override(tools=[*selected_tools, *provider_tools])
 
+    def _missing_tools(self, tools: list[BaseTool]) -> list[BaseTool]:
+        """Get the tools whose embedding is not in the index yet."""
+        return [tool for tool in tools if (tool.name, tool.description) not in self._tool_vectors]
+
+    def _index_tools(self, tools: list[BaseTool], vectors: list[list[float]]) -> None:
+        for tool, vector in zip(tools, vectors, strict=True):
+            self._tool_vectors[tool.name, tool.description] = _normalize(vector)
+
+    def _put_query_vector(self, query: str, vector: list[float]) -> list[float]:
+        self._query_vectors[query] = vector = _normalize(vector)
+        while len(self._query_vectors) > _QUERY_CACHE_SIZE:
+            self._query_vectors.popitem(last=False)
+        return vector
+
+    def _shortlist(
+        self, selection_request: _SelectionRequest, query_vector: list[float]
+    ) -> tuple[_SelectionRequest, list[str] | None]:
+        """Shortlist the tools most similar to the query.
+
+        Returns:
+            The selection request narrowed to the shortlisted tools, and the names of
+                the selected tools if the most similar tools are clearly ahead of the
+                others, `None` otherwise.
+        """
+        scores = {
+            tool.name: _dot(self._tool_vectors[tool.name, tool.description], query_vector)
+            for tool in selection_request.available_tools
+        }
+        ranked = sorted(scores, key=scores.__getitem__, reverse=True)
+
+        if (
+            self.max_tools is not None
+            and self.similarity_margin is not None
+            and (
+                len(ranked) <= self.max_tools
+                or scores[ranked[self.max_tools - 1]] - scores[ranked[self.max_tools]]
+                >= self.similarity_margin
+            )
+        ):
+            return selection_request, ranked[: self.max_tools]
+
+        max_candidates = self.max_candidates
+        if max_candidates is None and self.max_tools is not None:
+            max_candidates = 2 * self.max_tools
+        if max_candidates is None or max_candidates >= len(ranked):
+            return selection_request, None
+        shortlist = set(ranked[:max_candidates])
+        available_tools = [
+            tool for tool in selection_request.available_tools if tool.name in shortlist
+        ]
+        return replace(
+            selection_request,
+            available_tools=available_tools,
+            valid_tool_names=[tool.name for tool in available_tools],
+        ), None
+
+    def _get_structured_model(self, selection_request: _SelectionRequest) -> Runnable:
+        # Create dynamic response model with Literal enum of available tool names
+        schema = _get_tool_selection_schema(selection_request.available_tools)
+        return selection_request.model.with_structured_output(schema)
+
+    @staticmethod
+    def _selection_messages(selection_request: _SelectionRequest) -> list:
+        return [
+            {"role": "system", "content": selection_request.system_message},
+            selection_request.last_user_message,
+        ]
+
+    def _finish_selection(
+        self,
+        response: Any,
+        selection_request: _SelectionRequest,
+        request: ModelRequest,
+        *,
+        method: str,
+        candidates: int,
+        start: float,
+    ) -> ModelRequest:
+        # Response should be a dict since we're passing a schema (not a Pydantic model class)
+        if not isinstance(response, dict):
+            msg = f"Expected dict response, got {type(response)}"
+            raise AssertionError(msg)  # noqa: TRY004
+        modified_request = self._process_selection_response(
+            response, selection_request.available_tools, selection_request.valid_tool_names, request
+        )
+        logger.debug(
+            "Selected tools %s by %s from %d candidates in %.1f ms",
+            [tool.name for tool in modified_request.tools if not isinstance(tool, dict)],
+            method,
+            candidates,
+            (time.perf_counter() - start) * 1000,
+        )
+        return modified_request
+
     def wrap_model_call(
         self,
         request: ModelRequest,
@@ -267,24 +457,35 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
         if selection_request is None:
             return handler(request)
 
-        # Create dynamic response model with Literal enum of available tool names
-        type_adapter = _create_tool_selection_response(selection_request.available_tools)
-        schema = type_adapter.json_schema()
-        structured_model = selection_request.model.with_structured_output(schema)
-
-        response = structured_model.invoke(
-            [
-                {"role": "system", "content": selection_request.system_message},
-                selection_request.last_user_message,
-            ]
-        )
-
-        # Response should be a dict since we're passing a schema (not a Pydantic model class)
-        if not isinstance(response, dict):
-            msg = f"Expected dict response, got {type(response)}"
-            raise AssertionError(msg)  # noqa: TRY004
-        modified_request = self._process_selection_response(
-            response, selection_request.available_tools, selection_request.valid_tool_names, request
+        start = time.perf_counter()
+        if self.embeddings is not None:
+            if missing := self._missing_tools(selection_request.available_tools):
+                vectors = self.embeddings.embed_documents([_tool_text(tool) for tool in missing])
+                self._index_tools(missing, vectors)
+            query = selection_request.last_user_message.text
+            if (query_vector := self._query_vectors.get(query)) is None:
+                query_vector = self._put_query_vector(query, self.embeddings.embed_query(query))
+            selection_request, selected = self._shortlist(selection_request, query_vector)
+            if selected is not None:
+                modified_request = self._finish_selection(
+                    {"tools": selected},
+                    selection_request,
+                    request,
+                    method="embeddings",
+                    candidates=len(selection_request.available_tools),
+                    start=start,
+                )
+                return handler(modified_request)
+
+        structured_model = self._get_structured_model(selection_request)
+        response = structured_model.invoke(self._selection_messages(selection_request))
+        modified_request = self._finish_selection(
+            response,
+            selection_request,
+            request,
+            method="model",
+            candidates=len(selection_request.available_tools),
+            start=start,
         )
         return handler(modified_request)
 
@@ -298,23 +499,38 @@ class LLMToolSelectorMiddleware(AgentMiddleware):
         if selection_request is None:
             return await handler(request)
 
-        # Create dynamic response model with Literal enum of available tool names
-        type_adapter = _create_tool_selection_response(selection_request.available_tools)
-        schema = type_adapter.json_schema()
-        structured_model = selection_request.model.with_structured_output(schema)
-
-        response = await structured_model.ainvoke(
-            [
-                {"role": "system", "content": selection_request.system_message},
-                selection_request.last_user_message,
-            ]
-        )
-
-        # Response should be a dict since we're passing a schema (not a Pydantic model class)
-        if not isinstance(response, dict):
-            msg = f"Expected dict response, got {type(response)}"
-            raise AssertionError(msg)  # noqa: TRY004
-        modified_request = self._process_selection_response(
-            response, selection_request.available_tools, selection_request.valid_tool_names, request
+        start = time.perf_counter()
+        if self.embeddings is not None:
+            if missing := self._missing_tools(selection_request.available_tools):
+                vectors = await self.embeddings.aembed_documents(
+                    [_tool_text(tool) for tool in missing]
+                )
+                self._index_tools(missing, vectors)
+            query = selection_request.last_user_message.text
+            if (query_vector := self._query_vectors.get(query)) is None:
+                query_vector = self._put_query_vector(
+                    query, await self.embeddings.aembed_query(query)
+                )
+            selection_request, selected = self._shortlist(selection_request, query_vector)
+            if selected is not None:
+                modified_request = self._finish_selection(
+                    {"tools": selected},
+                    selection_request,
+                    request,
+                    method="embeddings",
+                    candidates=len(selection_request.available_tools),
+                    start=start,
+                )
+                return await handler(modified_request)
+
+        structured_model = self._get_structured_model(selection_request)
+        response = await structured_model.ainvoke(self._selection_messages(selection_request))
+        modified_request = self._finish_selection(
+            response,
+            selection_request,
+            request,
+            method="model",
+            candidates=len(selection_request.available_tools),
+            start=start,
         )
         return await handler(modified_request)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import threading
 import warnings
+from collections import OrderedDict
 from importlib import util
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, cast, overload
 
@@ -12,7 +14,7 @@ from langchain_core.runnables import Runnable, RunnableConfig, ensure_config
 from typing_extensions import override
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterator, Sequence
 
     from langchain_core.runnables.schema import StreamEvent
     from langchain_core.tools import BaseTool
@@ -186,6 +188,12 @@ def init_chat_model(
             chat model emulator that initializes the underlying model at runtime once a
             config is passed in.
 
+            The configurable model keeps the models it initializes, along with the
+            models of the emulators derived from it with `bind_tools`,
+            `with_structured_output` and `with_config`, in a least-recently-used cache
+            of up to 32 models. Calls with the same parameters reuse the same model and
+            its HTTP clients.
+
     Raises:
         ValueError: If `model_provider` cannot be inferred or isn't supported.
         ImportError: If the model provider integration package is not installed.
@@ -543,6 +551,61 @@ def _remove_prefix(s: str, prefix: str) -> str:
 
 _DECLARATIVE_METHODS = ("bind_tools", "with_structured_output")
 
+_MODEL_CACHE_SIZE = 32
+
+
+def _cache_key(value: Any) -> Hashable:
+    """Get a hashable key that is equal for equal model params and operations.
+
+    Dicts, lists and tuples are compared by value. Other unhashable values, like tools
+    or callbacks, are compared by identity.
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((k, _cache_key(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_cache_key(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return object, id(value)
+    return type(value), value
+
+
+class _ModelCache:
+    """Least-recently-used cache of the models built by a configurable model.
+
+    Models are keyed by their params and the declarative operations applied to them,
+    so that a model and its HTTP clients are created once, instead of on every call.
+    """
+
+    def __init__(self, maxsize: int = _MODEL_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._models: OrderedDict[Hashable, tuple[tuple[dict, tuple], Runnable]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        params: dict,
+        operations: Sequence[tuple[str, tuple, dict]],
+        create: Callable[[], Runnable],
+    ) -> Runnable:
+        key = _cache_key((params, operations))
+        with self._lock:
+            if (entry := self._models.get(key)) is not None:
+                self._models.move_to_end(key)
+                return entry[1]
+        model = create()
+        with self._lock:
+            # Keep the params and operations along with the model, so that the ids of
+            # the values compared by identity aren't reused while the entry exists.
+            self._models[key] = ((params, tuple(operations)), model)
+            self._models.move_to_end(key)
+            while len(self._models) > self.maxsize:
+                # Evicted models are dropped; their clients are closed by the
+                # integration packages once they are garbage collected.
+                self._models.popitem(last=False)
+        return model
+
 
 class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
     def __init__(
@@ -552,6 +615,7 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
         configurable_fields: Literal["any"] | list[str] | tuple[str, ...] = "any",
         config_prefix: str = "",
         queued_declarative_operations: Sequence[tuple[str, tuple, dict]] = (),
+        model_cache: _ModelCache | None = None,
     ) -> None:
         self._default_config: dict = default_config or {}
         self._configurable_fields: Literal["any"] | list[str] = (
@@ -565,6 +629,8 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
         self._queued_declarative_operations: list[tuple[str, tuple, dict]] = list(
             queued_declarative_operations,
         )
+        # Shared with the configurable models derived from this one.
+        self._model_cache = model_cache or _ModelCache()
 
     def __getattr__(self, name: str) -> Any:
         if name in _DECLARATIVE_METHODS:
@@ -585,6 +651,7 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
                     else self._configurable_fields,
                     config_prefix=self._config_prefix,
                     queued_declarative_operations=queued_declarative_operations,
+                    model_cache=self._model_cache,
                 )
 
             return queue
@@ -598,6 +665,13 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
 
     def _model(self, config: RunnableConfig | None = None) -> Runnable:
         params = {**self._default_config, **self._model_params(config)}
+        return self._model_cache.get(
+            params,
+            self._queued_declarative_operations,
+            lambda: self._create_model(params),
+        )
+
+    def _create_model(self, params: dict) -> Runnable:
         model = _init_chat_model_helper(**params)
         for name, args, kwargs in self._queued_declarative_operations:
             model = getattr(model, name)(*args, **kwargs)
@@ -644,6 +718,7 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
             else self._configurable_fields,
             config_prefix=self._config_prefix,
             queued_declarative_operations=queued_declarative_operations,
+            model_cache=self._model_cache,
         )
 
     @property
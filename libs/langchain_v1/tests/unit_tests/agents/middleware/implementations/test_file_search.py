@@ -5,6 +5,7 @@ from typing import Any
 
 import pytest
 
+from langchain.agents.middleware._file_index import FileIndex, _required_literals, sre_parse
 from langchain.agents.middleware.file_search import (
     FilesystemFileSearchMiddleware,
     _expand_include_patterns,
@@ -362,3 +363,96 @@ class TestGrepEdgeCases:
 
         # Large file should be skipped
         assert "/small.txt" in result
+
+
+class TestFileIndex:
+    """Tests for the in-memory file index."""
+
+    def test_glob_with_index(self, tmp_path: Path) -> None:
+        """Test glob patterns are matched against indexed paths."""
+        (tmp_path / "src" / "nested").mkdir(parents=True)
+        (tmp_path / "top.py").write_text("content", encoding="utf-8")
+        (tmp_path / "src" / "test.py").write_text("content", encoding="utf-8")
+        (tmp_path / "src" / "nested" / "deep.py").write_text("content", encoding="utf-8")
+        (tmp_path / "src" / "notes.txt").write_text("content", encoding="utf-8")
+
+        middleware = FilesystemFileSearchMiddleware(root_path=str(tmp_path), use_index=True)
+
+        assert middleware.glob_search.func(pattern="*.py").splitlines() == ["/top.py"]
+        assert set(middleware.glob_search.func(pattern="**/*.py").splitlines()) == {
+            "/top.py",
+            "/src/test.py",
+            "/src/nested/deep.py",
+        }
+        assert set(middleware.glob_search.func(pattern="*", path="/src").splitlines()) == {
+            "/src/test.py",
+            "/src/notes.txt",
+        }
+        assert middleware.glob_search.func(pattern="*.py", path="/missing") == "No files found"
+
+    def test_large_files_are_listed_but_not_searched(self, tmp_path: Path) -> None:
+        """Test files over the size limit are matched by glob but not by grep."""
+        (tmp_path / "small.txt").write_text("needle", encoding="utf-8")
+        (tmp_path / "large.txt").write_text("needle" + "x" * 2 * 1024 * 1024, encoding="utf-8")
+
+        for use_index in (False, True):
+            middleware = FilesystemFileSearchMiddleware(
+                root_path=str(tmp_path),
+                use_ripgrep=False,
+                max_file_size_mb=1,
+                use_index=use_index,
+            )
+
+            assert set(middleware.glob_search.func(pattern="*.txt").splitlines()) == {
+                "/small.txt",
+                "/large.txt",
+            }
+            assert middleware.grep_search.func(pattern="needle") == "/small.txt"
+
+    def test_grep_with_index_tracks_changes(self, tmp_path: Path) -> None:
+        """Test the index is updated as files are changed, added and removed."""
+        (tmp_path / "a.py").write_text("def hello():\n    pass\n", encoding="utf-8")
+        (tmp_path / "b.py").write_text("def goodbye():\n    pass\n", encoding="utf-8")
+
+        middleware = FilesystemFileSearchMiddleware(
+            root_path=str(tmp_path), use_ripgrep=False, use_index=True
+        )
+
+        assert middleware.grep_search.func(pattern=r"def hel+o") == "/a.py"
+
+        (tmp_path / "b.py").write_text("def hello_again():\n", encoding="utf-8")
+        (tmp_path / "c.py").write_text("hello = 1\ndef hello(): ...\n", encoding="utf-8")
+        (tmp_path / "a.py").unlink()
+
+        assert middleware.grep_search.func(pattern=r"def hel+o", output_mode="content") == (
+            "/b.py:1:def hello_again():\n/c.py:2:def hello(): ..."
+        )
+
+    def test_candidates_skip_files_without_literals(self, tmp_path: Path) -> None:
+        """Test only files with the regex trigrams, or not indexed, are candidates."""
+        (tmp_path / "match.txt").write_text("the Quick brown fox", encoding="utf-8")
+        (tmp_path / "other.txt").write_text("lazy dog", encoding="utf-8")
+
+        index = FileIndex(tmp_path, max_file_size_bytes=1024, max_memory_bytes=1024**2)
+
+        assert [path.name for path in index.candidates(tmp_path, r"quick\s+brown")] == ["match.txt"]
+        assert len(index.candidates(tmp_path, r"qu?ick|lazy")) == 2
+        assert len(index.candidates(tmp_path, r"(?i)QUICK")) == 2
+
+        unindexed = FileIndex(tmp_path, max_file_size_bytes=1024, max_memory_bytes=0)
+        assert len(unindexed.candidates(tmp_path, r"quick")) == 2
+
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            (r"foo\.bar", ["foo.bar"]),
+            (r"^abc.*xyz$", ["abc", "xyz"]),
+            (r"(?:hello)+ world", ["hello", " world"]),
+            (r"ab|cd", []),
+            (r"x(?i:abc)yz", []),
+            (r"Hello", ["hello"]),
+        ],
+    )
+    def test_required_literals(self, pattern: str, expected: list[str]) -> None:
+        """Test extraction of the literals a regex requires."""
+        assert _required_literals(sre_parse.parse(pattern)) == expected
@@ -1,9 +1,12 @@
+import asyncio
+import threading
 from unittest.mock import patch
 
 import pytest
 from langchain_core.language_models import ModelProfile
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, RemoveMessage, ToolMessage
+from langchain_core.messages.utils import count_tokens_approximately
 from langchain_core.outputs import ChatGeneration, ChatResult
 from langgraph.graph.message import REMOVE_ALL_MESSAGES
 
@@ -887,3 +890,209 @@ def test_summarization_middleware_cutoff_at_start_of_tool_sequence() -> None:
     # Index 2 is an AIMessage (safe cutoff point), so no adjustment needed
     cutoff = middleware._find_safe_cutoff(messages, messages_to_keep=4)
     assert cutoff == 2
+
+
+def test_summarization_middleware_counts_each_message_once() -> None:
+    """Test that the default token counter counts each message once."""
+    middleware = SummarizationMiddleware(
+        model=MockChatModel(), trigger=("tokens", 10_000), keep=("tokens", 100)
+    )
+    counted: list[AnyMessage] = []
+
+    def token_counter(messages: list[AnyMessage]) -> int:
+        counted.extend(messages)
+        return count_tokens_approximately(messages)
+
+    middleware.token_counter = middleware._additive_token_counter = token_counter
+
+    messages: list[AnyMessage] = [
+        HumanMessage(content="x" * (10 * i), id=str(i)) for i in range(1, 20)
+    ]
+    assert middleware._count_tokens(messages) == count_tokens_approximately(messages)
+    assert middleware._find_token_based_cutoff(messages) == 18
+    assert middleware.before_model({"messages": messages}, None) is None
+    assert counted == messages
+
+    # New messages, and edited copies of old ones, are counted again.
+    counted.clear()
+    edited = messages[0].model_copy(update={"content": "edited"})
+    new_message = AIMessage(content="new", id="new")
+    assert middleware._count_tokens([edited, *messages[1:], new_message]) == (
+        count_tokens_approximately([edited, *messages[1:], new_message])
+    )
+    assert counted == [edited, new_message]
+
+
+def test_summarization_middleware_token_cutoff_matches_binary_search() -> None:
+    """Test that cutoffs from per-message counts match the binary search over messages."""
+    incremental = SummarizationMiddleware(
+        model=MockChatModel(), trigger=("tokens", 10_000), keep=("tokens", 100)
+    )
+    searched = SummarizationMiddleware(
+        model=MockChatModel(),
+        trigger=("tokens", 10_000),
+        keep=("tokens", 100),
+        token_counter=lambda messages: count_tokens_approximately(messages),
+    )
+    messages: list[AnyMessage] = []
+    for i in range(30):
+        messages.append(
+            AIMessage(
+                content="a" * (i * 7 % 50),
+                tool_calls=[{"name": "tool", "args": {}, "id": f"call-{i}"}],
+            )
+        )
+        messages.append(ToolMessage(content="t" * (i * 13 % 80), tool_call_id=f"call-{i}"))
+        for keep in (("tokens", 1), ("tokens", 100), ("tokens", 450), ("tokens", 10_000)):
+            incremental.keep = searched.keep = keep
+            assert incremental._find_token_based_cutoff(messages) == (
+                searched._find_token_based_cutoff(messages)
+            )
+
+
+def test_summarization_middleware_background_summary() -> None:
+    """Test that background summaries are applied once ready, or when blocking."""
+    summary_started = threading.Event()
+    release_summary = threading.Event()
+
+    class SlowChatModel(MockChatModel):
+        def invoke(self, prompt):  # type: ignore[no-untyped-def]
+            summary_started.set()
+            release_summary.wait(5)
+            return AIMessage(content="Background summary")
+
+    middleware = SummarizationMiddleware(
+        model=SlowChatModel(),
+        trigger=("messages", 8),
+        background_trigger=("messages", 5),
+        keep=("messages", 2),
+    )
+    messages: list[AnyMessage] = [HumanMessage(content=str(i)) for i in range(5)]
+
+    # The soft threshold starts a summary of all but the last 2 messages.
+    assert middleware.before_model({"messages": messages}, None) is None
+    assert summary_started.wait(5)
+
+    # The summary isn't ready and the hard threshold isn't reached: don't wait.
+    messages.append(AIMessage(content="5"))
+    assert middleware.before_model({"messages": messages}, None) is None
+
+    # The hard threshold waits for the background summary.
+    messages.extend([HumanMessage(content="6"), AIMessage(content="7")])
+    release_summary.set()
+    result = middleware.before_model({"messages": messages}, None)
+    assert result is not None
+    assert isinstance(result["messages"][0], RemoveMessage)
+    assert "Background summary" in result["messages"][1].content
+    assert result["messages"][2:] == messages[3:]
+
+
+def test_summarization_middleware_background_summary_from_other_loop() -> None:
+    """Test that background summaries of ended or other event loops are not awaited."""
+    calls = 0
+
+    class AsyncChatModel(MockChatModel):
+        async def ainvoke(self, prompt):  # type: ignore[no-untyped-def]
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(10)
+            return AIMessage(content=f"Summary {calls}")
+
+    middleware = SummarizationMiddleware(
+        model=AsyncChatModel(),
+        trigger=("messages", 6),
+        background_trigger=("messages", 5),
+        keep=("messages", 2),
+    )
+    messages: list[AnyMessage] = [HumanMessage(content=str(i)) for i in range(5)]
+
+    # The loop ends, and cancels the summary, before it's ready.
+    assert asyncio.run(middleware.abefore_model({"messages": messages}, None)) is None
+    messages.append(AIMessage(content="5"))
+    result = asyncio.run(middleware.abefore_model({"messages": messages}, None))
+    assert result is not None
+    assert "Summary 2" in result["messages"][1].content
+
+    # The summary is still pending on another loop.
+    other_loop = asyncio.new_event_loop()
+    try:
+        calls = 0
+        assert (
+            other_loop.run_until_complete(
+                middleware.abefore_model({"messages": messages[:5]}, None)
+            )
+            is None
+        )
+        result = asyncio.run(middleware.abefore_model({"messages": messages}, None))
+        assert result is not None
+        assert "Summary 2" in result["messages"][1].content
+    finally:
+        for task in asyncio.all_tasks(other_loop):
+            task.cancel()
+        other_loop.run_until_complete(asyncio.sleep(0))
+        other_loop.close()
+
+
+async def test_summarization_middleware_failed_background_summary() -> None:
+    """Test that a failed background summary falls back to summarizing."""
+
+    class AsyncChatModel(MockChatModel):
+        async def ainvoke(self, prompt):  # type: ignore[no-untyped-def]
+            return AIMessage(content="Blocking summary")
+
+    middleware = SummarizationMiddleware(
+        model=AsyncChatModel(),
+        trigger=("messages", 6),
+        background_trigger=("messages", 5),
+        keep=("messages", 2),
+    )
+    messages: list[AnyMessage] = [HumanMessage(content=str(i)) for i in range(5)]
+    release = asyncio.Event()
+
+    async def fail(messages_to_summarize: list[AnyMessage]) -> str:
+        await release.wait()
+        msg = "summary failed"
+        raise RuntimeError(msg)
+
+    with patch.object(middleware, "_acreate_summary", fail):
+        assert await middleware.abefore_model({"messages": messages}, None) is None
+    messages.append(AIMessage(content="5"))
+    release.set()
+
+    result = await middleware.abefore_model({"messages": messages}, None)
+    assert result is not None
+    assert "Blocking summary" in result["messages"][1].content
+
+
+async def test_summarization_middleware_background_summary_async() -> None:
+    """Test that background summaries are generated without blocking async model calls."""
+
+    class AsyncChatModel(MockChatModel):
+        async def ainvoke(self, prompt):  # type: ignore[no-untyped-def]
+            return AIMessage(content="Background summary")
+
+    middleware = SummarizationMiddleware(
+        model=AsyncChatModel(),
+        trigger=("messages", 100),
+        background_trigger=("messages", 5),
+        keep=("messages", 2),
+    )
+    messages: list[AnyMessage] = [HumanMessage(content=str(i)) for i in range(5)]
+    assert await middleware.abefore_model({"messages": messages}, None) is None
+    await asyncio.sleep(0)
+
+    # Once ready, the summary is applied below the hard threshold.
+    messages.append(AIMessage(content="5"))
+    result = await middleware.abefore_model({"messages": messages}, None)
+    assert result is not None
+    assert "Background summary" in result["messages"][1].content
+    assert result["messages"][2:] == messages[3:]
+
+    # A summary of messages that are no longer in the history is discarded.
+    assert await middleware.abefore_model({"messages": messages}, None) is None
+    await asyncio.sleep(0)
+    result = await middleware.abefore_model(
+        {"messages": [HumanMessage(content="other"), *messages[1:]]}, None
+    )
+    assert result is None
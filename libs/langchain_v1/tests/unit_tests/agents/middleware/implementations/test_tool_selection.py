@@ -5,6 +5,7 @@ from itertools import cycle
 from typing import Any, Literal
 
 import pytest
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import LanguageModelInput
 from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 from langchain_core.messages import BaseMessage, HumanMessage
@@ -14,7 +15,10 @@ from pydantic import BaseModel
 
 from langchain.agents import create_agent
 from langchain.agents.middleware import LLMToolSelectorMiddleware, wrap_model_call
-from langchain.agents.middleware.tool_selection import _create_tool_selection_response
+from langchain.agents.middleware.tool_selection import (
+    _create_tool_selection_response,
+    _get_tool_selection_schema,
+)
 from langchain.messages import AIMessage
 
 
@@ -89,6 +93,30 @@ class FakeModel(GenericFakeChatModel):
         return self.bind(tools=tool_dicts)
 
 
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts as counts of a few keywords."""
+
+    keywords = ("weather", "search", "calculat", "email", "stock")
+
+    def __init__(self) -> None:
+        self.embedded: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return [[float(text.lower().count(k)) for k in self.keywords] for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.embed_documents([text])[0]
+
+
+class RecordingFakeModel(FakeModel):
+    bound_tools: list = []
+
+    def bind_tools(self, tools: typing.Sequence[Any], **kwargs: Any) -> Any:
+        self.bound_tools.append(tools)
+        return super().bind_tools(tools, **kwargs)
+
+
 class TestLLMToolSelectorBasic:
     """Test basic tool selection functionality."""
 
@@ -594,3 +622,127 @@ class TestEdgeCases:
         """Test that empty tools list raises an error in schema creation."""
         with pytest.raises(AssertionError, match="tools must be non-empty"):
             _create_tool_selection_response([])
+
+
+class TestEmbeddingShortlist:
+    """Test shortlisting tools by embedding similarity."""
+
+    def test_clear_shortlist_skips_selection_model(self) -> None:
+        """Test that clearly most similar tools are selected without the model."""
+        model_requests = []
+
+        @wrap_model_call
+        def trace_model_requests(request, handler):
+            model_requests.append(request)
+            return handler(request)
+
+        embeddings = KeywordEmbeddings()
+        model = FakeModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="",
+                        tool_calls=[
+                            {"name": "get_weather", "id": "2", "args": {"location": "Paris"}}
+                        ],
+                    ),
+                    AIMessage(content="The weather in Paris is 72°F and sunny."),
+                ]
+            )
+        )
+        # The selection model has no responses, so calling it would fail
+        tool_selector = LLMToolSelectorMiddleware(
+            max_tools=1, model=FakeModel(messages=iter([])), embeddings=embeddings
+        )
+
+        agent = create_agent(
+            model=model,
+            tools=[get_weather, search_web, calculate, send_email, get_stock_price],
+            middleware=[tool_selector, trace_model_requests],
+        )
+
+        agent.invoke({"messages": [HumanMessage("What's the weather in Paris?")]})
+
+        assert len(model_requests) == 2
+        for request in model_requests:
+            assert [tool.name for tool in request.tools] == ["get_weather"]
+        # Tools are embedded once, and the unchanged user message once
+        assert len(embeddings.embedded) == 6
+
+    async def test_async_clear_shortlist_skips_selection_model(self) -> None:
+        """Test that clearly most similar tools are selected without the model."""
+        model_requests = []
+
+        @wrap_model_call
+        async def trace_model_requests(request, handler):
+            model_requests.append(request)
+            return await handler(request)
+
+        tool_selector = LLMToolSelectorMiddleware(
+            max_tools=1, model=FakeModel(messages=iter([])), embeddings=KeywordEmbeddings()
+        )
+
+        agent = create_agent(
+            model=FakeModel(messages=iter([AIMessage(content="Done")])),
+            tools=[get_weather, search_web, calculate],
+            middleware=[tool_selector, trace_model_requests],
+        )
+
+        await agent.ainvoke({"messages": [HumanMessage("Search for Python tutorials")]})
+
+        assert [tool.name for tool in model_requests[0].tools] == ["search_web"]
+
+    def test_ambiguous_shortlist_uses_selection_model(self) -> None:
+        """Test that the selection model chooses among the shortlisted tools."""
+        model_requests = []
+
+        @wrap_model_call
+        def trace_model_requests(request, handler):
+            model_requests.append(request)
+            return handler(request)
+
+        tool_selection_model = RecordingFakeModel(
+            messages=cycle(
+                [
+                    AIMessage(
+                        content="",
+                        tool_calls=[
+                            {
+                                "name": "ToolSelectionResponse",
+                                "id": "1",
+                                "args": {"tools": ["get_stock_price"]},
+                            }
+                        ],
+                    ),
+                ]
+            )
+        )
+        tool_selector = LLMToolSelectorMiddleware(
+            max_tools=1, model=tool_selection_model, embeddings=KeywordEmbeddings()
+        )
+
+        agent = create_agent(
+            model=FakeModel(messages=iter([AIMessage(content="Done")])),
+            tools=[get_weather, search_web, calculate, send_email, get_stock_price],
+            middleware=[tool_selector, trace_model_requests],
+        )
+
+        agent.invoke({"messages": [HumanMessage("Weather or stock price?")]})
+
+        assert [tool.name for tool in model_requests[0].tools] == ["get_stock_price"]
+        # Only the two most similar tools are offered to the selection model
+        (schema,) = tool_selection_model.bound_tools[0]
+        options = schema["properties"]["tools"]["items"]["anyOf"]
+        assert sorted(option["const"] for option in options) == [
+            "get_stock_price",
+            "get_weather",
+        ]
+
+    def test_selection_schema_is_cached(self) -> None:
+        """Test that the selection schema is reused for the same tools."""
+        schema = _get_tool_selection_schema([get_weather, calculate])
+        schema["title"] = "Modified"
+
+        assert _get_tool_selection_schema([get_weather, calculate]) == (
+            _create_tool_selection_response([get_weather, calculate]).json_schema()
+        )
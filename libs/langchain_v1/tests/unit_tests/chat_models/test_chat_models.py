@@ -1,5 +1,5 @@
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
@@ -285,3 +285,36 @@ def test_configurable_with_default() -> None:
     prompt = ChatPromptTemplate.from_messages([("system", "foo")])
     chain = prompt | model_with_config
     assert isinstance(chain, RunnableSequence)
+
+
+def test_configurable_model_cache() -> None:
+    """Test that configurable models reuse the models they initialize."""
+    with mock.patch(
+        "langchain.chat_models.base._init_chat_model_helper",
+        side_effect=lambda **_: mock.MagicMock(),
+    ) as init_helper:
+        model = init_chat_model(configurable_fields=("model", "temperature"))
+
+        def resolve(configurable_model: Any, **configurable: Any) -> Any:
+            return configurable_model._model({"configurable": configurable})
+
+        first = resolve(model, model="foo")
+        assert resolve(model, model="foo") is first
+        assert resolve(model, model="bar") is not first
+        assert init_helper.call_count == 2
+
+        # Derived models share the cache and are keyed by their operations.
+        tools = [{"name": "foo", "description": "foo", "parameters": {}}]
+        with_tools = resolve(model.bind_tools(tools), model="foo")
+        assert with_tools is not first
+        assert resolve(model.bind_tools(tools), model="foo") is with_tools
+        assert resolve(model.bind_tools([*tools]), model="foo") is with_tools
+        assert resolve(model.bind_tools(tools, tool_choice="any"), model="foo") is not (with_tools)
+        assert init_helper.call_count == 4
+
+        # Least recently used models are evicted.
+        model._model_cache.maxsize = 2
+        resolve(model, model="foo", temperature=0)
+        assert resolve(model, model="foo", temperature=0.5) is not first
+        assert resolve(model, model="foo") is not first
+        assert init_helper.call_count == 7
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import Any
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.embeddings import Embeddings
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing_extensions import Self
 
 from langchain_huggingface.utils.import_utils import (
     IMPORT_ERROR,
@@ -12,6 +15,9 @@ from langchain_huggingface.utils.import_utils import (
     is_optimum_intel_version,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _MIN_OPTIMUM_VERSION = "1.22"
 
 
@@ -57,10 +63,21 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
     `precision`, `normalize_embeddings`, and more.
     See also the Sentence Transformer documentation: https://sbert.net/docs/package_reference/SentenceTransformer.html#sentence_transformers.SentenceTransformer.encode"""
     multi_process: bool = False
-    """Run encode() on multiple GPUs."""
+    """Run encode() on multiple GPUs or CPU processes.
+
+    The process pool is started on first use and kept until `close` is called or the
+    embeddings object is garbage collected."""
+    target_devices: list[str] | None = None
+    """Devices to start a `multi_process` worker on, such as `["cuda:0", "cuda:1"]`
+    or `["cpu"] * os.cpu_count()`.
+    If `None`, all available CUDA devices are used, or 4 CPU workers."""
     show_progress: bool = False
     """Whether to show a progress bar."""
 
+    _pool: dict[str, Any] | None = PrivateAttr(default=None)
+    _pool_finalizer: weakref.finalize | None = PrivateAttr(default=None)
+    _pool_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     def __init__(self, **kwargs: Any):
         """Initialize the sentence_transformer."""
         super().__init__(**kwargs)
@@ -104,10 +121,56 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
         populate_by_name=True,
     )
 
-    def _embed(
-        self, texts: list[str], encode_kwargs: dict[str, Any]
-    ) -> list[list[float]]:
-        """Embed a text using the HuggingFace transformer model.
+    def __copy__(self) -> Self:
+        copied = super().__copy__()
+        # Copies start their own pool, so that closing one doesn't stop the other's.
+        copied._pool = None
+        copied._pool_finalizer = None
+        copied._pool_lock = threading.Lock()
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> Self:
+        memo = {} if memo is None else memo
+        # Leave the pool and its worker processes out of the copy.
+        memo[id(self._pool_lock)] = threading.Lock()
+        if self._pool is not None:
+            memo[id(self._pool)] = None
+        if self._pool_finalizer is not None:
+            memo[id(self._pool_finalizer)] = None
+        return super().__deepcopy__(memo)
+
+    def _get_pool(self) -> dict[str, Any]:
+        """Get the multi-process pool, starting it on first use."""
+        with self._pool_lock:
+            if self._pool is None:
+                import sentence_transformers  # type: ignore[import]
+
+                pool = self._client.start_multi_process_pool(
+                    target_devices=self.target_devices
+                )
+                # Stop the worker processes when the embeddings object is collected
+                # or at interpreter exit, if `close` wasn't called.
+                self._pool_finalizer = weakref.finalize(
+                    self,
+                    sentence_transformers.SentenceTransformer.stop_multi_process_pool,
+                    pool,
+                )
+                self._pool = pool
+            return self._pool
+
+    def close(self) -> None:
+        """Stop the multi-process pool, if started.
+
+        The pool is started again if the embeddings object is used afterwards.
+        """
+        with self._pool_lock:
+            if self._pool_finalizer is not None:
+                self._pool_finalizer()
+            self._pool = None
+            self._pool_finalizer = None
+
+    def _embed_array(self, texts: list[str], encode_kwargs: dict[str, Any]) -> Any:
+        """Embed texts using the HuggingFace transformer model.
 
         Args:
             texts: The list of texts to embed.
@@ -116,16 +179,21 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
                 encode method.
 
         Returns:
-            List of embeddings, one for each text.
+            Array of embeddings, one row for each text.
 
         """
-        import sentence_transformers  # type: ignore[import]
+        import numpy as np
 
         texts = [x.replace("\n", " ") for x in texts]
         if self.multi_process:
-            pool = self._client.start_multi_process_pool()
-            embeddings = self._client.encode_multi_process(texts, pool)
-            sentence_transformers.SentenceTransformer.stop_multi_process_pool(pool)
+            # Chunks sent to the workers hold texts of similar length, which reduces
+            # padding within their batches.
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+            sorted_embeddings = self._client.encode_multi_process(
+                [texts[i] for i in order], self._get_pool()
+            )
+            embeddings = np.empty_like(sorted_embeddings)
+            embeddings[order] = sorted_embeddings
         else:
             embeddings = self._client.encode(
                 texts,
@@ -140,7 +208,44 @@ class HuggingFaceEmbeddings(BaseModel, Embeddings):
             )
             raise TypeError(msg)
 
-        return embeddings.tolist()  # type: ignore[return-type]
+        if not isinstance(embeddings, np.ndarray):
+            embeddings = embeddings.detach().cpu().numpy()
+        return embeddings
+
+    def _embed(
+        self, texts: list[str], encode_kwargs: dict[str, Any]
+    ) -> list[list[float]]:
+        """Embed a text using the HuggingFace transformer model.
+
+        Args:
+            texts: The list of texts to embed.
+            encode_kwargs: Keyword arguments to pass when calling the
+                `encode` method for the documents of the SentenceTransformer
+                encode method.
+
+        Returns:
+            List of embeddings, one for each text.
+
+        """
+        return self._embed_array(texts, encode_kwargs).tolist()
+
+    def embed_documents_array(self, texts: list[str]) -> np.ndarray:
+        """Compute doc embeddings as a NumPy array.
+
+        Unlike `embed_documents`, the embeddings are not converted to Python lists,
+        which saves time and memory for large numbers of texts.
+
+        Args:
+            texts: The list of texts to embed.
+
+        Returns:
+            A `float32` array of shape `(len(texts), dimension)`.
+
+        """
+        import numpy as np
+
+        embeddings = self._embed_array(texts, self.encode_kwargs)
+        return embeddings.astype(np.float32, copy=False)
 
     def embed_documents(self, texts: list[str]) -> list[list[float]]:
         """Compute doc embeddings using a HuggingFace transformer model.
@@ -0,0 +1,504 @@
+"""Continuous batching of text generation with a local causal language model."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import TypedDict
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import torch
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_NEW_TOKENS = 256
+_PREFIX_BLOCK_SIZE = 32
+
+_KVCache = list[tuple["torch.Tensor", "torch.Tensor"]]
+
+
+class EngineStats(TypedDict):
+    """Prefill metrics of a `ContinuousBatchingEngine`."""
+
+    prefill_tokens: int
+    """Number of prompt tokens run through the model."""
+
+    prefill_tokens_saved: int
+    """Number of prompt tokens whose KV cache was reused from the prefix cache."""
+
+    prefix_cache_hits: int
+    """Number of prompts that reused a cached prefix."""
+
+    prefix_cache_misses: int
+    """Number of prompts that didn't reuse a cached prefix."""
+
+    prefix_cache_bytes: int
+    """Memory used by the prefix cache."""
+
+
+@dataclass
+class _Sequence:
+    """A generation request and its progress."""
+
+    prompt_ids: list[int]
+    max_new_tokens: int
+    stop_token_ids: frozenset[int]
+    do_sample: bool
+    temperature: float
+    top_k: int
+    top_p: float
+    on_text: Callable[[str], None] | None
+    future: Future[str] = field(default_factory=Future)
+    generated: list[int] = field(default_factory=list)
+    text: str = ""
+    length: int = 0
+    """Number of tokens of the sequence in the KV cache."""
+
+
+@dataclass
+class _PrefixEntry:
+    token_ids: tuple[int, ...]
+    cache: _KVCache
+    nbytes: int
+    block_keys: list[int]
+
+
+class _PrefixCache:
+    """LRU cache of the KV cache of prompts, looked up by their token prefixes.
+
+    The KV cache of each stored prompt can be reused by any prompt that shares a
+    prefix of a multiple of `_PREFIX_BLOCK_SIZE` tokens with it. Prefixes are found
+    by a hash of their token IDs, chained block by block.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._entries: OrderedDict[int, _PrefixEntry] = OrderedDict()
+        self._blocks: dict[int, tuple[int, int]] = {}
+        self._next_id = 0
+
+    @staticmethod
+    def _block_keys(token_ids: list[int]) -> list[int]:
+        """Get the hash of each block-aligned prefix of the token IDs."""
+        keys = []
+        key = 0
+        for end in range(_PREFIX_BLOCK_SIZE, len(token_ids) + 1, _PREFIX_BLOCK_SIZE):
+            key = hash((key, *token_ids[end - _PREFIX_BLOCK_SIZE : end]))
+            keys.append(key)
+        return keys
+
+    def lookup(self, token_ids: list[int]) -> tuple[int, _KVCache] | None:
+        """Get the KV cache of the longest cached prefix of a prompt.
+
+        The prefix is shorter than the prompt, so that the last prompt token is
+        always run through the model to get the logits of the next one.
+
+        Returns:
+            The length of the prefix and its KV cache, or `None` on a cache miss.
+        """
+        keys = self._block_keys(token_ids[:-1])
+        for i in reversed(range(len(keys))):
+            if (match := self._blocks.get(keys[i])) is None:
+                continue
+            entry_id, length = match
+            entry = self._entries[entry_id]
+            if entry.token_ids[:length] != tuple(token_ids[:length]):
+                continue
+            self._entries.move_to_end(entry_id)
+            return length, [
+                (key[:, :, :length], value[:, :, :length]) for key, value in entry.cache
+            ]
+        return None
+
+    def store(self, token_ids: list[int], cache: _KVCache) -> None:
+        """Store the KV cache of a prompt, evicting the least recently used ones."""
+        keys = self._block_keys(token_ids)
+        nbytes = sum(key.nbytes + value.nbytes for key, value in cache)
+        if not keys or nbytes > self.max_bytes:
+            return
+        while self.nbytes + nbytes > self.max_bytes:
+            self._evict()
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = _PrefixEntry(tuple(token_ids), cache, nbytes, keys)
+        self.nbytes += nbytes
+        for i, key in enumerate(keys):
+            self._blocks[key] = (entry_id, (i + 1) * _PREFIX_BLOCK_SIZE)
+
+    def _evict(self) -> None:
+        entry_id, entry = self._entries.popitem(last=False)
+        self.nbytes -= entry.nbytes
+        for key in entry.block_keys:
+            if self._blocks.get(key, (None,))[0] == entry_id:
+                del self._blocks[key]
+
+
+class ContinuousBatchingEngine:
+    """Generate text for concurrent requests in shared decode batches.
+
+    Requests are queued by `submit` from any thread. A worker thread runs the
+    requests: at each decoding step it admits the waiting requests into the running
+    batch, up to `max_batch_size` sequences, after computing the KV cache of their
+    prompt, and it retires the sequences that are finished. All the running
+    sequences are decoded together with a single forward pass, their KV caches
+    being left-padded to the same length.
+
+    If `prefix_cache_bytes` is set, the KV caches of recent prompts are kept, and
+    the prefill of a prompt that starts with the same tokens as one of them, such as
+    a long system prompt, only runs the tokens after the shared prefix.
+
+    Only decoder-only models that support `DynamicCache` are supported. The worker
+    thread stops when there are no requests, and is started again by `submit`.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        *,
+        max_batch_size: int,
+        prefix_cache_bytes: int = 0,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            model: Causal language model, such as the model of a `text-generation`
+                pipeline.
+            tokenizer: Tokenizer of the model.
+            max_batch_size: Maximum number of sequences decoded together.
+            prefix_cache_bytes: Memory budget of the KV caches kept for prompt
+                prefix reuse. `0` disables the prefix cache.
+        """
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_batch_size = max_batch_size
+        self._prefix_cache = (
+            _PrefixCache(prefix_cache_bytes) if prefix_cache_bytes > 0 else None
+        )
+        self._prefill_tokens = 0
+        self._prefill_tokens_saved = 0
+        self._prefix_cache_hits = 0
+        self._prefix_cache_misses = 0
+        self._condition = threading.Condition()
+        self._waiting: deque[_Sequence] = deque()
+        self._worker: threading.Thread | None = None
+        # State of the running batch, only used by the worker thread
+        self._active: list[_Sequence] = []
+        self._cache: _KVCache = []
+        self._attention_mask: torch.Tensor | None = None
+
+    def submit(
+        self,
+        prompt: str,
+        *,
+        generation_kwargs: dict[str, Any] | None = None,
+        stop_token_ids: list[int] | None = None,
+        on_text: Callable[[str], None] | None = None,
+    ) -> Future[str]:
+        """Queue a generation request.
+
+        Args:
+            prompt: Prompt to complete.
+            generation_kwargs: Generation parameters that override the generation
+                config of the model: `max_new_tokens`, `do_sample`, `temperature`,
+                `top_k` and `top_p`.
+            stop_token_ids: Additional token IDs that end the generation, besides
+                the EOS tokens of the model.
+            on_text: Called from the worker thread with each new piece of
+                generated text.
+
+        Returns:
+            Future of the generated text, without the prompt.
+        """
+        config = self.model.generation_config
+        params = {
+            "max_new_tokens": config.max_new_tokens,
+            "do_sample": config.do_sample,
+            "temperature": config.temperature,
+            "top_k": config.top_k,
+            "top_p": config.top_p,
+            **(generation_kwargs or {}),
+        }
+        prompt_ids = self.tokenizer(prompt)["input_ids"]
+        max_new_tokens = params["max_new_tokens"]
+        if max_new_tokens is None:
+            max_new_tokens = (
+                config.max_length - len(prompt_ids)
+                if config.max_length is not None
+                else _DEFAULT_MAX_NEW_TOKENS
+            )
+        eos_token_id = config.eos_token_id
+        if eos_token_id is None:
+            eos_token_id = []
+        elif isinstance(eos_token_id, int):
+            eos_token_id = [eos_token_id]
+
+        sequence = _Sequence(
+            prompt_ids=prompt_ids,
+            max_new_tokens=max(max_new_tokens, 1),
+            stop_token_ids=frozenset([*eos_token_id, *(stop_token_ids or [])]),
+            do_sample=bool(params["do_sample"]),
+            temperature=params["temperature"] or 1.0,
+            top_k=params["top_k"] or 0,
+            top_p=params["top_p"] if params["top_p"] is not None else 1.0,
+            on_text=on_text,
+        )
+        with self._condition:
+            self._waiting.append(sequence)
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="continuous-batching", daemon=True
+                )
+                self._worker.start()
+        return sequence.future
+
+    def stats(self) -> EngineStats:
+        """Get the prefill metrics of the requests run so far.
+
+        Returns:
+            The number of prompt tokens prefilled and reused, and the usage of the
+                prefix cache.
+        """
+        return EngineStats(
+            prefill_tokens=self._prefill_tokens,
+            prefill_tokens_saved=self._prefill_tokens_saved,
+            prefix_cache_hits=self._prefix_cache_hits,
+            prefix_cache_misses=self._prefix_cache_misses,
+            prefix_cache_bytes=self._prefix_cache.nbytes if self._prefix_cache else 0,
+        )
+
+    def _run(self) -> None:
+        import torch
+
+        with torch.inference_mode():
+            while True:
+                with self._condition:
+                    admitted = [
+                        self._waiting.popleft()
+                        for _ in range(
+                            min(
+                                self.max_batch_size - len(self._active),
+                                len(self._waiting),
+                            )
+                        )
+                    ]
+                    if not admitted and not self._active:
+                        self._worker = None
+                        return
+                try:
+                    for sequence in admitted:
+                        if not sequence.future.cancelled():
+                            self._prefill(sequence)
+                    if self._active:
+                        self._decode_step()
+                except BaseException as e:
+                    logger.exception("Continuous batching step failed")
+                    for sequence in [*admitted, *self._active]:
+                        # The future may be cancelled concurrently
+                        with contextlib.suppress(InvalidStateError):
+                            sequence.future.set_exception(e)
+                    self._active = []
+                    self._cache = []
+                    self._attention_mask = None
+
+    def _prefill(self, sequence: _Sequence) -> None:
+        """Compute the KV cache of a prompt and add the sequence to the batch."""
+        import torch
+        from transformers import DynamicCache
+
+        prompt_ids = sequence.prompt_ids
+        reused = 0
+        past_key_values = None
+        if self._prefix_cache is not None:
+            if (match := self._prefix_cache.lookup(prompt_ids)) is not None:
+                reused, prefix = match
+                past_key_values = DynamicCache.from_legacy_cache(tuple(prefix))  # type: ignore[arg-type]
+                self._prefix_cache_hits += 1
+                logger.debug("Reused the KV cache of %d prompt tokens", reused)
+            else:
+                self._prefix_cache_misses += 1
+
+        input_ids = torch.tensor([prompt_ids[reused:]], device=self.model.device)
+        outputs = self.model(
+            input_ids=input_ids, past_key_values=past_key_values, use_cache=True
+        )
+        self._prefill_tokens += len(prompt_ids) - reused
+        self._prefill_tokens_saved += reused
+        cache = _to_legacy_cache(outputs.past_key_values)
+        if self._prefix_cache is not None:
+            self._prefix_cache.store(prompt_ids, cache)
+
+        sequence.length = len(prompt_ids)
+        if self._append_token(sequence, outputs.logits[0, -1]):
+            return
+
+        attention_mask = torch.ones(
+            (1, sequence.length), dtype=torch.long, device=self.model.device
+        )
+        if self._attention_mask is None:
+            self._cache, self._attention_mask = cache, attention_mask
+        else:
+            self._cache, self._attention_mask = _concat_batches(
+                self._cache, self._attention_mask, cache, attention_mask
+            )
+        self._active.append(sequence)
+
+    def _decode_step(self) -> None:
+        """Generate the next token of all the sequences in the batch."""
+        import torch
+        from transformers import DynamicCache
+
+        if self._attention_mask is None:
+            return
+        device = self.model.device
+        input_ids = torch.tensor(
+            [[sequence.generated[-1]] for sequence in self._active], device=device
+        )
+        position_ids = torch.tensor(
+            [[sequence.length] for sequence in self._active], device=device
+        )
+        attention_mask = torch.cat(
+            [
+                self._attention_mask,
+                torch.ones((len(self._active), 1), dtype=torch.long, device=device),
+            ],
+            dim=1,
+        )
+        outputs = self.model(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            position_ids=position_ids,
+            past_key_values=DynamicCache.from_legacy_cache(tuple(self._cache)),  # type: ignore[arg-type]
+            use_cache=True,
+        )
+        self._cache = _to_legacy_cache(outputs.past_key_values)
+        self._attention_mask = attention_mask
+
+        keep = []
+        for i, sequence in enumerate(self._active):
+            sequence.length += 1
+            if not self._append_token(sequence, outputs.logits[i, -1]):
+                keep.append(i)
+        if len(keep) < len(self._active):
+            self._retire(keep)
+
+    def _retire(self, keep: list[int]) -> None:
+        """Remove the finished sequences from the batch."""
+        self._active = [self._active[i] for i in keep]
+        if not self._active or self._attention_mask is None:
+            self._cache = []
+            self._attention_mask = None
+            return
+        import torch
+
+        index = torch.tensor(keep, device=self.model.device)
+        attention_mask = self._attention_mask.index_select(0, index)
+        # Drop the padding columns that no remaining sequence uses
+        start = int(attention_mask.any(dim=0).nonzero()[0])
+        self._attention_mask = attention_mask[:, start:]
+        self._cache = [
+            (
+                key.index_select(0, index)[:, :, start:],
+                value.index_select(0, index)[:, :, start:],
+            )
+            for key, value in self._cache
+        ]
+
+    def _append_token(self, sequence: _Sequence, logits: torch.Tensor) -> bool:
+        """Add the next token to a sequence.
+
+        Returns:
+            Whether the sequence is finished.
+        """
+        if sequence.future.cancelled():
+            return True
+        token = _next_token(logits, sequence)
+        finished = token in sequence.stop_token_ids
+        if not finished:
+            sequence.generated.append(token)
+            self._emit_text(sequence)
+        if finished or len(sequence.generated) >= sequence.max_new_tokens:
+            # The future may be cancelled concurrently
+            with contextlib.suppress(InvalidStateError):
+                sequence.future.set_result(sequence.text)
+            return True
+        return False
+
+    def _emit_text(self, sequence: _Sequence) -> None:
+        text = self.tokenizer.decode(sequence.generated, skip_special_tokens=True)
+        # Wait for the rest of the bytes of an incomplete character
+        if text.endswith("\ufffd") or len(text) <= len(sequence.text):
+            return
+        new_text = text[len(sequence.text) :]
+        sequence.text = text
+        if sequence.on_text is not None:
+            sequence.on_text(new_text)
+
+
+def _to_legacy_cache(cache: Any) -> _KVCache:
+    if hasattr(cache, "to_legacy_cache"):
+        cache = cache.to_legacy_cache()
+    return [(key, value) for key, value in cache]
+
+
+def _concat_batches(
+    cache: _KVCache,
+    attention_mask: torch.Tensor,
+    other_cache: _KVCache,
+    other_attention_mask: torch.Tensor,
+) -> tuple[_KVCache, torch.Tensor]:
+    """Concatenate two batches, left-padding them to the same length."""
+    import torch
+    import torch.nn.functional as F
+
+    length = max(attention_mask.shape[1], other_attention_mask.shape[1])
+
+    def pad(tensor: torch.Tensor, dim: int) -> torch.Tensor:
+        # F.pad takes (left, right) amounts starting from the last dimension
+        padding = [0, 0] * (tensor.dim() - 1 - dim) + [length - tensor.shape[dim], 0]
+        return F.pad(tensor, padding)
+
+    merged_cache = [
+        (
+            torch.cat([pad(key, 2), pad(other_key, 2)]),
+            torch.cat([pad(value, 2), pad(other_value, 2)]),
+        )
+        for (key, value), (other_key, other_value) in zip(
+            cache, other_cache, strict=True
+        )
+    ]
+    merged_mask = torch.cat([pad(attention_mask, 1), pad(other_attention_mask, 1)])
+    return merged_cache, merged_mask
+
+
+def _next_token(logits: torch.Tensor, sequence: _Sequence) -> int:
+    """Pick the next token of a sequence from the logits of its last position."""
+    import torch
+
+    if not sequence.do_sample:
+        return int(logits.argmax())
+
+    logits = logits.float() / sequence.temperature
+    if 0 < sequence.top_k < logits.shape[-1]:
+        threshold = torch.topk(logits, sequence.top_k).values[-1]
+        logits = logits.masked_fill(logits < threshold, float("-inf"))
+    if sequence.top_p < 1.0:
+        sorted_logits, sorted_indices = torch.sort(logits, descending=True)
+        cumulative = sorted_logits.softmax(dim=-1).cumsum(dim=-1)
+        # Remove the tokens after the cumulative probability exceeds top_p, keeping
+        # at least the most likely one
+        removed = cumulative - sorted_logits.softmax(dim=-1) >= sequence.top_p
+        logits = logits.masked_fill(
+            torch.zeros_like(removed).scatter(0, sorted_indices, removed),
+            float("-inf"),
+        )
+    return int(torch.multinomial(logits.softmax(dim=-1), num_samples=1))
@@ -2,14 +2,22 @@ from __future__ import annotations  # type: ignore[import-not-found]
 
 import importlib.util
 import logging
-from collections.abc import Iterator, Mapping
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import Future
+from queue import Queue
 from typing import Any
 
 from langchain_core.callbacks import CallbackManagerForLLMRun
 from langchain_core.language_models.llms import BaseLLM
 from langchain_core.outputs import Generation, GenerationChunk, LLMResult
-from pydantic import ConfigDict, model_validator
+from pydantic import ConfigDict, PrivateAttr, model_validator
+from typing_extensions import Self
 
+from langchain_huggingface.llms._continuous_batching import (
+    ContinuousBatchingEngine,
+    EngineStats,
+)
 from langchain_huggingface.utils.import_utils import (
     IMPORT_ERROR,
     is_ipex_available,
@@ -87,6 +95,25 @@ class HuggingFacePipeline(BaseLLM):
     batch_size: int = DEFAULT_BATCH_SIZE
     """Batch size to use when passing multiple documents to generate."""
 
+    continuous_batching: bool = False
+    """Whether to generate with a shared engine that decodes concurrent requests
+    together, for the `text-generation` task.
+
+    Requests join the running batch at each decoding step and leave it as soon as
+    they are finished, so concurrent calls from different threads share forward
+    passes. `batch_size` is the maximum number of sequences decoded together.
+
+    Only the `max_new_tokens`, `do_sample`, `temperature`, `top_k` and `top_p`
+    generation parameters are supported, and `stop` tokens end the generation."""
+
+    prefix_cache_size_mb: int = 0
+    """Memory budget in MB of the KV caches of recent prompts, kept to skip the
+    prefill of the prefix shared with them by new prompts, such as a long system
+    prompt. Requires `continuous_batching`. `0` disables the prefix cache."""
+
+    _engine: ContinuousBatchingEngine | None = PrivateAttr(default=None)
+    _engine_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     model_config = ConfigDict(
         extra="forbid",
     )
@@ -102,6 +129,14 @@ class HuggingFacePipeline(BaseLLM):
                 values["model_id"] = DEFAULT_MODEL_ID
         return values
 
+    @model_validator(mode="after")
+    def _validate_prefix_cache(self) -> Self:
+        """Ensure the prefix cache is only enabled with continuous batching."""
+        if self.prefix_cache_size_mb > 0 and not self.continuous_batching:
+            msg = "prefix_cache_size_mb requires continuous_batching=True"
+            raise ValueError(msg)
+        return self
+
     @classmethod
     def from_model_id(
         cls,
@@ -313,6 +348,79 @@ class HuggingFacePipeline(BaseLLM):
     def _llm_type(self) -> str:
         return "huggingface_pipeline"
 
+    def _get_engine(self) -> ContinuousBatchingEngine:
+        """Get the continuous batching engine, creating it on first use."""
+        if self.pipeline.task != "text-generation":
+            msg = (
+                "Continuous batching is only supported for the text-generation "
+                f"task, got {self.pipeline.task}"
+            )
+            raise ValueError(msg)
+        with self._engine_lock:
+            if self._engine is None:
+                self._engine = ContinuousBatchingEngine(
+                    self.pipeline.model,
+                    self.pipeline.tokenizer,
+                    max_batch_size=self.batch_size,
+                    prefix_cache_bytes=self.prefix_cache_size_mb * 1024 * 1024,
+                )
+            return self._engine
+
+    def generation_stats(self) -> EngineStats:
+        """Get the prefill metrics of the continuous batching engine.
+
+        Returns:
+            The number of prompt tokens prefilled and reused from the prefix cache,
+                and the usage of the prefix cache. All zero if nothing was generated
+                with continuous batching yet.
+        """
+        engine = self._engine
+        if engine is None:
+            return EngineStats(
+                prefill_tokens=0,
+                prefill_tokens_saved=0,
+                prefix_cache_hits=0,
+                prefix_cache_misses=0,
+                prefix_cache_bytes=0,
+            )
+        return engine.stats()
+
+    def _submit(
+        self,
+        prompt: str,
+        stop: list[str] | None,
+        pipeline_kwargs: dict[str, Any],
+        on_text: Callable[[str], None] | None = None,
+    ) -> Future[str]:
+        """Queue a prompt in the continuous batching engine."""
+        stop_token_ids = (
+            self.pipeline.tokenizer.convert_tokens_to_ids(stop) if stop else None
+        )
+        return self._get_engine().submit(
+            prompt,
+            generation_kwargs={**(self.pipeline_kwargs or {}), **pipeline_kwargs},
+            stop_token_ids=stop_token_ids,
+            on_text=on_text,
+        )
+
+    def _generate_continuous(
+        self, prompts: list[str], stop: list[str] | None, **kwargs: Any
+    ) -> LLMResult:
+        pipeline_kwargs = kwargs.get("pipeline_kwargs", {})
+        return_full_text = {**(self.pipeline_kwargs or {}), **pipeline_kwargs}.get(
+            "return_full_text", True
+        )
+        skip_prompt = kwargs.get("skip_prompt", False) or not return_full_text
+
+        futures = [self._submit(prompt, stop, pipeline_kwargs) for prompt in prompts]
+        text_generations = [
+            future.result() if skip_prompt else prompt + future.result()
+            for prompt, future in zip(prompts, futures, strict=True)
+        ]
+        return LLMResult(
+            generations=[[Generation(text=text)] for text in text_generations]
+        )
+
     def _generate(
         self,
         prompts: list[str],
@@ -320,6 +428,9 @@ class HuggingFacePipeline(BaseLLM):
         run_manager: CallbackManagerForLLMRun | None = None,
         **kwargs: Any,
     ) -> LLMResult:
+        if self.continuous_batching:
+            return self._generate_continuous(prompts, stop, **kwargs)
+
         # List to hold all results
         text_generations: list[str] = []
         pipeline_kwargs = kwargs.get("pipeline_kwargs", {})
@@ -372,6 +483,10 @@ class HuggingFacePipeline(BaseLLM):
         run_manager: CallbackManagerForLLMRun | None = None,
         **kwargs: Any,
     ) -> Iterator[GenerationChunk]:
+        if self.continuous_batching:
+            yield from self._stream_continuous(prompt, stop, run_manager, **kwargs)
+            return
+
         from threading import Thread
 
         import torch
@@ -420,3 +535,35 @@ class HuggingFacePipeline(BaseLLM):
                 run_manager.on_llm_new_token(chunk.text, chunk=chunk)
 
             yield chunk
+
+    def _stream_continuous(
+        self,
+        prompt: str,
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[GenerationChunk]:
+        pipeline_kwargs = kwargs.get("pipeline_kwargs", {})
+        skip_prompt = kwargs.get("skip_prompt", True)
+
+        texts: Queue[str | None] = Queue()
+        future = self._submit(prompt, stop, pipeline_kwargs, on_text=texts.put)
+        future.add_done_callback(lambda _: texts.put(None))
+
+        try:
+            if not skip_prompt:
+                chunk = GenerationChunk(text=prompt)
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+                yield chunk
+            while (text := texts.get()) is not None:
+                chunk = GenerationChunk(text=text)
+                if run_manager:
+                    run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+
+                yield chunk
+            # Raise the generation error, if any
+            future.result()
+        finally:
+            # Free the batch slot if the stream is not consumed to the end
+            future.cancel()
@@ -0,0 +1,128 @@
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from langchain_huggingface import HuggingFaceEmbeddings
+
+
+class FakeSentenceTransformer:
+    """Embeds each text as `[len(text), 1]`, and records its multi-process pools."""
+
+    started: list[dict[str, Any]] = []
+    stopped: list[dict[str, Any]] = []
+
+    def __init__(self, model_name: str, **kwargs: Any) -> None:
+        self.model_name = model_name
+
+    @staticmethod
+    def _encode(texts: list[str]) -> np.ndarray:
+        return np.array([[len(text), 1] for text in texts], dtype=np.float64)
+
+    def encode(self, texts: list[str], **kwargs: Any) -> np.ndarray:
+        return self._encode(texts)
+
+    def start_multi_process_pool(
+        self, target_devices: list[str] | None = None
+    ) -> dict[str, Any]:
+        pool = {"target_devices": target_devices, "texts": []}
+        FakeSentenceTransformer.started.append(pool)
+        return pool
+
+    @staticmethod
+    def stop_multi_process_pool(pool: dict[str, Any]) -> None:
+        FakeSentenceTransformer.stopped.append(pool)
+
+    def encode_multi_process(
+        self, texts: list[str], pool: dict[str, Any], **kwargs: Any
+    ) -> np.ndarray:
+        pool["texts"].append(texts)
+        return self._encode(texts)
+
+
+@pytest.fixture
+def fake_sentence_transformer() -> Iterator[type[FakeSentenceTransformer]]:
+    FakeSentenceTransformer.started = []
+    FakeSentenceTransformer.stopped = []
+    with patch("sentence_transformers.SentenceTransformer", FakeSentenceTransformer):
+        yield FakeSentenceTransformer
+
+
+def test_multi_process_pool_is_reused(
+    fake_sentence_transformer: type[FakeSentenceTransformer],
+) -> None:
+    embeddings = HuggingFaceEmbeddings(
+        model_name="fake", multi_process=True, target_devices=["cpu", "cpu"]
+    )
+
+    assert embeddings.embed_documents(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    assert embeddings.embed_query("ccc") == [3.0, 1.0]
+    assert len(fake_sentence_transformer.started) == 1
+    assert fake_sentence_transformer.started[0]["target_devices"] == ["cpu", "cpu"]
+    assert fake_sentence_transformer.stopped == []
+
+    embeddings.close()
+    assert fake_sentence_transformer.stopped == fake_sentence_transformer.started
+    embeddings.close()
+    assert len(fake_sentence_transformer.stopped) == 1
+
+    # The pool is started again on the next call
+    assert embeddings.embed_documents(["a"]) == [[1.0, 1.0]]
+    assert len(fake_sentence_transformer.started) == 2
+    embeddings.close()
+    assert len(fake_sentence_transformer.stopped) == 2
+
+
+@pytest.mark.parametrize("deep", [False, True])
+def test_multi_process_pool_is_not_shared_with_copies(
+    fake_sentence_transformer: type[FakeSentenceTransformer], *, deep: bool
+) -> None:
+    embeddings = HuggingFaceEmbeddings(model_name="fake", multi_process=True)
+    embeddings.embed_documents(["a"])
+
+    copied = embeddings.model_copy(deep=deep)
+    copied.close()
+    assert fake_sentence_transformer.stopped == []
+
+    assert copied.embed_documents(["bb"]) == [[2.0, 1.0]]
+    assert len(fake_sentence_transformer.started) == 2
+    copied.close()
+    assert fake_sentence_transformer.stopped == [fake_sentence_transformer.started[1]]
+
+    # The original keeps using its own pool
+    assert embeddings.embed_documents(["ccc"]) == [[3.0, 1.0]]
+    assert fake_sentence_transformer.started[0]["texts"] == [["a"], ["ccc"]]
+    embeddings.close()
+
+
+def test_multi_process_restores_order(
+    fake_sentence_transformer: type[FakeSentenceTransformer],
+) -> None:
+    embeddings = HuggingFaceEmbeddings(model_name="fake", multi_process=True)
+    texts = ["bb", "a", "dddd", "ccc", "a"]
+
+    result = embeddings.embed_documents(texts)
+
+    # The workers get the texts sorted by length, and the output is in input order
+    assert fake_sentence_transformer.started[0]["texts"] == [
+        ["dddd", "ccc", "bb", "a", "a"]
+    ]
+    assert result == [[float(len(text)), 1.0] for text in texts]
+    embeddings.close()
+
+
+@pytest.mark.parametrize("multi_process", [False, True])
+def test_embed_documents_array(
+    fake_sentence_transformer: type[FakeSentenceTransformer], *, multi_process: bool
+) -> None:
+    embeddings = HuggingFaceEmbeddings(model_name="fake", multi_process=multi_process)
+    texts = ["bb", "a", "ccc"]
+
+    result = embeddings.embed_documents_array(texts)
+
+    assert result.dtype == np.float32
+    assert result.shape == (3, 2)
+    np.testing.assert_array_equal(result[:, 0], [2, 1, 3])
+    embeddings.close()
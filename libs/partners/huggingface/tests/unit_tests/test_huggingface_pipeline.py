@@ -1,5 +1,11 @@
+import time
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from langchain_huggingface import HuggingFacePipeline
 
 DEFAULT_MODEL_ID = "gpt2"
@@ -45,3 +51,182 @@ def test_initialization_with_from_model_id(
     )
 
     assert llm.model_id == "mock-model-id"
+
+
+def _tiny_text_generation_pipeline() -> Any:
+    """Create a randomly initialized character-level Llama pipeline."""
+    torch = pytest.importorskip("torch")
+    from tokenizers import (  # type: ignore[import-untyped]
+        Tokenizer,
+        decoders,
+        models,
+        pre_tokenizers,
+    )
+    from transformers import (
+        LlamaConfig,
+        LlamaForCausalLM,
+        PreTrainedTokenizerFast,
+        pipeline,
+    )
+
+    tokens = ["<unk>", "<s>", "</s>"] + [chr(i) for i in range(32, 127)]
+    tokenizer_object = Tokenizer(
+        models.WordLevel({token: i for i, token in enumerate(tokens)}, "<unk>")
+    )
+    tokenizer_object.pre_tokenizer = pre_tokenizers.Split("", "isolated")
+    tokenizer_object.decoder = decoders.Fuse()
+    special_tokens = {"unk_token": "<unk>", "bos_token": "<s>", "eos_token": "</s>"}
+    tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer_object, **special_tokens
+    )
+    torch.manual_seed(0)
+    config = LlamaConfig(
+        vocab_size=len(tokens),
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=2,
+        bos_token_id=1,
+        eos_token_id=2,
+        pad_token_id=2,
+    )
+    model = LlamaForCausalLM(config).eval()
+    return pipeline("text-generation", model=model, tokenizer=tokenizer)
+
+
+def test_continuous_batching_matches_generate() -> None:
+    """Test concurrent requests decoded together match separate generation."""
+    pipe = _tiny_text_generation_pipeline()
+    llm = HuggingFacePipeline(pipeline=pipe, continuous_batching=True, batch_size=2)
+    prompts = ["hello world", "a", "the quick brown fox", "xyz" * 5]
+    max_new_tokens = [12, 3, 20, 8]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outputs = list(
+            executor.map(
+                lambda prompt, n: llm.invoke(
+                    prompt, pipeline_kwargs={"max_new_tokens": n}, skip_prompt=True
+                ),
+                prompts,
+                max_new_tokens,
+            )
+        )
+
+    for prompt, n, output in zip(prompts, max_new_tokens, outputs, strict=True):
+        input_ids = pipe.tokenizer(prompt, return_tensors="pt")["input_ids"]
+        expected = pipe.model.generate(input_ids, max_new_tokens=n, do_sample=False)
+        assert output == pipe.tokenizer.decode(
+            expected[0, input_ids.shape[1] :], skip_special_tokens=True
+        )
+
+
+def test_continuous_batching_stream() -> None:
+    """Test streaming with continuous batching."""
+    llm = HuggingFacePipeline(
+        pipeline=_tiny_text_generation_pipeline(),
+        continuous_batching=True,
+        pipeline_kwargs={"max_new_tokens": 5},
+    )
+
+    chunks = list(llm.stream("hello"))
+
+    assert 0 < len(chunks) <= 5
+    assert llm.invoke("hello") == "hello" + "".join(chunks)
+
+
+def test_continuous_batching_stream_prompt() -> None:
+    """Test that the prompt is streamed first when it is not skipped."""
+    llm = HuggingFacePipeline(
+        pipeline=_tiny_text_generation_pipeline(),
+        continuous_batching=True,
+        pipeline_kwargs={"max_new_tokens": 3},
+    )
+
+    chunks = list(llm.stream("hello", skip_prompt=False))
+
+    assert chunks[0] == "hello"
+    assert "".join(chunks) == llm.invoke("hello")
+
+
+def test_continuous_batching_stream_closed_early() -> None:
+    """Test that a stream that is not consumed to the end frees its batch slot."""
+    pipe = _tiny_text_generation_pipeline()
+    # Never stop before `max_new_tokens`
+    pipe.model.generation_config.eos_token_id = None
+    llm = HuggingFacePipeline(
+        pipeline=pipe,
+        continuous_batching=True,
+        pipeline_kwargs={"max_new_tokens": 10_000},
+    )
+    futures = []
+    submit = llm._submit
+
+    def record_submit(*args: Any, **kwargs: Any) -> Any:
+        futures.append(submit(*args, **kwargs))
+        return futures[-1]
+
+    with patch.object(llm, "_submit", record_submit):
+        stream = cast("Generator[str, None, None]", llm.stream("hello"))
+        next(stream)
+        stream.close()
+
+    assert futures[0].cancelled()
+    engine = llm._engine
+    assert engine is not None
+    deadline = time.monotonic() + 10
+    while engine._worker is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert engine._worker is None
+
+
+def test_continuous_batching_prefix_cache() -> None:
+    """Test prompts sharing a prefix reuse its KV cache with the same outputs."""
+    pipe = _tiny_text_generation_pipeline()
+    system_prompt = "You are a helpful assistant. " * 5
+    questions = ["What is 1+1?", "What is 2+2?", "What is 3+3?"]
+    outputs = {}
+    for prefix_cache_size_mb in (0, 16):
+        llm = HuggingFacePipeline(
+            pipeline=pipe,
+            continuous_batching=True,
+            prefix_cache_size_mb=prefix_cache_size_mb,
+            pipeline_kwargs={"max_new_tokens": 8},
+        )
+        outputs[prefix_cache_size_mb] = [
+            llm.invoke(system_prompt + question) for question in questions
+        ]
+
+    assert outputs[16] == outputs[0]
+    stats = llm.generation_stats()
+    assert stats["prefix_cache_hits"] == 2
+    assert stats["prefix_cache_misses"] == 1
+    # The 145 character system prompt has 4 full blocks of 32 tokens
+    assert stats["prefill_tokens_saved"] == 2 * 128
+    assert stats["prefill_tokens"] == 3 * (145 + 12) - 2 * 128
+
+
+def test_prefix_cache_requires_continuous_batching() -> None:
+    """Test the prefix cache is rejected without continuous batching."""
+    mock_pipe = MagicMock()
+    mock_pipe.model.name_or_path = "mock-model-id"
+    with pytest.raises(ValueError, match="continuous_batching"):
+        HuggingFacePipeline(pipeline=mock_pipe, prefix_cache_size_mb=16)
+
+
+@pytest.mark.parametrize("task", ["text-generation", "summarization"])
+def test_generation_stats_without_engine(task: str) -> None:
+    """Test stats are zero before generating, without building an engine."""
+    mock_pipe = MagicMock()
+    mock_pipe.model.name_or_path = "mock-model-id"
+    mock_pipe.task = task
+    llm = HuggingFacePipeline(pipeline=mock_pipe, continuous_batching=True)
+
+    assert llm.generation_stats() == {
+        "prefill_tokens": 0,
+        "prefill_tokens_saved": 0,
+        "prefix_cache_hits": 0,
+        "prefix_cache_misses": 0,
+        "prefix_cache_bytes": 0,
+    }
+    assert llm._engine is None
@@ -2,15 +2,40 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import time
 from typing import Any
 
+import httpx
 from langchain_core.embeddings import Embeddings
-from ollama import AsyncClient, Client
-from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
+from langchain_core.runnables.config import get_executor_for_config
+from langchain_core.runnables.utils import gather_with_concurrency
+from ollama import AsyncClient, Client, ResponseError
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 from typing_extensions import Self
 
 from ._utils import merge_auth_headers, parse_url_with_auth, validate_model
 
+log = logging.getLogger(__name__)
+
+_RETRY_INITIAL_DELAY = 0.5
+"""Delay before the first retry of a chunk, in seconds, doubled on each retry."""
+
+_TOO_MANY_REQUESTS = 429
+_SERVER_ERROR = 500
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed embed request may succeed if sent again."""
+    if isinstance(error, ResponseError):
+        return (
+            error.status_code == _TOO_MANY_REQUESTS
+            or error.status_code >= _SERVER_ERROR
+        )
+    # `ollama` raises the built-in `ConnectionError` when it can't connect.
+    return isinstance(error, (httpx.TransportError, ConnectionError))
+
 
 class OllamaEmbeddings(BaseModel, Embeddings):
     """Ollama embedding model integration.
@@ -174,6 +199,33 @@ class OllamaEmbeddings(BaseModel, Embeddings):
     For a full list of the params, see the [httpx documentation](https://www.python-httpx.org/api/#client).
     """
 
+    chunk_size: int | None = Field(default=None, ge=1)
+    """Maximum number of texts to send in each request to the embed endpoint.
+
+    If `None`, all texts are sent in a single request.
+    """
+
+    max_concurrency: int = Field(default=1, ge=1)
+    """Maximum number of requests in flight at once when `chunk_size` is set.
+
+    Requests are sent from a thread pool for sync calls, and concurrently on the
+    event loop for async calls. Embeddings are returned in the order of the texts.
+    """
+
+    max_retries: int = Field(default=0, ge=0)
+    """Maximum number of times to retry a failed request.
+
+    Only the chunks whose requests failed with a connection error, a `429` or a
+    server error are sent again, with exponential backoff.
+    """
+
+    sort_by_length: bool = False
+    """Whether to group texts of similar length into the same chunk.
+
+    This reduces padding when the server embeds each chunk as a batch. Embeddings
+    are still returned in the order of the texts.
+    """
+
     _client: Client | None = PrivateAttr(default=None)
     """The client to use for making requests."""
 
@@ -290,17 +342,96 @@ class OllamaEmbeddings(BaseModel, Embeddings):
             validate_model(self._client, self.model)
         return self
 
-    def embed_documents(self, texts: list[str]) -> list[list[float]]:
-        """Embed search docs."""
+    def _chunks(self, texts: list[str]) -> tuple[list[list[str]], list[int] | None]:
+        """Split texts into the chunks to send in each request.
+
+        Returns:
+            The chunks, and the position of each text in the concatenated chunks if
+                texts were reordered.
+        """
+        order = None
+        if self.sort_by_length and self.chunk_size is not None:
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            texts = [texts[i] for i in order]
+        if self.chunk_size is None:
+            return [texts], order
+        chunks = [
+            texts[i : i + self.chunk_size]
+            for i in range(0, len(texts), self.chunk_size)
+        ]
+        return chunks, order
+
+    @staticmethod
+    def _reassemble(
+        results: list[list[list[float]]], order: list[int] | None
+    ) -> list[list[float]]:
+        embeddings = [embedding for result in results for embedding in result]
+        if order is None:
+            return embeddings
+        reordered: list[list[float]] = [[] for _ in embeddings]
+        for position, index in enumerate(order):
+            reordered[index] = embeddings[position]
+        return reordered
+
+    def _embed_chunk(self, texts: list[str]) -> list[list[float]]:
         if not self._client:
             msg = (
                 "Ollama client is not initialized. "
                 "Please ensure Ollama is running and the model is loaded."
             )
             raise ValueError(msg)
-        return self._client.embed(
-            self.model, texts, options=self._default_params, keep_alive=self.keep_alive
-        )["embeddings"]
+        attempt = 0
+        while True:
+            try:
+                return self._client.embed(
+                    self.model,
+                    texts,
+                    options=self._default_params,
+                    keep_alive=self.keep_alive,
+                )["embeddings"]
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                log.debug("Retrying chunk of %d texts after error: %s", len(texts), e)
+                time.sleep(_RETRY_INITIAL_DELAY * 2**attempt)
+                attempt += 1
+
+    async def _aembed_chunk(self, texts: list[str]) -> list[list[float]]:
+        if not self._async_client:
+            msg = (
+                "Ollama client is not initialized. "
+                "Please ensure Ollama is running and the model is loaded."
+            )
+            raise ValueError(msg)
+        attempt = 0
+        while True:
+            try:
+                return (
+                    await self._async_client.embed(
+                        self.model,
+                        texts,
+                        options=self._default_params,
+                        keep_alive=self.keep_alive,
+                    )
+                )["embeddings"]
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                log.debug("Retrying chunk of %d texts after error: %s", len(texts), e)
+                await asyncio.sleep(_RETRY_INITIAL_DELAY * 2**attempt)
+                attempt += 1
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        """Embed search docs."""
+        chunks, order = self._chunks(texts)
+        if self.max_concurrency <= 1 or len(chunks) <= 1:
+            results = [self._embed_chunk(chunk) for chunk in chunks]
+        else:
+            with get_executor_for_config(
+                {"max_concurrency": min(self.max_concurrency, len(chunks))}
+            ) as executor:
+                results = list(executor.map(self._embed_chunk, chunks))
+        return self._reassemble(results, order)
 
     def embed_query(self, text: str) -> list[float]:
         """Embed query text."""
@@ -308,20 +439,12 @@ class OllamaEmbeddings(BaseModel, Embeddings):
 
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed search docs."""
-        if not self._async_client:
-            msg = (
-                "Ollama client is not initialized. "
-                "Please ensure Ollama is running and the model is loaded."
-            )
-            raise ValueError(msg)
-        return (
-            await self._async_client.embed(
-                self.model,
-                texts,
-                options=self._default_params,
-                keep_alive=self.keep_alive,
-            )
-        )["embeddings"]
+        chunks, order = self._chunks(texts)
+        results = await gather_with_concurrency(
+            self.max_concurrency,
+            *(self._aembed_chunk(chunk) for chunk in chunks),
+        )
+        return self._reassemble(results, order)
 
     async def aembed_query(self, text: str) -> list[float]:
         """Embed query text."""
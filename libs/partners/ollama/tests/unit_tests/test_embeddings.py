@@ -1,8 +1,21 @@
 """Test embedding model integration."""
 
+import json
+import socketserver
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
+import httpx
+import pytest
+from ollama import ResponseError
+from pydantic import ValidationError
+
 from langchain_ollama.embeddings import OllamaEmbeddings
 
 MODEL_NAME = "llama3.1"
@@ -50,3 +63,174 @@ def test_embed_documents_passes_options(mock_client_class: Any) -> None:
     options = call_args.kwargs["options"]
     assert options["num_gpu"] == 4
     assert options["temperature"] == 0.5
+
+
+class _EmbedServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Stand-in for the Ollama embed endpoint, served over a unix socket.
+
+    Embeds each text as `[len(text)]`, and fails the first request for each text
+    listed in `fail_once`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: str) -> None:
+        super().__init__(path, _EmbedHandler)
+        self.socket_path = path
+        self.lock = threading.Lock()
+        self.requests: list[list[str]] = []
+        self.fail_once: set[str] = set()
+        self.active = 0
+        self.peak = 0
+
+
+class _EmbedHandler(BaseHTTPRequestHandler):
+    server: _EmbedServer
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        texts = body["input"]
+        with self.server.lock:
+            self.server.requests.append(texts)
+            self.server.active += 1
+            self.server.peak = max(self.server.peak, self.server.active)
+            failed = self.server.fail_once.intersection(texts)
+            self.server.fail_once -= failed
+        time.sleep(0.02)
+        with self.server.lock:
+            self.server.active -= 1
+        if failed:
+            self._send(500, {"error": "overloaded"})
+        else:
+            self._send(200, {"embeddings": [[float(len(text))] for text in texts]})
+
+    def _send(self, status: int, payload: dict) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def embed_server() -> Iterator[_EmbedServer]:
+    with tempfile.TemporaryDirectory() as directory:
+        server = _EmbedServer(str(Path(directory) / "ollama.sock"))
+        thread = threading.Thread(
+            target=server.serve_forever, args=(0.01,), daemon=True
+        )
+        thread.start()
+        try:
+            yield server
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+def _server_embeddings(server: _EmbedServer, **kwargs: Any) -> OllamaEmbeddings:
+    path = server.socket_path
+    transport = kwargs.pop("transport", None) or httpx.HTTPTransport(uds=path)
+    return OllamaEmbeddings(
+        model=MODEL_NAME,
+        base_url="http://localhost:11434",
+        sync_client_kwargs={"transport": transport},
+        async_client_kwargs={"transport": httpx.AsyncHTTPTransport(uds=path)},
+        **kwargs,
+    )
+
+
+TEXTS = ["a" * n for n in (5, 1, 4, 2, 3, 7, 6)]
+
+
+def test_embed_documents_single_request_by_default(
+    embed_server: _EmbedServer,
+) -> None:
+    embeddings = _server_embeddings(embed_server)
+
+    assert embeddings.embed_documents(TEXTS) == [[float(len(t))] for t in TEXTS]
+    assert embed_server.requests == [TEXTS]
+
+
+def test_embed_documents_chunked(embed_server: _EmbedServer) -> None:
+    embeddings = _server_embeddings(
+        embed_server, chunk_size=2, max_concurrency=3, max_retries=1
+    )
+    embed_server.fail_once = {TEXTS[2]}
+
+    assert embeddings.embed_documents(TEXTS) == [[float(len(t))] for t in TEXTS]
+    # The failed chunk is retried alone
+    assert sorted(map(tuple, embed_server.requests)) == sorted(
+        [tuple(TEXTS[i : i + 2]) for i in range(0, len(TEXTS), 2)] + [tuple(TEXTS[2:4])]
+    )
+    assert 1 < embed_server.peak <= 3
+
+
+async def test_aembed_documents_chunked_sorted_by_length(
+    embed_server: _EmbedServer,
+) -> None:
+    embeddings = _server_embeddings(
+        embed_server, chunk_size=3, max_concurrency=2, sort_by_length=True
+    )
+
+    result = await embeddings.aembed_documents(TEXTS)
+
+    assert result == [[float(len(t))] for t in TEXTS]
+    assert sorted(embed_server.requests) == [
+        ["a", "aa", "aaa"],
+        ["aaaa", "aaaaa", "aaaaaa"],
+        ["aaaaaaa"],
+    ]
+    assert embed_server.peak == 2
+
+
+def test_embed_documents_raises_after_retries(embed_server: _EmbedServer) -> None:
+    embeddings = _server_embeddings(embed_server, chunk_size=2)
+    embed_server.fail_once = {TEXTS[0]}
+
+    with pytest.raises(ResponseError, match="overloaded"):
+        embeddings.embed_documents(TEXTS)
+
+
+class _RefuseFirstConnection(httpx.HTTPTransport):
+    """Transport whose first connection attempt is refused."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.refused = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.refused:
+            self.refused = True
+            msg = "[Errno 111] Connection refused"
+            raise httpx.ConnectError(msg, request=request)
+        return super().handle_request(request)
+
+
+def test_embed_documents_retries_connection_errors(
+    embed_server: _EmbedServer,
+) -> None:
+    transport = _RefuseFirstConnection(uds=embed_server.socket_path)
+    embeddings = _server_embeddings(embed_server, transport=transport, max_retries=1)
+
+    assert embeddings.embed_documents(TEXTS) == [[float(len(t))] for t in TEXTS]
+    assert transport.refused
+    assert embed_server.requests == [TEXTS]
+
+    # Without retries, the error `ollama` raises for the refused connection surfaces
+    embeddings = _server_embeddings(
+        embed_server, transport=_RefuseFirstConnection(uds=embed_server.socket_path)
+    )
+    with pytest.raises(ConnectionError):
+        embeddings.embed_documents(TEXTS)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"chunk_size": 0}, {"max_concurrency": 0}, {"max_retries": -1}]
+)
+def test_invalid_chunking_params(kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValidationError):
+        OllamaEmbeddings(model=MODEL_NAME, **kwargs)
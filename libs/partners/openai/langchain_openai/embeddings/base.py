@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import warnings
 from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
@@ -10,7 +11,8 @@ from typing import Any, Literal, cast
 import openai
 import tiktoken
 from langchain_core.embeddings import Embeddings
-from langchain_core.runnables.config import run_in_executor
+from langchain_core.runnables.config import get_executor_for_config, run_in_executor
+from langchain_core.runnables.utils import gather_with_concurrency
 from langchain_core.utils import from_env, get_pydantic_field_names, secret_from_env
 from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
 from typing_extensions import Self
@@ -22,6 +24,58 @@ logger = logging.getLogger(__name__)
 MAX_TOKENS_PER_REQUEST = 300000
 """API limit per request for embedding tokens."""
 
+_TOKENIZER_THREADS = 8
+
+
+@functools.lru_cache(maxsize=8)
+def _get_hf_tokenizer(model_name: str) -> Any:
+    """Load a HuggingFace tokenizer, once per model."""
+    try:
+        from transformers import AutoTokenizer
+    except ImportError:
+        msg = (
+            "Could not import transformers python package. "
+            "This is needed for OpenAIEmbeddings to work without "
+            "`tiktoken`. Please install it with `pip install transformers`. "
+        )
+        raise ValueError(msg)
+
+    return AutoTokenizer.from_pretrained(pretrained_model_name_or_path=model_name)
+
+
+def _batch_ranges(
+    token_counts: list[int], chunk_size: int, max_tokens: int = MAX_TOKENS_PER_REQUEST
+) -> list[tuple[int, int]]:
+    """Group consecutive inputs into batches.
+
+    Each batch has at most `chunk_size` inputs and, unless a single input exceeds
+    it, at most `max_tokens` tokens.
+
+    Returns:
+        The start and end index of each batch.
+    """
+    ranges = []
+    i = 0
+    while i < len(token_counts):
+        # Determine how many chunks we can include in this batch
+        batch_token_count = 0
+        batch_end = i
+
+        for j in range(i, min(i + chunk_size, len(token_counts))):
+            chunk_tokens = token_counts[j]
+            # Check if adding this chunk would exceed the limit
+            if batch_token_count + chunk_tokens > max_tokens:
+                if batch_end == i:
+                    # Single chunk exceeds limit - handle it anyway
+                    batch_end = j + 1
+                break
+            batch_token_count += chunk_tokens
+            batch_end = j + 1
+
+        ranges.append((i, batch_end))
+        i = batch_end
+    return ranges
+
 
 def _process_batched_chunked_embeddings(
     num_texts: int,
@@ -226,6 +280,12 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
     chunk_size: int = 1000
     """Maximum number of texts to embed in each batch"""
 
+    max_concurrency: int = 1
+    """Maximum number of batches to embed concurrently.
+
+    Batches are sent from a thread pool for sync calls, and as concurrent requests
+    for async calls. Embeddings are returned in the order of the texts."""
+
     max_retries: int = 2
     """Maximum number of retries to make when generating."""
 
@@ -454,34 +514,25 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
 
         # If tiktoken flag set to False
         if not self.tiktoken_enabled:
-            try:
-                from transformers import AutoTokenizer
-            except ImportError:
-                msg = (
-                    "Could not import transformers python package. "
-                    "This is needed for OpenAIEmbeddings to work without "
-                    "`tiktoken`. Please install it with `pip install transformers`. "
-                )
-                raise ValueError(msg)
-
-            tokenizer = AutoTokenizer.from_pretrained(
-                pretrained_model_name_or_path=model_name
+            tokenizer = _get_hf_tokenizer(model_name)
+            # Tokenize the texts using HuggingFace transformers, in parallel for
+            # fast tokenizers
+            tokenized_texts: list[list[int]] = (
+                tokenizer(texts, add_special_tokens=False)["input_ids"] if texts else []
             )
-            for i, text in enumerate(texts):
-                # Tokenize the text using HuggingFace transformers
-                tokenized: list[int] = tokenizer.encode(text, add_special_tokens=False)
-
+            token_chunks: list[list[int]] = []
+            for i, tokenized in enumerate(tokenized_texts):
                 # Split tokens into chunks respecting the embedding_ctx_length
                 for j in range(0, len(tokenized), self.embedding_ctx_length):
                     token_chunk: list[int] = tokenized[
                         j : j + self.embedding_ctx_length
                     ]
-
-                    # Convert token IDs back to a string
-                    chunk_text: str = tokenizer.decode(token_chunk)
-                    tokens.append(chunk_text)
+                    token_chunks.append(token_chunk)
                     indices.append(i)
                     token_counts.append(len(token_chunk))
+
+            # Convert token IDs back to strings
+            tokens.extend(tokenizer.batch_decode(token_chunks))
         else:
             try:
                 encoding = tiktoken.encoding_for_model(model_name)
@@ -495,18 +546,22 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
                 }.items()
                 if v is not None
             }
-            for i, text in enumerate(texts):
-                if self.model.endswith("001"):
-                    # See: https://github.com/openai/openai-python/
-                    #      issues/418#issuecomment-1525939500
-                    # replace newlines, which can negatively affect performance.
-                    text = text.replace("\n", " ")
-
-                if encoder_kwargs:
-                    token = encoding.encode(text, **encoder_kwargs)
-                else:
-                    token = encoding.encode_ordinary(text)
+            if self.model.endswith("001"):
+                # See: https://github.com/openai/openai-python/
+                #      issues/418#issuecomment-1525939500
+                # replace newlines, which can negatively affect performance.
+                texts = [text.replace("\n", " ") for text in texts]
+
+            if encoder_kwargs:
+                encoded = encoding.encode_batch(
+                    texts, num_threads=_TOKENIZER_THREADS, **encoder_kwargs
+                )
+            else:
+                encoded = encoding.encode_ordinary_batch(
+                    texts, num_threads=_TOKENIZER_THREADS
+                )
 
+            for i, token in enumerate(encoded):
                 # Split tokens into chunks respecting the embedding_ctx_length
                 for j in range(0, len(token), self.embedding_ctx_length):
                     tokens.append(token[j : j + self.embedding_ctx_length])
@@ -524,6 +579,49 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
             _iter = range(0, len(tokens), chunk_size)
         return _iter, tokens, indices, token_counts
 
+    def _embed_batch(
+        self, batch: Sequence[list[int] | str], client_kwargs: dict[str, Any]
+    ) -> list[list[float]]:
+        response = self.client.create(input=batch, **client_kwargs)
+        if not isinstance(response, dict):
+            response = response.model_dump()
+        return [r["embedding"] for r in response["data"]]
+
+    def _embed_batches(
+        self, batches: list[Sequence[list[int] | str]], client_kwargs: dict[str, Any]
+    ) -> list[list[float]]:
+        """Embed batches, up to `max_concurrency` at a time, in order."""
+        if self.max_concurrency <= 1 or len(batches) <= 1:
+            results = [self._embed_batch(batch, client_kwargs) for batch in batches]
+        else:
+            with get_executor_for_config(
+                {"max_concurrency": min(self.max_concurrency, len(batches))}
+            ) as executor:
+                results = list(
+                    executor.map(
+                        self._embed_batch, batches, [client_kwargs] * len(batches)
+                    )
+                )
+        return [embedding for result in results for embedding in result]
+
+    async def _aembed_batch(
+        self, batch: Sequence[list[int] | str], client_kwargs: dict[str, Any]
+    ) -> list[list[float]]:
+        response = await self.async_client.create(input=batch, **client_kwargs)
+        if not isinstance(response, dict):
+            response = response.model_dump()
+        return [r["embedding"] for r in response["data"]]
+
+    async def _aembed_batches(
+        self, batches: list[Sequence[list[int] | str]], client_kwargs: dict[str, Any]
+    ) -> list[list[float]]:
+        """Embed batches, up to `max_concurrency` at a time, in order."""
+        results = await gather_with_concurrency(
+            max(self.max_concurrency, 1),
+            *(self._aembed_batch(batch, client_kwargs) for batch in batches),
+        )
+        return [embedding for result in results for embedding in result]
+
     # please refer to
     # https://github.com/openai/openai-cookbook/blob/main/examples/Embedding_long_inputs.ipynb
     def _get_len_safe_embeddings(
@@ -551,34 +649,12 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         _chunk_size = chunk_size or self.chunk_size
         client_kwargs = {**self._invocation_params, **kwargs}
         _iter, tokens, indices, token_counts = self._tokenize(texts, _chunk_size)
-        batched_embeddings: list[list[float]] = []
 
         # Process in batches respecting the token limit
-        i = 0
-        while i < len(tokens):
-            # Determine how many chunks we can include in this batch
-            batch_token_count = 0
-            batch_end = i
-
-            for j in range(i, min(i + _chunk_size, len(tokens))):
-                chunk_tokens = token_counts[j]
-                # Check if adding this chunk would exceed the limit
-                if batch_token_count + chunk_tokens > MAX_TOKENS_PER_REQUEST:
-                    if batch_end == i:
-                        # Single chunk exceeds limit - handle it anyway
-                        batch_end = j + 1
-                    break
-                batch_token_count += chunk_tokens
-                batch_end = j + 1
-
-            # Make API call with this batch
-            batch_tokens = tokens[i:batch_end]
-            response = self.client.create(input=batch_tokens, **client_kwargs)
-            if not isinstance(response, dict):
-                response = response.model_dump()
-            batched_embeddings.extend(r["embedding"] for r in response["data"])
-
-            i = batch_end
+        batched_embeddings = self._embed_batches(
+            [tokens[i:j] for i, j in _batch_ranges(token_counts, _chunk_size)],
+            client_kwargs,
+        )
 
         embeddings = _process_batched_chunked_embeddings(
             len(texts), tokens, batched_embeddings, indices, self.skip_empty
@@ -625,36 +701,12 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         _iter, tokens, indices, token_counts = await run_in_executor(
             None, self._tokenize, texts, _chunk_size
         )
-        batched_embeddings: list[list[float]] = []
 
         # Process in batches respecting the token limit
-        i = 0
-        while i < len(tokens):
-            # Determine how many chunks we can include in this batch
-            batch_token_count = 0
-            batch_end = i
-
-            for j in range(i, min(i + _chunk_size, len(tokens))):
-                chunk_tokens = token_counts[j]
-                # Check if adding this chunk would exceed the limit
-                if batch_token_count + chunk_tokens > MAX_TOKENS_PER_REQUEST:
-                    if batch_end == i:
-                        # Single chunk exceeds limit - handle it anyway
-                        batch_end = j + 1
-                    break
-                batch_token_count += chunk_tokens
-                batch_end = j + 1
-
-            # Make API call with this batch
-            batch_tokens = tokens[i:batch_end]
-            response = await self.async_client.create(
-                input=batch_tokens, **client_kwargs
-            )
-            if not isinstance(response, dict):
-                response = response.model_dump()
-            batched_embeddings.extend(r["embedding"] for r in response["data"])
-
-            i = batch_end
+        batched_embeddings = await self._aembed_batches(
+            [tokens[i:j] for i, j in _batch_ranges(token_counts, _chunk_size)],
+            client_kwargs,
+        )
 
         embeddings = _process_batched_chunked_embeddings(
             len(texts), tokens, batched_embeddings, indices, self.skip_empty
@@ -693,15 +745,10 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         chunk_size_ = chunk_size or self.chunk_size
         client_kwargs = {**self._invocation_params, **kwargs}
         if not self.check_embedding_ctx_length:
-            embeddings: list[list[float]] = []
-            for i in range(0, len(texts), chunk_size_):
-                response = self.client.create(
-                    input=texts[i : i + chunk_size_], **client_kwargs
-                )
-                if not isinstance(response, dict):
-                    response = response.model_dump()
-                embeddings.extend(r["embedding"] for r in response["data"])
-            return embeddings
+            return self._embed_batches(
+                [texts[i : i + chunk_size_] for i in range(0, len(texts), chunk_size_)],
+                client_kwargs,
+            )
 
         # Unconditionally call _get_len_safe_embeddings to handle length safety.
         # This could be optimized to avoid double work when all texts are short enough.
@@ -728,15 +775,10 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         chunk_size_ = chunk_size or self.chunk_size
         client_kwargs = {**self._invocation_params, **kwargs}
         if not self.check_embedding_ctx_length:
-            embeddings: list[list[float]] = []
-            for i in range(0, len(texts), chunk_size_):
-                response = await self.async_client.create(
-                    input=texts[i : i + chunk_size_], **client_kwargs
-                )
-                if not isinstance(response, dict):
-                    response = response.model_dump()
-                embeddings.extend(r["embedding"] for r in response["data"])
-            return embeddings
+            return await self._aembed_batches(
+                [texts[i : i + chunk_size_] for i in range(0, len(texts), chunk_size_)],
+                client_kwargs,
+            )
 
         # Unconditionally call _get_len_safe_embeddings to handle length safety.
         # This could be optimized to avoid double work when all texts are short enough.
@@ -1,4 +1,7 @@
+import asyncio
 import os
+import threading
+import time
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -148,3 +151,73 @@ def test_embeddings_respects_token_limit() -> None:
     # Verify each call respected the limit
     for count in call_counts:
         assert count <= 300000, f"Batch exceeded limit: {count}"
+
+
+def _slow_create(active: list[int], peak: list[int]) -> Any:
+    lock = threading.Lock()
+
+    def create(input: list[str], **kwargs: Any) -> dict:  # noqa: A002
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        # Finish later batches first, to check that the order is kept
+        time.sleep(0.01 * (10 - int(input[0][4:])))
+        with lock:
+            active[0] -= 1
+        return {"data": [{"embedding": [float(text[4:])]} for text in input]}
+
+    return create
+
+
+def test_embed_documents_concurrent_batches() -> None:
+    embeddings = OpenAIEmbeddings(
+        chunk_size=1, check_embedding_ctx_length=False, max_concurrency=3
+    )
+    texts = [f"text{i}" for i in range(8)]
+    active, peak = [0], [0]
+
+    with patch.object(embeddings.client, "create", _slow_create(active, peak)):
+        result = embeddings.embed_documents(texts)
+
+    assert result == [[float(i)] for i in range(8)]
+    assert 1 < peak[0] <= 3
+
+
+async def test_aembed_documents_concurrent_batches() -> None:
+    embeddings = OpenAIEmbeddings(
+        chunk_size=1, check_embedding_ctx_length=False, max_concurrency=3
+    )
+    texts = [f"text{i}" for i in range(8)]
+    active, peak = [0], [0]
+    create = _slow_create(active, peak)
+
+    async def acreate(input: list[str], **kwargs: Any) -> dict:  # noqa: A002
+        return await asyncio.to_thread(create, input, **kwargs)
+
+    with patch.object(embeddings.async_client, "create", acreate):
+        result = await embeddings.aembed_documents(texts)
+
+    assert result == [[float(i)] for i in range(8)]
+    assert 1 < peak[0] <= 3
+
+
+def test_hf_tokenizer_is_loaded_once() -> None:
+    embeddings = OpenAIEmbeddings(
+        model="test-tokenizer-is-loaded-once",
+        tiktoken_enabled=False,
+        embedding_ctx_length=2,
+    )
+    tokenizer = Mock()
+    tokenizer.return_value = {"input_ids": [[1, 2, 3], [4]]}
+    tokenizer.batch_decode.side_effect = lambda chunks: [str(c) for c in chunks]
+
+    with patch(
+        "transformers.AutoTokenizer.from_pretrained", return_value=tokenizer
+    ) as mock_from_pretrained:
+        _, tokens, indices, token_counts = embeddings._tokenize(["abc", "d"], 10)
+        embeddings._tokenize(["abc", "d"], 10)
+
+    mock_from_pretrained.assert_called_once()
+    assert tokens == ["[1, 2]", "[3]", "[4]"]
+    assert indices == [0, 0, 1]
+    assert token_counts == [2, 1, 1]
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import copy
+import itertools
 import logging
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
@@ -108,13 +111,36 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                 documents.append(new_doc)
         return documents
 
-    def split_documents(self, documents: Iterable[Document]) -> list[Document]:
-        """Split documents."""
+    def split_documents(
+        self, documents: Iterable[Document], *, max_workers: int | None = None
+    ) -> list[Document]:
+        """Split documents.
+
+        Args:
+            documents: The documents to split.
+            max_workers: If set, split the documents in a pool of this many
+                processes. Worth it for large corpora only; the splitter,
+                including its length function, must be picklable.
+
+        Returns:
+            The chunks of all documents, in order.
+        """
         texts, metadatas = [], []
         for doc in documents:
             texts.append(doc.page_content)
             metadatas.append(doc.metadata)
-        return self.create_documents(texts, metadatas=metadatas)
+        if max_workers is None or len(texts) < 2:  # noqa: PLR2004
+            return self.create_documents(texts, metadatas=metadatas)
+        # Send documents to the workers in a few large tasks to amortize pickling.
+        chunksize = max(1, len(texts) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                self.create_documents,
+                [[text] for text in texts],
+                [[metadata] for metadata in metadatas],
+                chunksize=chunksize,
+            )
+            return list(itertools.chain.from_iterable(results))
 
     def _join_docs(self, docs: list[str], separator: str) -> str | None:
         text = separator.join(docs)
@@ -122,16 +148,37 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             text = text.strip()
         return text or None
 
-    def _merge_splits(self, splits: Iterable[str], separator: str) -> list[str]:
+    def _merge_splits(
+        self,
+        splits: Iterable[str],
+        separator: str,
+        lengths: Iterable[int] | None = None,
+    ) -> list[str]:
+        """Merge splits into chunks of at most `chunk_size`.
+
+        Args:
+            splits: The pieces to merge.
+            separator: The separator to join pieces with.
+            lengths: The lengths of `splits`, if already measured. Each piece is
+                measured at most once either way.
+
+        Returns:
+            The merged chunks.
+        """
         # We now want to combine these smaller pieces into medium size
         # chunks to send to the LLM.
         separator_len = self._length_function(separator)
+        if lengths is None:
+            splits = list(splits)
+            lengths = map(self._length_function, splits)
 
         docs = []
-        current_doc: list[str] = []
+        # Pieces of the current chunk and their lengths, with `total` the running
+        # length of the chunk including separators.
+        current_doc: deque[str] = deque()
+        current_lengths: deque[int] = deque()
         total = 0
-        for d in splits:
-            len_ = self._length_function(d)
+        for d, len_ in zip(splits, lengths, strict=False):
             if (
                 total + len_ + (separator_len if len(current_doc) > 0 else 0)
                 > self._chunk_size
@@ -144,7 +191,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         self._chunk_size,
                     )
                 if len(current_doc) > 0:
-                    doc = self._join_docs(current_doc, separator)
+                    doc = self._join_docs(list(current_doc), separator)
                     if doc is not None:
                         docs.append(doc)
                     # Keep on popping if:
@@ -155,13 +202,14 @@ class TextSplitter(BaseDocumentTransformer, ABC):
                         > self._chunk_size
                         and total > 0
                     ):
-                        total -= self._length_function(current_doc[0]) + (
-                            separator_len if len(current_doc) > 1 else 0
+                        current_doc.popleft()
+                        total -= current_lengths.popleft() + (
+                            separator_len if len(current_doc) > 0 else 0
                         )
-                        current_doc = current_doc[1:]
             current_doc.append(d)
+            current_lengths.append(len_)
             total += len_ + (separator_len if len(current_doc) > 1 else 0)
-        doc = self._join_docs(current_doc, separator)
+        doc = self._join_docs(list(current_doc), separator)
         if doc is not None:
             docs.append(doc)
         return docs
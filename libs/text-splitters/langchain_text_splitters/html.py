@@ -5,6 +5,8 @@ from __future__ import annotations
 import copy
 import pathlib
 import re
+from collections import deque
+from html.parser import HTMLParser
 from io import StringIO
 from typing import (
     IO,
@@ -80,6 +82,161 @@ def _find_all_tags(
     return tag.find_all(name, recursive=recursive)
 
 
+# Tags whose content is part of the surrounding text.
+_INLINE_TAGS = frozenset(
+    {
+        "a", "abbr", "b", "bdi", "bdo", "cite", "code", "data", "del", "dfn", "em",
+        "font", "i", "ins", "kbd", "mark", "q", "s", "samp", "small", "span",
+        "strong", "sub", "sup", "time", "u", "var",
+    }
+)  # fmt: skip
+# Tags that never have content or an end tag.
+_VOID_TAGS = frozenset(
+    {
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta",
+        "param", "source", "track", "wbr",
+    }
+)  # fmt: skip
+# Tags whose content is not text of the page.
+_SKIPPED_TAGS = frozenset({"head", "noscript", "script", "style", "template"})
+# Tags allowed in `head`; any other tag starts the body when `</head>` is omitted.
+_HEAD_TAGS = frozenset(
+    {"base", "link", "meta", "noscript", "script", "style", "template", "title"}
+)
+
+
+class _HTMLHeaderStreamParser(HTMLParser):
+    """Incremental parser behind `HTMLHeaderTextSplitter.lazy_split_text_from_file`.
+
+    Tracks the open elements and the active headers while HTML is fed to it, and
+    queues `Document` objects in `documents` as soon as they are complete.
+    """
+
+    def __init__(self, splitter: HTMLHeaderTextSplitter) -> None:
+        super().__init__(convert_charrefs=True)
+        self.splitter = splitter
+        self.documents: deque[Document] = deque()
+        # Open block elements, innermost last.
+        self.stack: list[str] = []
+        # Number of open elements whose content is skipped.
+        self.skipping = 0
+        # Whether `head` is open, which also counts in `skipping`.
+        self.in_head = False
+        # Text of the innermost block element seen since the last flush.
+        self.text: list[str] = []
+        # Tag and depth of the header being read, if any.
+        self.header: tuple[str, int] | None = None
+        # Header name -> (header text, level, depth).
+        self.active_headers: dict[str, tuple[str, int, int]] = {}
+        self.current_chunk: list[str] = []
+
+    def _metadata(self) -> dict[str, str]:
+        return {k: v[0] for k, v in self.active_headers.items()}
+
+    def _finalize_chunk(self) -> None:
+        final_text = "  \n".join(self.current_chunk)
+        self.current_chunk.clear()
+        if final_text:
+            self.documents.append(
+                Document(page_content=final_text, metadata=self._metadata())
+            )
+
+    def _take_text(self) -> str:
+        text = " ".join("".join(self.text).split())
+        self.text.clear()
+        return text
+
+    def _flush(self) -> None:
+        """Emit the text collected for the innermost block element."""
+        if self.header is not None or not (text := self._take_text()):
+            return
+        depth = len(self.stack)
+        for key in [k for k, (_, _, d) in self.active_headers.items() if depth < d]:
+            del self.active_headers[key]
+        if self.splitter.return_each_element:
+            self.documents.append(
+                Document(page_content=text, metadata=self._metadata())
+            )
+        else:
+            self.current_chunk.append(text)
+
+    def _end_header(self) -> None:
+        tag, depth = cast("tuple[str, int]", self.header)
+        self.header = None
+        if not (text := self._take_text()):
+            return
+        if not self.splitter.return_each_element:
+            self._finalize_chunk()
+        try:
+            level = int(tag[1:])
+        except ValueError:
+            level = 9999
+        for key in [
+            k for k, (_, lvl, _) in self.active_headers.items() if lvl >= level
+        ]:
+            del self.active_headers[key]
+        self.active_headers[self.splitter.header_mapping[tag]] = (text, level, depth)
+        self.documents.append(Document(page_content=text, metadata=self._metadata()))
+
+    def _end_head(self) -> None:
+        # Everything skipped so far is inside `head`.
+        self.in_head = False
+        self.skipping = 0
+
+    @override
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.in_head and self.skipping == 1 and tag not in _HEAD_TAGS:
+            # `</head>` was omitted: body content implicitly closes the head.
+            self._end_head()
+        if tag in _VOID_TAGS:
+            if tag == "br":
+                self.handle_data(" ")
+            return
+        if self.skipping or tag in _SKIPPED_TAGS:
+            self.in_head |= tag == "head" and not self.skipping
+            self.skipping += tag in _SKIPPED_TAGS
+            return
+        if tag in _INLINE_TAGS:
+            return
+        if self.header is None:
+            self._flush()
+        self.stack.append(tag)
+        if self.header is None and tag in self.splitter.header_mapping:
+            self.header = (tag, len(self.stack))
+
+    @override
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head" and self.in_head:
+            self._end_head()
+            return
+        if tag in _SKIPPED_TAGS and self.skipping:
+            self.skipping -= 1
+            return
+        if self.skipping or tag in _INLINE_TAGS or tag not in self.stack:
+            return
+        # Close `tag` and any elements left open inside it.
+        position = len(self.stack) - 1 - self.stack[::-1].index(tag)
+        if self.header is not None and position < self.header[1]:
+            self._end_header()
+        else:
+            self._flush()
+        del self.stack[position:]
+
+    @override
+    def handle_data(self, data: str) -> None:
+        if not self.skipping:
+            self.text.append(data)
+
+    @override
+    def close(self) -> None:
+        super().close()
+        if self.header is not None:
+            self._end_header()
+        self._flush()
+        if not self.splitter.return_each_element:
+            self._finalize_chunk()
+
+
 class HTMLHeaderTextSplitter:
     """Split HTML content into structured Documents based on specified headers.
 
@@ -220,6 +377,47 @@ class HTMLHeaderTextSplitter:
             html_content = file.read()
         return list(self._generate_documents(html_content))
 
+    def lazy_split_text_from_file(
+        self, file: str | IO[str], *, buffer_size: int = 65536
+    ) -> Iterator[Document]:
+        """Lazily split HTML content from a file, in a single streaming pass.
+
+        The HTML is read `buffer_size` characters at a time and tokenized
+        incrementally, and each `Document` is yielded as soon as it is complete,
+        so large pages split in linear time and without building a DOM. Memory
+        use is bounded by the largest section (or element, with
+        `return_each_element`) rather than by the page.
+
+        Compared to `split_text_from_file`, text is emitted in document order,
+        the text of inline elements (`b`, `a`, `span`, ...) stays part of the
+        surrounding text, whitespace is collapsed, and the content of `head`,
+        `script` and `style` elements is skipped.
+
+        Args:
+            file: A file path or a file-like object containing HTML content.
+            buffer_size: Number of characters to read at a time.
+
+        Yields:
+            Document objects as they are created.
+        """
+        parser = _HTMLHeaderStreamParser(self)
+        if isinstance(file, str):
+            with pathlib.Path(file).open(encoding="utf-8") as f:
+                yield from self._stream_documents(parser, f, buffer_size)
+        else:
+            yield from self._stream_documents(parser, file, buffer_size)
+
+    @staticmethod
+    def _stream_documents(
+        parser: _HTMLHeaderStreamParser, file: IO[str], buffer_size: int
+    ) -> Iterator[Document]:
+        while block := file.read(buffer_size):
+            parser.feed(block)
+            while parser.documents:
+                yield parser.documents.popleft()
+        parser.close()
+        yield from parser.documents
+
     def _generate_documents(self, html_content: str) -> Iterator[Document]:
         """Private method that performs a DFS traversal over the DOM and yields.
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any
+import functools
+import re
+from typing import Any, Literal
 
 from langchain_text_splitters.base import TextSplitter
 
@@ -14,29 +16,95 @@ except ImportError:
     _HAS_KONLPY = False
 
 
+# A sentence ends with terminal punctuation (optionally followed by closing quotes
+# or brackets), or with a common sentence-final ending (다, 요, 까, ...) at the end
+# of a line, and is followed by whitespace. Within a line, these endings are not
+# boundaries, since they also end words in the middle of sentences (e.g. quoted
+# speech such as "간다 간다 하면서").
+_SENTENCE_BOUNDARY = re.compile(
+    r"""(?:[.!?…]+[\"'\u201d\u2019」』)\]]*|(?<=[다요까죠네라자오])(?=[ \t]*\n))\s+"""
+)
+
+
+def _split_sentences_by_rule(text: str) -> list[str]:
+    """Split Korean text into sentences using punctuation and sentence endings."""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_BOUNDARY.finditer(text):
+        sentence = text[start : match.start()] + match.group().rstrip()
+        if sentence.strip():
+            sentences.append(sentence.strip())
+        start = match.end()
+    if text[start:].strip():
+        sentences.append(text[start:].strip())
+    return sentences
+
+
+@functools.lru_cache(maxsize=1)
+def _get_kkma() -> konlpy.tag.Kkma:
+    # Kkma boots a JVM and loads its dictionaries, so all splitters share one.
+    return konlpy.tag.Kkma()
+
+
 class KonlpyTextSplitter(TextSplitter):
     """Splitting text using Konlpy package.
 
     It is good for splitting Korean text.
+
+    Sentences can be found by Kkma (the default), by fast rules based on
+    punctuation and sentence-final endings (`'rule'`), or by the rules first and
+    Kkma only for segments the rules leave longer than `chunk_size`
+    (`'hybrid'`). The `'rule'` mode does not need Konlpy or a JVM, and its
+    splitters can be used with `split_documents(..., max_workers=...)`.
+
+    The rules treat a sentence-final ending without punctuation as a boundary only
+    at the end of a line, so sentences without punctuation within a line are not
+    split by `'rule'`. Use `'hybrid'` to split them with Kkma when they are longer
+    than `chunk_size`.
     """
 
     def __init__(
         self,
         separator: str = "\n\n",
+        *,
+        sentence_splitter: Literal["kkma", "rule", "hybrid"] = "kkma",
         **kwargs: Any,
     ) -> None:
-        """Initialize the Konlpy text splitter."""
+        """Initialize the Konlpy text splitter.
+
+        Args:
+            separator: Separator to join sentences with.
+            sentence_splitter: How to find sentence boundaries.
+            **kwargs: Additional keyword arguments to customize the splitter.
+        """
         super().__init__(**kwargs)
         self._separator = separator
+        self._sentence_splitter = sentence_splitter
+        self.kkma: Any = None
+        if sentence_splitter == "rule":
+            return
         if not _HAS_KONLPY:
             msg = """
                 Konlpy is not installed, please install it with
                 `pip install konlpy`
                 """
             raise ImportError(msg)
-        self.kkma = konlpy.tag.Kkma()
+        self.kkma = _get_kkma()
+
+    def _split_sentences(self, text: str) -> list[str]:
+        if self.kkma is None:
+            return _split_sentences_by_rule(text)
+        if self._sentence_splitter == "kkma":
+            return list(self.kkma.sentences(text))
+        sentences = []
+        for sentence in _split_sentences_by_rule(text):
+            if self._length_function(sentence) > self._chunk_size:
+                sentences.extend(self.kkma.sentences(sentence))
+            else:
+                sentences.append(sentence)
+        return sentences
 
     def split_text(self, text: str) -> list[str]:
         """Split incoming text and return chunks."""
-        splits = self.kkma.sentences(text)
+        splits = self._split_sentences(text)
         return self._merge_splits(splits, self._separator)
@@ -0,0 +1,96 @@
+"""Test and benchmark Korean sentence splitting with Konlpy."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+from langchain_core.documents import Document
+
+from langchain_text_splitters.konlpy import KonlpyTextSplitter
+
+KOREAN_TEXT = (
+    "대한민국은 동아시아의 한반도 남부에 위치한 국가이다. "
+    "수도는 서울특별시이며, 인구는 약 오천만 명이에요! "
+    "한국어를 공용어로 사용하나요? 그렇습니다.\n"
+    "경제는 수출 중심으로 성장했다\n"
+    "주요 산업에는 반도체, 자동차, 조선 등이 있다. "
+)
+
+KOREAN_SENTENCES = [
+    "대한민국은 동아시아의 한반도 남부에 위치한 국가이다.",
+    "수도는 서울특별시이며, 인구는 약 오천만 명이에요!",
+    "한국어를 공용어로 사용하나요?",
+    "그렇습니다.",
+    "경제는 수출 중심으로 성장했다",
+    "주요 산업에는 반도체, 자동차, 조선 등이 있다.",
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def konlpy() -> None:
+    pytest.importorskip("konlpy")
+
+
+def test_konlpy_splitters_share_kkma() -> None:
+    first = KonlpyTextSplitter()
+    second = KonlpyTextSplitter(sentence_splitter="hybrid")
+    assert first.kkma is second.kkma
+
+
+def test_konlpy_hybrid_sentence_splitter() -> None:
+    splitter = KonlpyTextSplitter(
+        separator=" ", sentence_splitter="hybrid", chunk_size=60, chunk_overlap=0
+    )
+    chunks = splitter.split_text(KOREAN_TEXT)
+    assert chunks
+    assert all(len(chunk) <= 60 for chunk in chunks)
+
+
+@pytest.mark.parametrize("sentence_splitter", ["kkma", "hybrid", "rule"])
+def test_konlpy_sentence_splitters(sentence_splitter: str) -> None:
+    """Test that each sentence splitter keeps the text and respects `chunk_size`."""
+    splitter = KonlpyTextSplitter(
+        separator=" ",
+        sentence_splitter=sentence_splitter,  # type: ignore[arg-type]
+        chunk_size=100,
+        chunk_overlap=0,
+    )
+    text = KOREAN_TEXT * 5
+    chunks = splitter.split_text(text)
+    assert chunks
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "".join("".join(chunks).split()) == "".join(text.split())
+
+
+def test_konlpy_hybrid_sentence_splitter_uses_rules_for_short_sentences() -> None:
+    """Test that the hybrid splitter keeps the sentences found by the rules."""
+    splitter = KonlpyTextSplitter(
+        separator="|", sentence_splitter="hybrid", chunk_size=60, chunk_overlap=0
+    )
+    assert splitter._split_sentences(KOREAN_TEXT) == KOREAN_SENTENCES
+
+
+def test_konlpy_sentence_splitter_benchmark(
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Time the sentence splitters against Kkma on a Korean corpus.
+
+    The timings depend on the machine, so they are recorded as test properties,
+    e.g. for `--junitxml` reports, rather than asserted.
+    """
+    documents = [Document(page_content=KOREAN_TEXT * 20) for _ in range(20)]
+    runs: list[tuple[str, str, int | None]] = [
+        ("kkma", "kkma", None),
+        ("hybrid", "hybrid", None),
+        ("rule", "rule", None),
+        ("rule_2_workers", "rule", 2),
+    ]
+    for name, sentence_splitter, max_workers in runs:
+        splitter = KonlpyTextSplitter(
+            sentence_splitter=sentence_splitter,  # type: ignore[arg-type]
+            chunk_size=500,
+            chunk_overlap=0,
+        )
+        start = time.perf_counter()
+        splitter.split_documents(documents, max_workers=max_workers)
+        record_property(f"{name}_seconds", round(time.perf_counter() - start, 3))
@@ -5,7 +5,8 @@ from __future__ import annotations
 import random
 import re
 import string
-from typing import TYPE_CHECKING, Any
+from io import StringIO
+from typing import TYPE_CHECKING, Any, cast
 
 import pytest
 from langchain_core._api import suppress_langchain_beta_warning
@@ -26,6 +27,7 @@ from langchain_text_splitters.html import (
 )
 from langchain_text_splitters.json import RecursiveJsonSplitter
 from langchain_text_splitters.jsx import JSFrameworkTextSplitter
+from langchain_text_splitters.konlpy import KonlpyTextSplitter
 from langchain_text_splitters.markdown import (
     ExperimentalMarkdownSyntaxTextSplitter,
     MarkdownHeaderTextSplitter,
@@ -431,6 +433,96 @@ def test_split_documents() -> None:
     assert splitter.split_documents(docs) == expected_output
 
 
+def test_split_documents_in_process_pool() -> None:
+    """Test split_documents with a process pool keeps order and metadata."""
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=20, chunk_overlap=5, add_start_index=True
+    )
+    docs = [
+        Document(
+            page_content=" ".join(f"word{i}_{j}" for j in range(30)),
+            metadata={"source": str(i)},
+        )
+        for i in range(10)
+    ]
+    assert splitter.split_documents(docs, max_workers=2) == splitter.split_documents(
+        docs
+    )
+
+
+def test_recursive_splitter_measures_each_piece_once() -> None:
+    """Test that merging reuses lengths instead of re-measuring pieces."""
+    measured: list[str] = []
+
+    def length_function(text: str) -> int:
+        measured.append(text)
+        return len(text)
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=10, chunk_overlap=4, length_function=length_function
+    )
+    text = "aaa bbb ccc ddd eee fff ggg hhh iii jjj"
+    output = splitter.split_text(text)
+    assert output == [
+        "aaa bbb",
+        "bbb ccc",
+        "ccc ddd",
+        "ddd eee",
+        "eee fff",
+        "fff ggg",
+        "ggg hhh",
+        "hhh iii",
+        "iii jjj",
+    ]
+    pieces = [piece for piece in measured if piece not in {" ", ""}]
+    assert len(pieces) == len(set(pieces))
+
+
+def test_konlpy_rule_sentence_splitter() -> None:
+    """Test the rule-based Korean sentence splitter, which needs no Konlpy."""
+    splitter = KonlpyTextSplitter(
+        separator=" ", sentence_splitter="rule", chunk_size=20, chunk_overlap=0
+    )
+    text = (
+        "안녕하세요. 오늘 날씨가 좋네요! 밥 먹었어요?\n"
+        "그는 집에 갔다\n원주율은 3.14입니다."
+    )
+    assert splitter.split_text(text) == [
+        "안녕하세요. 오늘 날씨가 좋네요!",
+        "밥 먹었어요? 그는 집에 갔다",
+        "원주율은 3.14입니다.",
+    ]
+
+
+def test_konlpy_rule_sentence_endings_only_split_at_line_end() -> None:
+    """Test that sentence endings without punctuation split only at line ends."""
+    splitter = KonlpyTextSplitter(
+        separator="|", sentence_splitter="rule", chunk_size=1, chunk_overlap=0
+    )
+    assert splitter.split_text("그는 집에 갔다 그리고 잤다\n다음 날이다") == [
+        "그는 집에 갔다 그리고 잤다",
+        "다음 날이다",
+    ]
+    assert splitter.split_text("간다 간다 하면서 안 간다.  정말이요") == [
+        "간다 간다 하면서 안 간다.",
+        "정말이요",
+    ]
+
+
+def test_konlpy_rule_sentence_splitter_in_process_pool() -> None:
+    """Test that rule-based Korean splitters can split in a process pool."""
+    splitter = KonlpyTextSplitter(
+        sentence_splitter="rule", chunk_size=30, chunk_overlap=0
+    )
+    docs = [
+        Document(page_content=f"문서 {i}번입니다. 두 번째 문장이에요. 끝이다.")
+        for i in range(4)
+    ]
+    assert splitter.split_documents(docs, max_workers=2) == splitter.split_documents(
+        docs
+    )
+
+
 def test_python_text_splitter() -> None:
     splitter = PythonCodeTextSplitter(chunk_size=30, chunk_overlap=0)
     splits = splitter.split_text(FAKE_PYTHON_TEXT)
@@ -2800,6 +2892,114 @@ def test_additional_html_header_text_splitter(
         )
 
 
+@pytest.mark.parametrize("return_each_element", [False, True])
+@pytest.mark.parametrize("buffer_size", [1, 16, 65536])
+def test_html_header_text_splitter_lazy(
+    *, return_each_element: bool, buffer_size: int
+) -> None:
+    """Test splitting HTML in a single streaming pass."""
+    html_content = """
+    <html>
+        <head><title>Ignored</title><style>p { color: red; }</style></head>
+        <body>
+            <h1>Introduction</h1>
+            <p>Welcome to the <b>introduction</b> section.</p>
+            <h2>Background</h2>
+            <ul><li>First<li>Second</ul>
+            <div><h3>Details</h3><p>Nested &amp; scoped.</p></div>
+            <p>After the div.</p>
+            <h1>Conclusion</h1>
+            <p>Final thoughts.<br>Bye.</p>
+            <script>var ignored = 1;</script>
+        </body>
+    </html>
+    """
+    splitter = HTMLHeaderTextSplitter(
+        [("h1", "Header 1"), ("h2", "Header 2"), ("h3", "Header 3")],
+        return_each_element=return_each_element,
+    )
+    docs = list(
+        splitter.lazy_split_text_from_file(
+            StringIO(html_content), buffer_size=buffer_size
+        )
+    )
+    intro = {"Header 1": "Introduction"}
+    background = {**intro, "Header 2": "Background"}
+    details = {**background, "Header 3": "Details"}
+    conclusion = {"Header 1": "Conclusion"}
+    if return_each_element:
+        expected = [
+            Document(page_content="Introduction", metadata=intro),
+            Document(
+                page_content="Welcome to the introduction section.", metadata=intro
+            ),
+            Document(page_content="Background", metadata=background),
+            Document(page_content="First", metadata=background),
+            Document(page_content="Second", metadata=background),
+            Document(page_content="Details", metadata=details),
+            Document(page_content="Nested & scoped.", metadata=details),
+            Document(page_content="After the div.", metadata=background),
+            Document(page_content="Conclusion", metadata=conclusion),
+            Document(page_content="Final thoughts. Bye.", metadata=conclusion),
+        ]
+    else:
+        expected = [
+            Document(page_content="Introduction", metadata=intro),
+            Document(
+                page_content="Welcome to the introduction section.", metadata=intro
+            ),
+            Document(page_content="Background", metadata=background),
+            Document(page_content="First  \nSecond", metadata=background),
+            Document(page_content="Details", metadata=details),
+            Document(
+                page_content="Nested & scoped.  \nAfter the div.", metadata=background
+            ),
+            Document(page_content="Conclusion", metadata=conclusion),
+            Document(page_content="Final thoughts. Bye.", metadata=conclusion),
+        ]
+    assert docs == expected
+
+
+@pytest.mark.parametrize("buffer_size", [1, 65536])
+def test_html_header_text_splitter_lazy_omitted_head_end_tag(buffer_size: int) -> None:
+    """Test that the body is split when `</head>` is omitted."""
+    html_content = (
+        "<html><head><meta charset=utf-8><title>T</title>\n"
+        "<body><h1>A</h1><p>b</p></body></html>"
+    )
+    splitter = HTMLHeaderTextSplitter([("h1", "Header 1")])
+    docs = list(
+        splitter.lazy_split_text_from_file(
+            StringIO(html_content), buffer_size=buffer_size
+        )
+    )
+    assert docs == [
+        Document(page_content="A", metadata={"Header 1": "A"}),
+        Document(page_content="b", metadata={"Header 1": "A"}),
+    ]
+    assert docs == splitter.split_text(html_content)
+
+
+def test_html_header_text_splitter_lazy_is_incremental() -> None:
+    """Test that documents are yielded before the whole page is read."""
+    sections = (f"<h2>Section {i}</h2><p>Paragraph {i}.</p>" for i in range(10_000))
+    reads = 0
+
+    class _Reader:
+        def read(self, _: int) -> str:
+            nonlocal reads
+            reads += 1
+            return next(sections, "")
+
+    splitter = HTMLHeaderTextSplitter([("h2", "Header 2")])
+    docs = splitter.lazy_split_text_from_file(cast("Any", _Reader()))
+    assert next(docs) == Document(
+        page_content="Section 0", metadata={"Header 2": "Section 0"}
+    )
+    assert reads < 5
+    assert sum(1 for _ in docs) == 19_999
+
+
 @pytest.mark.parametrize(
     ("headers_to_split_on", "html_content", "expected_output", "test_case"),
     [